@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Create a synthetic vault for benchmarking.
+
+Usage:
+    generate-vault.py DIR COUNT [--seed 0] [--config-dir CONFIG_DIR]
+
+With --config-dir, a config.yaml pointing at the vault is written there, so
+any script can be run against it with TASK_MANAGEMENT_CONFIG_DIR=CONFIG_DIR.
+"""
+
+import argparse
+from datetime import date
+from pathlib import Path
+
+from synthetic_vault import generate_vault, write_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a synthetic task vault.")
+    parser.add_argument("directory", type=Path, help="vault directory (created if missing)")
+    parser.add_argument("count", type=int, help="number of files to create")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--config-dir", type=Path, help="also write a config.yaml here")
+    args = parser.parse_args()
+
+    if args.directory.exists() and any(args.directory.iterdir()):
+        parser.error(f"{args.directory} is not empty")
+
+    counts = generate_vault(args.directory, args.count, date.today(), args.seed)
+    print(f"Created {args.count} file(s) in {args.directory}:")
+    for folder, count in counts.items():
+        print(f"  - {folder}/: {count}")
+
+    if args.config_dir:
+        write_config(args.config_dir, args.directory.resolve())
+        print(f"\nConfig written to {args.config_dir / 'config.yaml'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Time every stage of the task scripts on synthetic vaults.
+
+Usage:
+    run-benchmarks.py [--sizes 1000,10000,100000] [--cache cold,warm]
+                      [--seed 0] [--workdir DIR] [--output results.json]
+
+For each size and cache mode a fresh vault is generated (see
+synthetic_vault.py) and the stages run in-process, in this order:
+clean-imports, index, normalize-dates, update-recurring, archive-tasks,
+today.md, this-week.md, next-week.md, status.json.
+
+cold: the index cache is deleted and the vault's pages are evicted from the
+      OS page cache (posix_fadvise DONTNEED after a sync) before the run.
+warm: the index cache and page cache are primed by indexing the vault once.
+
+Results are printed as JSON (or written to --output), so runs on different
+commits can be compared. Progress goes to stderr.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+CACHE_MODES = ("cold", "warm")
+
+
+def drop_page_cache(root):
+    """
+    Evict the files under root from the OS page cache.
+
+    Returns False where posix_fadvise isn't available (e.g. macOS), in
+    which case a 'cold' run only starts without the index cache.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    os.sync()
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            fd = os.open(os.path.join(dirpath, name), os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+    return True
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_case(vault, count, cache_mode, today, seed):
+    """Generate a vault, prepare the cache mode and time every stage."""
+    # Imported here: config must see TASK_MANAGEMENT_CONFIG_DIR first
+    from config import TASK_FOLDERS, load_config
+    from dates import get_week_dates
+    from fileio import write_if_changed
+    from index_cache import CACHE_FILENAME
+    from pipeline import run_pipeline, run_stage
+    from synthetic_vault import generate_vault
+    from task_index import TaskIndex
+    from triage import triage_imports
+    from views import render_next_week, render_status, render_this_week, render_today
+
+    shutil.rmtree(vault, ignore_errors=True)
+    files = generate_vault(vault, count, today, seed)
+
+    page_cache_dropped = False
+    if cache_mode == "warm":
+        TaskIndex.build(TASK_FOLDERS)
+    else:
+        (vault / CACHE_FILENAME).unlink(missing_ok=True)
+        page_cache_dropped = drop_page_cache(vault)
+
+    stages = [run_stage("clean-imports", triage_imports)]
+
+    index, pipeline_stages = run_pipeline(today)
+    stages.extend(pipeline_stages)
+
+    dates = get_week_dates(today)
+    tasks_root = load_config().tasks_root
+    for name, render in (("today.md", render_today), ("this-week.md", render_this_week),
+                         ("next-week.md", render_next_week), ("status.json", render_status)):
+        def generate(render=render, name=name):
+            return write_if_changed(tasks_root / name, render(index, dates)[0])
+        stages.append(run_stage(name, generate))
+
+    return {
+        "files": count,
+        "cache": cache_mode,
+        "page_cache_dropped": page_cache_dropped,
+        "folders": files,
+        "stages": {stage["name"]: round(stage["seconds"], 6) for stage in stages},
+        "total": round(sum(stage["seconds"] for stage in stages), 6),
+    }
+
+
+def parse_list(value, convert=str):
+    return [convert(item) for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the task scripts on synthetic vaults.")
+    parser.add_argument("--sizes", type=lambda v: parse_list(v, int), default=list(DEFAULT_SIZES),
+                        help="comma-separated vault sizes (default: 1000,10000,100000)")
+    parser.add_argument("--cache", type=parse_list, default=list(CACHE_MODES),
+                        help="comma-separated cache modes: cold, warm (default: both)")
+    parser.add_argument("--seed", type=int, default=0, help="vault generator seed (default: 0)")
+    parser.add_argument("--workdir", type=Path,
+                        help="where to build the vaults (default: a temporary directory)")
+    parser.add_argument("--output", type=Path, help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    unknown = set(args.cache) - set(CACHE_MODES)
+    if unknown:
+        parser.error(f"unknown cache mode(s): {', '.join(sorted(unknown))}")
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="task-bench-"))
+    vault = workdir.resolve() / "vault"
+    config_dir = workdir / "config"
+
+    from synthetic_vault import write_config
+    write_config(config_dir, vault)
+    os.environ["TASK_MANAGEMENT_CONFIG_DIR"] = str(config_dir)
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+    today = date.today()
+    results = []
+    try:
+        for count in args.sizes:
+            for cache_mode in args.cache:
+                print(f"{count} files, {cache_mode} cache...", file=sys.stderr, flush=True)
+                results.append(run_case(vault, count, cache_mode, today, args.seed))
+                print(f"  total {results[-1]['total'] * 1000:.1f} ms", file=sys.stderr)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "today": str(today),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Synthetic vault generator for the task-management benchmarks.
+
+Creates a vault with N files spread over tasks/, ideas/, bugs/ and
+import/, with a realistic mix of due dates around today, non-ISO dates,
+completed tasks, recurrence rules, tags, research tags and the odd large
+body. The output only depends on N, the seed and the reference date, so
+runs on different commits see the same vault.
+"""
+
+import random
+from datetime import timedelta
+from pathlib import Path
+
+import yaml
+
+FOLDERS = ("tasks", "ideas", "bugs", "import", "completed", "templates", "memories")
+
+# Share of files per folder (the rest go to tasks/)
+FOLDER_MIX = (("ideas", 0.15), ("bugs", 0.10), ("import", 0.05))
+
+TAGS = ("cliente", "urgente", "personal", "casa", "finanzas", "salud", "viaje", "equipo")
+RESEARCH_TAGS = ("research-review", "research-summary-needed")
+RECURRENCES = ("daily", "weekly", "biweekly", "monthly", "quarterly", "yearly")
+IDEA_STATUSES = ("in progress", "noodling", "someday", "done")
+IMPORT_TYPES = ("task", "idea", "bug", "memory", "template", None)
+
+PARAGRAPH = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam.\n\n"
+)
+
+
+def format_due(day, rng):
+    """Format a date, with ~10% of them in the non-ISO formats normalize fixes."""
+    r = rng.random()
+    if r < 0.05:
+        return f"{day.month}/{day.day}/{day.year}"
+    if r < 0.10:
+        return f"{day.year}-{day.month}-{day.day}"
+    return day.isoformat()
+
+
+def make_tags(rng, research_share):
+    tags = rng.sample(TAGS, rng.choice((0, 0, 1, 1, 2, 3)))
+    if rng.random() < research_share:
+        tags.append(rng.choice(RESEARCH_TAGS))
+    return tags
+
+
+def format_tags(tags, rng):
+    """Emit tags in either of the two styles found in real vaults."""
+    if not tags:
+        return []
+    if rng.random() < 0.5:
+        return [f"tags: [{', '.join(tags)}]"]
+    return ["tags:"] + [f"  - {tag}" for tag in tags]
+
+
+def make_body(title, rng):
+    """A short body, or (~2%) a large one with notes and history."""
+    body = f"# {title}\n\n"
+    if rng.random() < 0.02:
+        return body + PARAGRAPH * rng.randint(100, 400)
+    return body + PARAGRAPH * rng.randint(0, 3)
+
+
+def make_task(i, today, rng):
+    lines = ["type: task"]
+    due = today + timedelta(days=rng.randint(-60, 90))
+    if rng.random() < 0.9:
+        lines.append(f"due: {format_due(due, rng)}")
+    if rng.random() < 0.12:
+        lines.append(f"recurrence: {rng.choice(RECURRENCES)}")
+        if rng.random() < 0.3:
+            lines.append(f"recurrence_day: {rng.randint(1, 31)}")
+    if rng.random() < 0.08:
+        lines.append(f"completed: {format_due(today - timedelta(days=rng.randint(0, 5)), rng)}")
+    lines.extend(format_tags(make_tags(rng, 0.05), rng))
+    lines.append(f"created: {format_due(today - timedelta(days=rng.randint(0, 400)), rng)}")
+    return lines, make_body(f"Task {i}", rng)
+
+
+def make_idea(i, today, rng):
+    lines = ["type: idea", f"status: {rng.choice(IDEA_STATUSES)}"]
+    lines.extend(format_tags(make_tags(rng, 0.0), rng))
+    return lines, make_body(f"Idea {i}", rng)
+
+
+def make_bug(i, today, rng):
+    lines = ["type: bug"]
+    if rng.random() < 0.5:
+        lines.append(f"due: {format_due(today + timedelta(days=rng.randint(-30, 30)), rng)}")
+    lines.extend(format_tags(make_tags(rng, 0.0), rng))
+    return lines, make_body(f"Bug {i}", rng)
+
+
+def make_import(i, today, rng):
+    file_type = rng.choice(IMPORT_TYPES)
+    lines = [f"type: {file_type}"] if file_type else []
+    if file_type in ("task", "bug") and rng.random() < 0.7:
+        lines.append(f"due: {format_due(today + timedelta(days=rng.randint(-10, 30)), rng)}")
+    return lines, make_body(f"Import {i}", rng)
+
+
+MAKERS = {"tasks": make_task, "ideas": make_idea, "bugs": make_bug, "import": make_import}
+
+
+def pick_folder(rng):
+    r = rng.random()
+    for folder, share in FOLDER_MIX:
+        if r < share:
+            return folder
+        r -= share
+    return "tasks"
+
+
+def generate_vault(root, count, today, seed=0):
+    """
+    Create count files under root (which must not hold a vault already).
+
+    Returns {folder: number of files written}.
+    """
+    root = Path(root)
+    rng = random.Random(seed)
+    for folder in FOLDERS:
+        (root / folder).mkdir(parents=True, exist_ok=True)
+
+    counts = dict.fromkeys(MAKERS, 0)
+    for i in range(count):
+        folder = pick_folder(rng)
+        lines, body = MAKERS[folder](i, today, rng)
+        content = "---\n" + "".join(f"{line}\n" for line in lines) + "---\n" + body
+        (root / folder / f"{folder}-{i:06d}.md").write_text(content, encoding="utf-8")
+        counts[folder] += 1
+    return counts
+
+
+def write_config(config_dir, vault):
+    """Write a config.yaml for the vault (read via TASK_MANAGEMENT_CONFIG_DIR)."""
+    config_dir = Path(config_dir)
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config = {
+        "paths": {"tasks_root": str(vault)},
+        "folders": {folder: folder for folder in FOLDERS},
+        "links": {"format": "obsidian"},
+        "integrations": {"research_system": True},
+    }
+    with open(config_dir / "config.yaml", "w") as f:
+        yaml.safe_dump(config, f, sort_keys=False)
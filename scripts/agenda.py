@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Date-range agenda engine for task-management plugin.
+
+Groups the tasks due in any date range by day in a single pass over the
+index's sorted due dates, optionally projecting recurring tasks onto their
+future occurrences, and renders the day sections shared by every view.
+"""
+
+from collections import defaultdict
+
+import i18n
+from config import format_link
+from recurring import occurrences
+
+
+def format_date_header(date):
+    """Format date as 'Lunes, 12 de enero' in the configured language."""
+    return i18n.format_date_header(date, i18n.get_language())
+
+
+def format_date_range(start, end):
+    """Format a date range as 'del 5 al 11 de enero' in the configured language."""
+    return i18n.format_week_range(start, end, i18n.get_language())
+
+
+def label(key, **values):
+    """Return a view label in the configured language."""
+    return i18n.label(key, i18n.get_language(), **values)
+
+
+def collect_days(index, start, end, expand_recurring=False, folder="tasks"):
+    """
+    Group the tasks due from start to end (dates, inclusive) by day.
+
+    Research tasks are left out. With expand_recurring, recurring tasks
+    also appear on each of their future occurrences inside the range,
+    flagged as projected.
+
+    Returns [(day, [(task, projected), ...]), ...] for the days that have
+    tasks, in date order; tasks within a day are sorted by filename.
+    """
+    buckets = defaultdict(list)
+    for task in index.due_between(start.isoformat(), end.isoformat(), folder):
+        if not task.is_research:
+            buckets[task.due_date].append((task, False))
+
+    if expand_recurring:
+        for task in index.recurring(folder):
+            if task.is_research or task.due_date is None:
+                continue
+            recurrence_day = task.recurrence_day if (task.recurrence_day or "").isdigit() else None
+            for day in occurrences(task.due, task.recurrence.lower(), recurrence_day, start, end):
+                buckets[day].append((task, True))
+
+    return [
+        (day, sorted(buckets[day], key=lambda entry: entry[0].path))
+        for day in sorted(buckets)
+    ]
+
+
+def render_days(days, folder="tasks"):
+    """
+    Render collect_days() output as '## <day>' sections of task links.
+
+    Returns (content, number of task lines).
+    """
+    content = ""
+    total = 0
+    for day, entries in days:
+        content += f"## {format_date_header(day)}\n"
+        for task, projected in entries:
+            suffix = f" {label('projected')}" if projected else ""
+            content += f"- [ ] {format_link(task.name, folder)}{suffix}\n"
+        content += "\n"
+        total += len(entries)
+    return content, total
+
+
+def get_overdue_tasks(index, today):
+    """Get all overdue tasks (due before today), excluding research tasks."""
+    return [(t.name, t.due) for t in index.overdue(today) if not t.is_research]
+
+
+def render_overdue(overdue):
+    """Render the overdue section for get_overdue_tasks() output ('' if empty)."""
+    if not overdue:
+        return ""
+    content = f"## {label('overdue')}\n"
+    for filename, due_date in overdue:
+        content += f"- [ ] {format_link(filename, 'tasks')} (due: {due_date})\n"
+    return content + "\n"
+
+
+def render_agenda(index, start, end, expand_recurring=False, today=None):
+    """
+    Render a standalone agenda for any date range.
+
+    If today is given (YYYY-MM-DD), tasks overdue at that date are listed
+    first. Returns (content, number of task lines in the day sections).
+    """
+    content = f"---\nrange_start: {start}\nrange_end: {end}\n---\n"
+    content += f"# {label('agenda')} - {format_date_range(start, end)}\n\n"
+    if today:
+        content += render_overdue(get_overdue_tasks(index, today))
+
+    days_content, total = render_days(collect_days(index, start, end, expand_recurring))
+    content += days_content or f"{label('no_tasks_in_range')}\n"
+    return content, total
@@ -3,84 +3,96 @@
 Archive completed one-time tasks from tasks/ to completed/.
 
 Recurring tasks (those with recurrence: field) are never archived.
-"""
 
-import subprocess
-from pathlib import Path
+Usage:
+    archive-tasks.py                                  archive completed tasks
+    archive-tasks.py --history [--from D] [--to D] [--tag T] [--json]
+                                                      list archived tasks
+    archive-tasks.py --migrate [--dry-run]            shard a flat completed/
 
-from config import get_tasks_root, get_folder
+Add --stats or --stats-json for per-stage time and I/O counters, and
+--profile to save a cProfile profile (see profiling.py).
+"""
 
+import argparse
+import json
+from datetime import datetime
 
-def run_command(cmd):
-    """Run a shell command and return output."""
-    result = subprocess.run(
-        cmd,
-        shell=True,
-        cwd=get_tasks_root(),
-        capture_output=True,
-        text=True
-    )
-    return result.stdout.strip(), result.stderr.strip(), result.returncode
+import metrics
+import profiling
+from archive import archive_completed_tasks, migrate_flat_archive, print_report, query_history
+from task_index import TaskIndex
 
 
-def archive_completed_tasks():
-    """Archive completed one-time tasks to completed/ folder."""
-    tasks_dir = get_folder("tasks")
-    completed_dir = get_folder("completed")
+def parse_day(value):
+    """argparse type for YYYY-MM-DD dates (returned as the same string)."""
+    try:
+        datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+    return value
 
-    # Grep for files with completed: field
-    stdout, stderr, code = run_command(
-        f"grep -il '^completed:' {tasks_dir}/*.md 2>/dev/null || true"
-    )
 
-    if not stdout:
-        print("No completed tasks to archive.")
+def print_history(entries, as_json=False):
+    """Print manifest entries returned by query_history()."""
+    if as_json:
+        print(json.dumps(entries, ensure_ascii=False, indent=2))
         return
+    if not entries:
+        print("No archived tasks in this period.")
+        return
+    for entry in entries:
+        tags = f"  [{', '.join(entry.get('tags', []))}]" if entry.get('tags') else ""
+        print(f"{entry.get('completed') or '----------'}  completed/{entry['path']}{tags}")
+    print(f"\n{len(entries)} archived task(s)")
 
-    completed_files = stdout.split('\n')
-    archived = []
-    skipped = []
-
-    for file_path in completed_files:
-        if not file_path:
-            continue
-
-        # Check if it has recurrence field (recurring tasks don't get archived)
-        check_cmd = f"grep -q '^recurrence:' '{file_path}'"
-        _, _, has_recurrence = run_command(check_cmd)
-
-        if has_recurrence == 0:  # grep found recurrence field
-            filename = Path(file_path).name
-            skipped.append(filename)
-            continue
-
-        # Move to completed/
-        filename = Path(file_path).name
-        run_command(f"mv '{file_path}' '{completed_dir}/'")
-        archived.append(filename)
-
-    # Report results
-    if archived:
-        print(f"Archived {len(archived)} completed task(s):\n")
-        print("Moved to completed/:")
-        for f in archived:
-            print(f"  - {f}")
-
-    if skipped:
-        print(f"\nSkipped {len(skipped)} recurring task(s):")
-        for f in skipped:
-            print(f"  - {f} (has recurrence field, stays in tasks/)")
 
-    if archived:
-        print("\nTasks folder is now clean!")
-    elif not skipped:
-        print("No completed tasks to archive.")
+def print_migration(moves, dry_run=False):
+    """Print the result of migrate_flat_archive()."""
+    if not moves:
+        print("No flat archive files to migrate.")
+        return
+    verb = "Would move" if dry_run else "Moved"
+    print(f"{verb} {len(moves)} file(s):")
+    for item in moves:
+        print(f"  - {item['file']} → completed/{item['dest']}")
 
 
 def main():
-    print("=== Archiving Completed Tasks ===\n")
-    archive_completed_tasks()
+    parser = argparse.ArgumentParser(description="Archive completed one-time tasks.")
+    parser.add_argument("--history", action="store_true",
+                        help="list archived tasks from the manifest instead of archiving")
+    parser.add_argument("--from", dest="start", type=parse_day,
+                        help="with --history, first completed date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", type=parse_day,
+                        help="with --history, last completed date (YYYY-MM-DD), inclusive")
+    parser.add_argument("--tag", help="with --history, only tasks with this tag")
+    parser.add_argument("--json", action="store_true", help="with --history, print JSON")
+    parser.add_argument("--migrate", action="store_true",
+                        help="move files at the top of completed/ into YYYY/MM folders")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="with --migrate, list the planned moves without moving anything")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.history and args.migrate:
+        parser.error("--history and --migrate can't be combined")
+
+    if args.history:
+        stages = [metrics.run_stage("history", query_history, args.start, args.end, args.tag)]
+        print_history(stages[0]['result'], args.json)
+    elif args.migrate:
+        print("=== Migrating Archive to completed/YYYY/MM ===\n")
+        stages = [metrics.run_stage("migrate-archive", migrate_flat_archive, args.dry_run)]
+        print_migration(stages[0]['result'], args.dry_run)
+    else:
+        print("=== Archiving Completed Tasks ===\n")
+        stages = [metrics.run_stage("index", TaskIndex.build, ("tasks",))]
+        stages.append(metrics.run_stage("archive-tasks", archive_completed_tasks, stages[0]['result']))
+        print_report(stages[-1]['result'])
+
+    metrics.report("archive-tasks", stages, args)
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run("archive-tasks", main)
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Archive stage for task-management plugin.
+
+Moves completed one-time tasks from tasks/ to completed/. Recurring tasks
+(those with recurrence: field) are never archived.
+
+With the default 'sharded' layout, tasks are filed under
+completed/YYYY/MM/ by their completed: date. Every archived task is also
+appended to completed/.manifest.jsonl (filename, completed date, tags,
+original path, archive date), so history queries never have to open the archive.
+
+Files are moved with os.rename, one batch per directory pair, so no
+subprocess is spawned and filenames are never passed through a shell.
+"""
+
+import errno
+import json
+import os
+import shutil
+from collections import defaultdict
+from datetime import date, datetime
+
+from config import get_tasks_root, load_config
+from frontmatter import read_frontmatter
+from metrics import count
+from task_index import parse_frontmatter_fields
+
+MANIFEST_FILENAME = ".manifest.jsonl"
+
+
+def _exists(name, dir_fd, directory):
+    """Return True if name exists in the directory (dir_fd may be None)."""
+    try:
+        if dir_fd is not None:
+            os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+        else:
+            os.lstat(os.path.join(directory, name))
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def unique_name(name, is_taken):
+    """
+    Return name, or the first free 'stem-N.ext' variant (N = 1, 2, ...).
+
+    is_taken(candidate) tells whether a candidate is already used, so the
+    result only depends on what is in the destination.
+    """
+    if not is_taken(name):
+        return name
+    stem, ext = os.path.splitext(name)
+    n = 1
+    while is_taken(f"{stem}-{n}{ext}"):
+        n += 1
+    return f"{stem}-{n}{ext}"
+
+
+def plan_batch(names, dest_dir):
+    """
+    Return the (name, dest_name) pairs move_batch() would produce for
+    names in dest_dir, without moving anything (for dry runs).
+    """
+    taken = set()
+
+    def is_taken(candidate):
+        return candidate in taken or _exists(candidate, None, dest_dir)
+
+    planned = []
+    for name in names:
+        dest_name = unique_name(name, is_taken)
+        taken.add(dest_name)
+        planned.append((name, dest_name))
+    return planned
+
+
+def move_batch(src_dir, names, dest_dir, moved=None):
+    """
+    Move the files called names from src_dir into dest_dir.
+
+    Both directories are opened once and every file is renamed relative to
+    them. Name collisions in dest_dir get a numeric suffix (see
+    unique_name). Returns a list of (name, dest_name) pairs; if a list is
+    passed as moved, the pairs are appended to it as the files move, so a
+    caller still knows what was moved when a rename fails midway.
+    """
+    use_fds = os.rename in os.supports_dir_fd
+    src_fd = os.open(src_dir, os.O_RDONLY) if use_fds else None
+    dest_fd = os.open(dest_dir, os.O_RDONLY) if use_fds else None
+
+    taken = set()
+
+    def is_taken(candidate):
+        return candidate in taken or _exists(candidate, dest_fd, dest_dir)
+
+    if moved is None:
+        moved = []
+    try:
+        for name in names:
+            dest_name = unique_name(name, is_taken)
+            taken.add(dest_name)
+            try:
+                if use_fds:
+                    os.rename(name, dest_name, src_dir_fd=src_fd, dst_dir_fd=dest_fd)
+                else:
+                    os.rename(os.path.join(src_dir, name), os.path.join(dest_dir, dest_name))
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # completed/ lives on another filesystem
+                shutil.move(os.path.join(src_dir, name), os.path.join(dest_dir, dest_name))
+            count("files_moved")
+            moved.append((name, dest_name))
+    finally:
+        if use_fds:
+            os.close(src_fd)
+            os.close(dest_fd)
+    return moved
+
+
+def parse_completed(value):
+    """Return a completed: value as a date, or None if it isn't YYYY-MM-DD."""
+    try:
+        return datetime.strptime((value or "").strip(), '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def shard_for(completed, layout, today=None):
+    """
+    Return the subfolder of completed/ for a task ('' in the flat layout).
+
+    Tasks without a valid completed date are filed under the archive date.
+    """
+    if layout != "sharded":
+        return ""
+    day = completed or today or date.today()
+    return f"{day.year:04d}/{day.month:02d}"
+
+
+def append_manifest(completed_dir, entries):
+    """Append archive entries to the manifest in a single write."""
+    if not entries:
+        return
+    lines = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+    with open(completed_dir / MANIFEST_FILENAME, 'a', encoding='utf-8') as f:
+        f.write(lines)
+    count("files_written")
+
+
+def read_manifest(completed_dir):
+    """Yield the manifest entries, oldest first (skipping damaged lines)."""
+    try:
+        f = open(completed_dir / MANIFEST_FILENAME, encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def move_grouped(moves, completed_dir, manifest_entry):
+    """
+    Move files into completed/, one batch per (source, shard) pair.
+
+    moves maps (src_dir, shard) to a list of items whose 'name' is the
+    file to move; each item gets its destination path relative to
+    completed/ as 'dest'. The manifest_entry(item) of every moved file is
+    appended to the manifest right after its batch, including the files a
+    failing batch moved before the error, so the manifest never misses an
+    archived file. Returns the items, in batch order.
+    """
+    done = []
+    for (src_dir, shard), items in sorted(moves.items()):
+        dest_dir = completed_dir / shard if shard else completed_dir
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        moved = []
+        try:
+            move_batch(src_dir, [item['name'] for item in items], dest_dir, moved)
+        finally:
+            batch = items[:len(moved)]
+            for item, (_, dest_name) in zip(batch, moved):
+                item['dest'] = f"{shard}/{dest_name}" if shard else dest_name
+            append_manifest(completed_dir, [manifest_entry(item) for item in batch])
+            done.extend(batch)
+    return done
+
+
+def archive_completed_tasks(index, today=None):
+    """
+    Archive completed one-time tasks to completed/ folder.
+
+    Completed and recurrence status come from the index; archived files are
+    removed from it and recorded in the manifest. Returns a dict with:
+        archived: list of {'file', 'dest'} dicts; dest is the path relative
+                  to completed/ (shard and any collision suffix included)
+        skipped:  filenames of completed recurring tasks (left in tasks/)
+    """
+    config = load_config()
+    completed_dir = config.folder("completed")
+    tasks_root = config.tasks_root
+
+    moves = defaultdict(list)  # (source directory, shard) -> items
+    skipped = []
+
+    for task in index.in_folder("tasks"):
+        if task.completed is None:
+            continue
+
+        # Recurring tasks don't get archived
+        if task.recurrence is not None:
+            skipped.append(task.path.name)
+            continue
+
+        completed = parse_completed(task.completed)
+        shard = shard_for(completed, config.archive_layout, today)
+        moves[(task.path.parent, shard)].append({'name': task.path.name, 'task': task,
+                                                 'completed': completed})
+
+    archived_at = str(today or date.today())
+
+    def manifest_entry(item):
+        task = item['task']
+        return {
+            'file': item['name'],
+            'path': item['dest'],
+            'completed': str(item['completed']) if item['completed'] else None,
+            'tags': list(task.tags),
+            'original': os.path.relpath(task.path, tasks_root),
+            'archived_at': archived_at,
+        }
+
+    archived = []
+    for item in move_grouped(moves, completed_dir, manifest_entry):
+        index.remove(item['task'].path)
+        archived.append({'file': item['name'], 'dest': item['dest']})
+
+    return {'archived': archived, 'skipped': skipped}
+
+
+def migrate_flat_archive(dry_run=False):
+    """
+    Move the .md files sitting directly in completed/ into YYYY/MM shards.
+
+    The shard comes from each file's completed: date, or its modification
+    date if it has none. Migrated files are added to the manifest. Returns
+    a list of {'file', 'dest'} dicts (planned moves with dry_run).
+    """
+    completed_dir = load_config().folder("completed")
+    if not completed_dir.exists():
+        return []
+
+    moves = defaultdict(list)
+    with os.scandir(completed_dir) as entries:
+        for entry in entries:
+            if not (entry.name.endswith('.md') and entry.is_file()):
+                continue
+            count("files_scanned")
+            lines, _ = read_frontmatter(entry.path)
+            fields, tags, _ = parse_frontmatter_fields(lines or ())
+            completed = parse_completed(fields.get('completed'))
+            fallback = date.fromtimestamp(entry.stat().st_mtime)
+            moves[(completed_dir, shard_for(completed, "sharded", fallback))].append(
+                {'name': entry.name, 'completed': completed, 'tags': tags})
+
+    for items in moves.values():
+        items.sort(key=lambda item: item['name'])
+
+    if dry_run:
+        return [
+            {'file': name, 'dest': f"{shard}/{dest_name}"}
+            for (_, shard), items in sorted(moves.items())
+            for name, dest_name in plan_batch([item['name'] for item in items], completed_dir / shard)
+        ]
+
+    archived_at = str(date.today())
+    tasks_root = get_tasks_root()
+
+    def manifest_entry(item):
+        return {
+            'file': item['name'],
+            'path': item['dest'],
+            'completed': str(item['completed']) if item['completed'] else None,
+            'tags': item['tags'],
+            'original': os.path.relpath(completed_dir / item['name'], tasks_root),
+            'archived_at': archived_at,
+        }
+
+    migrated = move_grouped(moves, completed_dir, manifest_entry)
+    return [{'file': item['name'], 'dest': item['dest']} for item in migrated]
+
+
+def query_history(start=None, end=None, tag=None):
+    """
+    Return manifest entries completed between start and end (inclusive
+    YYYY-MM-DD strings, either may be None), optionally with a tag.
+
+    Answered from the manifest alone; no archived file is opened.
+    """
+    results = []
+    for entry in read_manifest(load_config().folder("completed")):
+        completed = entry.get('completed')
+        if (start or end) and not completed:
+            continue
+        if start and completed < start:
+            continue
+        if end and completed > end:
+            continue
+        if tag and tag not in entry.get('tags', ()):
+            continue
+        results.append(entry)
+    return results
+
+
+def print_report(result):
+    """Print the result of archive_completed_tasks()."""
+    archived = result['archived']
+    skipped = result['skipped']
+
+    if archived:
+        print(f"Archived {len(archived)} completed task(s):\n")
+        print("Moved to completed/:")
+        for item in archived:
+            if item['dest'] != item['file']:
+                print(f"  - {item['file']} → completed/{item['dest']}")
+            else:
+                print(f"  - {item['file']}")
+
+    if skipped:
+        print(f"\nSkipped {len(skipped)} recurring task(s):")
+        for f in skipped:
+            print(f"  - {f} (has recurrence field, stays in tasks/)")
+
+    if archived:
+        print("\nTasks folder is now clean!")
+    elif not skipped:
+        print("No completed tasks to archive.")
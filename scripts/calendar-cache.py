@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Manage the local calendar event cache used by render-google-tasks.py.
+
+Usage:
+    calendar-cache.py [--today YYYY-MM-DD] stale [--json]
+    calendar-cache.py [--today YYYY-MM-DD] store FILE --from YYYY-MM-DD --to YYYY-MM-DD
+    calendar-cache.py [--today YYYY-MM-DD] sync FILE
+    calendar-cache.py [--today YYYY-MM-DD] show
+    calendar-cache.py clear
+
+stale lists the day ranges, from today to the end of next week, that are
+missing from the cache or older than calendar.cache_ttl_minutes: only
+those need a get_events call, with time_min and time_max as RFC3339
+timestamps at local midnight. store saves a full get_events response for
+a range (both days inclusive); sync merges an incremental response
+fetched with the saved sync token. FILE may be '-' for stdin.
+"""
+
+import argparse
+import json
+import sys
+from datetime import date, datetime, time, timedelta
+
+from calendar_cache import (CACHE_FILE, empty_cache, events_by_day, load_cache, merge_changes,
+                            save_cache, stale_ranges, store_events)
+from config import load_config
+from dates import get_week_dates
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+
+
+def read_response(path):
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cache_window(today):
+    """The days the views show: today to the end of next week."""
+    return today, date.fromisoformat(get_week_dates(today)['next_week_end'])
+
+
+def local_midnight(day):
+    """RFC3339 timestamp of the start of day in the local timezone."""
+    return datetime.combine(day, time.min).astimezone().isoformat()
+
+
+def print_stale(cache, today, as_json):
+    ttl = timedelta(minutes=load_config().calendar_cache_ttl)
+    ranges = stale_ranges(cache, *cache_window(today), ttl)
+    if as_json:
+        json.dump({
+            'ranges': [{'from': str(first), 'to': str(last),
+                        'time_min': local_midnight(first),
+                        'time_max': local_midnight(last + timedelta(days=1))}
+                       for first, last in ranges],
+            'sync_token': cache['sync_token'],
+        }, sys.stdout, indent=2)
+        print()
+        return
+    if not ranges:
+        print("Calendar cache is up to date.")
+    for first, last in ranges:
+        print(f"Fetch {first} to {last} (time_min {local_midnight(first)}, "
+              f"time_max {local_midnight(last + timedelta(days=1))})")
+    if cache['sync_token']:
+        print(f"Sync token: {cache['sync_token']}")
+
+
+def print_cache(cache, today):
+    days = events_by_day(cache, *cache_window(today))
+    if not days:
+        print("No cached events.")
+    for day, lines in sorted(days.items()):
+        print(day)
+        for line in lines:
+            print(f"  {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local calendar event cache.")
+    parser.add_argument("--today", type=parse_date, default=datetime.now().date(),
+                        help="reference day (default: today)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stale = commands.add_parser("stale", help="list the day ranges that need fetching")
+    stale.add_argument("--json", action="store_true", help="print the ranges as JSON")
+
+    store = commands.add_parser("store", help="save a full get_events response for a range")
+    store.add_argument("file", help="get_events JSON ('-' for stdin)")
+    store.add_argument("--from", dest="start", type=parse_date, required=True)
+    store.add_argument("--to", dest="end", type=parse_date, required=True)
+
+    sync = commands.add_parser("sync", help="merge an incremental get_events response")
+    sync.add_argument("file", help="get_events JSON ('-' for stdin)")
+
+    commands.add_parser("show", help="print the cached events")
+    commands.add_parser("clear", help="empty the cache")
+    args = parser.parse_args()
+
+    cache = load_cache()
+    try:
+        if args.command == "stale":
+            print_stale(cache, args.today, args.json)
+            return
+        if args.command == "show":
+            print_cache(cache, args.today)
+            return
+        if args.command == "store":
+            if args.end < args.start:
+                parser.error("--to is before --from")
+            stored = store_events(cache, read_response(args.file), args.start, args.end)
+            print(f"Stored {stored} event(s) for {args.start} to {args.end}")
+        elif args.command == "sync":
+            changed, cancelled = merge_changes(cache, read_response(args.file))
+            print(f"Merged {changed} changed and {cancelled} cancelled event(s)")
+        elif args.command == "clear":
+            cache = empty_cache()
+            print("Calendar cache cleared.")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    save_cache(cache, args.today)
+    print(f"Cache: {CACHE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
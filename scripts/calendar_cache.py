@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Local calendar event cache for task-management plugin.
+
+Events fetched from Google Calendar are kept in calendar-cache.json next to
+config.yaml, in one bucket per day. Each bucket remembers when it was
+fetched, so a run only asks the calendar for the days that are missing or
+older than calendar.cache_ttl_minutes (see stale_ranges). A response that
+carries a nextSyncToken is remembered too, and a later incremental
+response (only changed and cancelled events) is merged by event id instead
+of replacing whole days.
+
+Responses use the Calendar API shape: a list of events or an object with
+an 'items' list, each event with id, summary, status and start/end as
+{'dateTime': ...} or {'date': ...} (all-day, end exclusive).
+"""
+
+import json
+import sys
+from datetime import date, datetime, timedelta
+
+from config import CONFIG_DIR
+from fileio import write_if_changed
+
+CACHE_FILE = CONFIG_DIR / "calendar-cache.json"
+
+# Bump when the cache layout changes; older caches are discarded
+CACHE_VERSION = 1
+
+ALL_DAY_MARK = "📌"
+
+
+def empty_cache():
+    return {'version': CACHE_VERSION, 'sync_token': None, 'days': {}}
+
+
+def load_cache(path=CACHE_FILE):
+    """Return the cache, or an empty one if it is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return empty_cache()
+    except (OSError, ValueError) as e:
+        print(f"Warning: calendar cache unreadable, starting over ({e})", file=sys.stderr)
+        return empty_cache()
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return empty_cache()
+    return cache
+
+
+def save_cache(cache, today, path=CACHE_FILE):
+    """Write the cache, dropping the buckets of days before today."""
+    cache['days'] = {day: bucket for day, bucket in sorted(cache['days'].items())
+                     if day >= str(today)}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return write_if_changed(path, json.dumps(cache, ensure_ascii=False, indent=1) + "\n")
+
+
+def response_items(response):
+    """Return the events of a get_events response (a list or {'items': [...]})."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict) and isinstance(response.get('items'), list):
+        return response['items']
+    raise ValueError("unrecognized calendar response (expected a list or an object with 'items')")
+
+
+def _when(value):
+    """Return (date string, 'HH:MM' or None) of an event start/end value."""
+    if isinstance(value, dict):
+        value = value.get('dateTime') or value.get('date')
+    if not value:
+        return None, None
+    # Times are shown as written, in the calendar's own timezone
+    return value[:10], value[11:16] if len(value) > 10 else None
+
+
+def parse_event(item):
+    """
+    Return a cached event dict (id, summary, day, start, end, last_day)
+    from a Calendar API event. start/end are 'HH:MM', or None for all-day
+    events, which span day to last_day inclusive. Returns None for events
+    without a start.
+    """
+    day, start = _when(item.get('start'))
+    if day is None:
+        return None
+    end_day, end = _when(item.get('end'))
+    last_day = day
+    if start is None and end_day and end_day > day:
+        # All-day end dates are exclusive
+        last_day = str(date.fromisoformat(end_day) - timedelta(days=1))
+    return {
+        'id': item.get('id'),
+        'summary': (item.get('summary') or "").strip() or "(sin título)",
+        'day': day,
+        'start': start,
+        'end': end if start is not None else None,
+        'last_day': last_day,
+    }
+
+
+def event_days(event):
+    """The days (YYYY-MM-DD) an event is shown on."""
+    day = date.fromisoformat(event['day'])
+    last_day = date.fromisoformat(event['last_day'])
+    while day <= last_day:
+        yield str(day)
+        day += timedelta(days=1)
+
+
+def day_range(start, end):
+    """The days from start to end (dates), inclusive, as strings."""
+    return [str(start + timedelta(days=n)) for n in range((end - start).days + 1)]
+
+
+def store_events(cache, response, start, end, now=None):
+    """
+    Replace the buckets from start to end (dates) with a full response.
+
+    Every day in the range is marked as fetched, including days without
+    events. Returns the number of events stored.
+    """
+    fetched_at = (now or datetime.now()).isoformat(timespec="seconds")
+    days = day_range(start, end)
+    buckets = {day: {'fetched_at': fetched_at, 'events': []} for day in days}
+    stored = 0
+    for item in response_items(response):
+        if item.get('status') == 'cancelled':
+            continue
+        event = parse_event(item)
+        if event is None:
+            continue
+        for day in event_days(event):
+            if day in buckets:
+                buckets[day]['events'].append(event)
+                stored += 1
+    cache['days'].update(buckets)
+    _remember_sync_token(cache, response)
+    return stored
+
+
+def merge_changes(cache, response, now=None):
+    """
+    Apply an incremental (sync token) response: changed events replace
+    their cached copies by id and cancelled ones are removed. Only days
+    that are already cached are touched; they are all marked as fetched,
+    since the response brings the whole calendar up to date.
+    Returns (changed, cancelled) event counts.
+    """
+    fetched_at = (now or datetime.now()).isoformat(timespec="seconds")
+    changes = [item for item in response_items(response) if item.get('id')]
+    changed_ids = {item['id'] for item in changes}
+
+    for bucket in cache['days'].values():
+        bucket['events'] = [event for event in bucket['events'] if event.get('id') not in changed_ids]
+        bucket['fetched_at'] = fetched_at
+
+    cancelled = 0
+    for item in changes:
+        event = None if item.get('status') == 'cancelled' else parse_event(item)
+        if event is None:
+            cancelled += 1
+            continue
+        for day in event_days(event):
+            bucket = cache['days'].get(day)
+            if bucket is not None:
+                bucket['events'].append(event)
+    _remember_sync_token(cache, response)
+    return len(changes) - cancelled, cancelled
+
+
+def _remember_sync_token(cache, response):
+    if isinstance(response, dict) and response.get('nextSyncToken'):
+        cache['sync_token'] = response['nextSyncToken']
+
+
+def is_fresh(bucket, now, ttl):
+    """True if a bucket was fetched less than ttl (a timedelta) ago."""
+    if not bucket:
+        return False
+    try:
+        return now - datetime.fromisoformat(bucket['fetched_at']) < ttl
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def stale_ranges(cache, start, end, ttl, now=None):
+    """
+    Return the runs of consecutive days from start to end (dates) that
+    are missing from the cache or expired, as (first, last) date pairs.
+    """
+    now = now or datetime.now()
+    ranges = []
+    for day in day_range(start, end):
+        if is_fresh(cache['days'].get(day), now, ttl):
+            continue
+        current = date.fromisoformat(day)
+        if ranges and ranges[-1][1] == current - timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], current)
+        else:
+            ranges.append((current, current))
+    return ranges
+
+
+def event_sort_key(event):
+    # All-day events first, then by start time
+    return (event['start'] is not None, event['start'] or "", event['end'] or "", event['summary'])
+
+
+def format_event(event):
+    """Format an event as '- HH:MM-HH:MM - Name' or '- 📌 Name' (all-day)."""
+    if event['start'] is None:
+        return f"- {ALL_DAY_MARK} {event['summary']}"
+    if event['end'] and event['end'] != event['start']:
+        return f"- {event['start']}-{event['end']} - {event['summary']}"
+    return f"- {event['start']} - {event['summary']}"
+
+
+def events_by_day(cache, start, end):
+    """Return {date: [formatted event lines]} for the cached days from start to end."""
+    result = {}
+    for day in day_range(start, end):
+        bucket = cache['days'].get(day)
+        if bucket and bucket['events']:
+            events = sorted(bucket['events'], key=event_sort_key)
+            result[date.fromisoformat(day)] = [format_event(event) for event in events]
+    return result
@@ -2,56 +2,194 @@
 """
 Configuration loading utility for task-management plugin.
 
-Loads config from ~/.claude/task-management-config/config.yaml
+Loads config from ~/.claude/task-management-config/config.yaml, or from
+$TASK_MANAGEMENT_CONFIG_DIR/config.yaml if that variable is set (used by
+the benchmarks to point the scripts at a synthetic vault).
+
+The file is parsed once per process into an immutable Config object and
+only re-read when its mtime changes.
 """
 
+import os
 import yaml
 from pathlib import Path
+from types import MappingProxyType
 
-CONFIG_DIR = Path.home() / ".claude" / "task-management-config"
+CONFIG_DIR = Path(os.environ.get("TASK_MANAGEMENT_CONFIG_DIR")
+                  or Path.home() / ".claude" / "task-management-config")
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Folders that may contain task files
+TASK_FOLDERS = ("tasks", "ideas", "bugs", "import")
 
-def get_config():
-    """Load and return the configuration dictionary."""
-    if not CONFIG_FILE.exists():
+# Defaults for the performance: section
+DEFAULT_SCAN_WORKERS = 8
+DEFAULT_PARALLEL_THRESHOLD = 2000
+
+# Default for calendar.cache_ttl_minutes
+DEFAULT_CALENDAR_TTL_MINUTES = 60
+
+# (mtime_ns, Config) of the last load
+_cache = None
+
+
+def _freeze(value):
+    """Return a read-only copy of parsed YAML (dicts and lists, recursively)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class Config:
+    """Immutable, typed view of config.yaml."""
+
+    __slots__ = ("_data", "_tasks_root", "_folders")
+
+    def __init__(self, data):
+        data = data or {}
+        self._data = _freeze(data)
+        self._tasks_root = Path(data["paths"]["tasks_root"])
+        self._folders = dict(data.get("folders") or {})
+
+    @property
+    def data(self):
+        """The raw configuration as a read-only mapping."""
+        return self._data
+
+    @property
+    def tasks_root(self):
+        """The tasks root directory."""
+        return self._tasks_root
+
+    def folder(self, name):
+        """Return the path to a specific folder within tasks root."""
+        return self._tasks_root / self._folders.get(name, name)
+
+    @property
+    def task_dirs(self):
+        """Directories that may contain task files."""
+        return [self.folder(name) for name in TASK_FOLDERS]
+
+    @property
+    def language(self):
+        """Language of generated views: 'es' (default) or 'en'."""
+        return self._data.get("language", "es")
+
+    @property
+    def link_format(self):
+        """The link format: 'obsidian' or 'markdown'."""
+        return (self._data.get("links") or {}).get("format", "obsidian")
+
+    @property
+    def archive_layout(self):
+        """Layout of completed/: 'sharded' (YYYY/MM subfolders) or 'flat'."""
+        return (self._data.get("archive") or {}).get("layout", "sharded")
+
+    @property
+    def google_task_lists(self):
+        """Google Tasks lists as dicts with id, name and area (google_tasks.lists)."""
+        return (self._data.get("google_tasks") or {}).get("lists") or ()
+
+    def _calendar(self, name, default):
+        return (self._data.get("calendar") or {}).get(name, default)
+
+    @property
+    def calendar_enabled(self):
+        """True if calendar events are added to the views (calendar.enabled)."""
+        return bool(self._calendar("enabled", False))
+
+    @property
+    def calendar_cache_ttl(self):
+        """Minutes a cached day of calendar events stays fresh."""
+        return max(0, int(self._calendar("cache_ttl_minutes", DEFAULT_CALENDAR_TTL_MINUTES)))
+
+    def integration(self, name, default=False):
+        """Return the value of an integrations: entry."""
+        return (self._data.get("integrations") or {}).get(name, default)
+
+    def transcription(self, name, default=None):
+        """Return the value of a transcription: entry."""
+        return (self._data.get("transcription") or {}).get(name, default)
+
+    @property
+    def research_system_enabled(self):
+        """True if research-system integration is enabled."""
+        return bool(self.integration("research_system"))
+
+    def _performance(self, name, default):
+        return (self._data.get("performance") or {}).get(name, default)
+
+    @property
+    def scan_workers(self):
+        """Number of workers used to scan the vault (1 = serial)."""
+        return max(1, int(self._performance("scan_workers", DEFAULT_SCAN_WORKERS)))
+
+    @property
+    def scan_processes(self):
+        """True to parse headers in worker processes instead of threads."""
+        return bool(self._performance("scan_processes", False))
+
+    @property
+    def parallel_threshold(self):
+        """Vaults with fewer files than this are scanned serially."""
+        return int(self._performance("parallel_threshold", DEFAULT_PARALLEL_THRESHOLD))
+
+
+def load_config():
+    """Return the Config for this process, re-reading the file if it changed."""
+    global _cache
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration not found at {CONFIG_FILE}\n"
             "Run /task-management:setup to configure the plugin."
-        )
-    with open(CONFIG_FILE) as f:
-        return yaml.safe_load(f)
+        ) from None
+
+    if _cache is None or _cache[0] != mtime_ns:
+        with open(CONFIG_FILE) as f:
+            _cache = (mtime_ns, Config(yaml.safe_load(f)))
+    return _cache[1]
+
+
+def get_config():
+    """Return the configuration as a read-only mapping."""
+    return load_config().data
 
 
 def get_tasks_root():
     """Return the tasks root directory as a Path."""
-    return Path(get_config()["paths"]["tasks_root"])
+    return load_config().tasks_root
 
 
 def get_folder(name):
     """Return the path to a specific folder within tasks root."""
-    config = get_config()
-    folder_name = config["folders"].get(name, name)
-    return get_tasks_root() / folder_name
+    return load_config().folder(name)
 
 
 def get_all_task_dirs():
     """Return list of directories that may contain task files."""
-    return [
-        get_folder("tasks"),
-        get_folder("ideas"),
-        get_folder("bugs"),
-        get_folder("import"),
-    ]
+    return load_config().task_dirs
 
 
 def get_link_format():
     """Return the link format: 'obsidian' or 'markdown'."""
-    config = get_config()
-    return config.get("links", {}).get("format", "obsidian")
+    return load_config().link_format
+
+
+def format_link(filename, folder=None):
+    """Format a link based on the configured link format."""
+    if get_link_format() == "markdown":
+        if folder:
+            return f"[{filename}]({folder}/{filename}.md)"
+        return f"[{filename}]({filename}.md)"
+    else:
+        # Default to obsidian wiki-links
+        return f"[[{filename}]]"
 
 
 def is_research_system_enabled():
     """Return True if research-system integration is enabled."""
-    config = get_config()
-    return config.get("integrations", {}).get("research_system", False)
+    return load_config().research_system_enabled
@@ -5,11 +5,15 @@ Date calculation utilities for task-management plugin.
 
 from datetime import datetime, timedelta
 
+from i18n import month_name, weekday_name
 
-def get_week_dates():
+
+def get_week_dates(today=None):
     """
     Calculate current week and next week dates.
 
+    today (a date) defaults to the current date.
+
     Returns dict with:
         today: date string (YYYY-MM-DD)
         today_formatted: formatted date (e.g., "October 3")
@@ -20,7 +24,8 @@ def get_week_dates():
         next_week_start: Monday of next week (YYYY-MM-DD)
         next_week_end: Sunday of next week (YYYY-MM-DD)
     """
-    today = datetime.now().date()
+    if today is None:
+        today = datetime.now().date()
 
     # weekday() returns 0=Monday, 6=Sunday
     current_weekday = today.weekday()
@@ -38,8 +43,8 @@ def get_week_dates():
 
     return {
         'today': str(today),
-        'today_formatted': today.strftime('%B %-d'),
-        'today_weekday': today.strftime('%A'),
+        'today_formatted': f"{month_name(today, 'en')} {today.day}",
+        'today_weekday': weekday_name(today, 'en'),
         'tomorrow': str(tomorrow),
         'this_week_start': str(this_week_monday),
         'this_week_end': str(this_week_sunday),
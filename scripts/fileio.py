@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+File writing helpers for task-management plugin.
+"""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
+from metrics import count
+
+
+def _temp_file_for(path):
+    """
+    Create a temporary file next to path, with path's permissions.
+
+    Returns (fd, tmp_path). Living in the same directory makes the final
+    os.replace atomic.
+    """
+    directory, name = os.path.split(os.fspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory or ".")
+    try:
+        mode_bits = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode_bits = 0o666 & ~umask
+    os.chmod(tmp_path, mode_bits)
+    return fd, tmp_path
+
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def atomic_open(path, mode='wb', encoding=None):
+    """
+    Open a temporary file next to path and move it over path on success.
+
+    Readers see either the old file or the complete new one. If the block
+    raises, the temporary file is removed and path is untouched. The
+    permissions of an existing file are kept.
+    """
+    fd, tmp_path = _temp_file_for(path)
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp_path, path)
+        count("files_written")
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
+
+
+def write_if_changed(path, content, encoding='utf-8'):
+    """
+    Write text to path unless the file already holds exactly that text.
+
+    Changes are written with atomic_open. Skipping identical writes keeps
+    the mtime untouched, so sync clients, Obsidian and file watchers don't
+    react to runs that changed nothing. Returns True if the file was written.
+    """
+    data = content.encode(encoding)
+    try:
+        # A size mismatch settles it without reading the file
+        if os.stat(path).st_size == len(data):
+            with open(path, 'rb') as f:
+                existing = f.read()
+            count("bytes_read", len(existing))
+            if existing == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def write_batch(writes):
+    """
+    Rewrite several files as one batch.
+
+    writes is a list of (path, write) pairs, where write(f) writes the new
+    content to an open binary file. Every temporary file is written before
+    the first one is renamed into place, so an interrupted run leaves each
+    target either untouched or fully rewritten, never half-written.
+    """
+    pending = []
+    try:
+        for path, write in writes:
+            fd, tmp_path = _temp_file_for(path)
+            pending.append((tmp_path, path))
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+        for tmp_path, path in pending:
+            os.replace(tmp_path, path)
+        count("files_written", len(pending))
+        pending = []
+    finally:
+        for tmp_path, _ in pending:
+            _unlink_quietly(tmp_path)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Streaming frontmatter reader and writer for task-management plugin.
+
+Task files can carry very large bodies (pasted transcripts, logs), so the
+header is read line by line and reading stops at the closing '---'. The
+byte offset where the body starts is returned so writers can replace the
+header and copy the body without decoding it.
+"""
+
+import shutil
+
+from fileio import atomic_open
+from metrics import count
+
+DELIMITER = b'---'
+
+
+def _decode(raw_line):
+    return raw_line.rstrip(b'\n').decode('utf-8', 'surrogateescape')
+
+
+def read_frontmatter(file_path):
+    """
+    Read the frontmatter of a file without reading its body.
+
+    Returns (lines, body_offset): lines are the header lines between the
+    '---' delimiters, without newlines; body_offset is the byte offset just
+    past the closing delimiter line. Returns (None, 0) if the file has no
+    complete frontmatter.
+    """
+    with open(file_path, 'rb') as f:
+        first = f.readline()
+        if not first.startswith(DELIMITER) or first.strip() != DELIMITER:
+            count("bytes_read", len(first))
+            return None, 0
+
+        lines = []
+        size = len(first)
+        for raw_line in f:
+            size += len(raw_line)
+            if raw_line.strip() == DELIMITER:
+                count("bytes_read", size)
+                return lines, size
+            lines.append(_decode(raw_line))
+
+    count("bytes_read", size)
+    return None, 0
+
+
+def read_body(file_path, body_offset):
+    """Return the text of a file from body_offset to the end."""
+    with open(file_path, 'rb') as f:
+        f.seek(body_offset)
+        data = f.read()
+    count("bytes_read", len(data))
+    return data.decode('utf-8', 'surrogateescape')
+
+
+def encode_header(lines):
+    """Encode frontmatter lines, delimiters included."""
+    text = '---\n' + ''.join(f'{line}\n' for line in lines) + '---\n'
+    return text.encode('utf-8', 'surrogateescape')
+
+
+def frontmatter_writer(file_path, lines, body_offset, body=None):
+    """
+    Return a function that writes file_path with its header replaced.
+
+    The returned write(f) emits the new header, then either the given body
+    text or the original bytes from body_offset onwards, unchanged. It is
+    meant for fileio.write_batch() and atomic_open().
+    """
+    def write(dst):
+        dst.write(encode_header(lines))
+        if body is not None:
+            dst.write(body.encode('utf-8', 'surrogateescape'))
+            return
+        with open(file_path, 'rb') as src:
+            src.seek(body_offset)
+            shutil.copyfileobj(src, dst)
+            count("bytes_read", src.tell() - body_offset)
+
+    return write
+
+
+def write_frontmatter(file_path, lines, body_offset, body=None):
+    """Replace the frontmatter of a file atomically (see frontmatter_writer)."""
+    with atomic_open(file_path) as dst:
+        frontmatter_writer(file_path, lines, body_offset, body)(dst)
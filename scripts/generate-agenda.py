@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Generate an agenda for an arbitrary date range.
+
+Usage:
+    generate-agenda.py --from 2026-10-01 --to 2026-12-31 [--expand-recurring]
+                       [--overdue] [--output agenda.md]
+
+Tasks are grouped by due date in a single pass over the task index. With
+--expand-recurring, recurring tasks also appear on their future
+occurrences within the range. Prints to stdout unless --output is given
+(relative paths are resolved against tasks_root).
+"""
+
+import argparse
+import sys
+from datetime import datetime
+
+from agenda import render_agenda
+from config import get_tasks_root
+from fileio import write_if_changed
+from task_index import TaskIndex
+
+
+def parse_day(value):
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate an agenda for a date range.")
+    parser.add_argument("--from", dest="start", type=parse_day, required=True,
+                        help="first day (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", type=parse_day, required=True,
+                        help="last day (YYYY-MM-DD), inclusive")
+    parser.add_argument("--expand-recurring", action="store_true",
+                        help="show recurring tasks on their future occurrences")
+    parser.add_argument("--overdue", action="store_true",
+                        help="list tasks overdue as of today first")
+    parser.add_argument("--output", help="write to this file instead of stdout")
+    args = parser.parse_args()
+
+    if args.end < args.start:
+        parser.error("--to must not be before --from")
+
+    index = TaskIndex.build(("tasks",))
+    today = str(datetime.now().date()) if args.overdue else None
+    content, total = render_agenda(index, args.start, args.end, args.expand_recurring, today)
+
+    if args.output:
+        output = get_tasks_root() / args.output
+        if write_if_changed(output, content):
+            print(f"Wrote {total} task(s) to {output}")
+        else:
+            print(f"{output} is up to date ({total} task(s))")
+    else:
+        sys.stdout.write(content)
+
+
+if __name__ == "__main__":
+    main()
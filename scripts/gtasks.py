@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Google Tasks views for task-management plugin.
+
+Renders today.md, this-week.md and next-week.md from the raw JSON returned
+by the Google Tasks list_tasks call, one response per task list. Each list
+is mapped to an area (Trabajo, Personal...) by google_tasks.lists in
+config.yaml. Titles like '[Proyecto] Tarea' are split into project and
+task, '#esperando' in the notes marks a task as blocked, and overdue tasks
+get their number of days late. Dates and labels come from i18n.py, so the
+output only depends on the input JSON, the config and the reference day.
+
+Calendar events, when given (see calendar_cache.events_by_day), are merged
+into the same pass: a Calendario section under today's header and a
+Calendario / Tareas split in each day of the weekly views.
+
+status.json, the summary read by /task-management:estado, is rendered
+from the same tasks (see render_status).
+"""
+
+import json
+import re
+from collections import defaultdict
+from datetime import date, datetime
+
+from agenda import format_date_header, label
+from views import STATUS_LIMIT, render_week_header
+
+PROJECT_PREFIX = re.compile(r"^\s*\[([^\]]+)\]\s*(.*)$")
+WAITING_TAG = "#esperando"
+
+
+class GoogleTask:
+    """A pending Google Tasks item, parsed for rendering."""
+
+    __slots__ = ("title", "project", "area", "due", "waiting", "waiting_reason", "position")
+
+    def __init__(self, item, area, position):
+        title = (item.get("title") or "").strip()
+        match = PROJECT_PREFIX.match(title)
+        self.project, self.title = (match.group(1).strip(), match.group(2).strip()) if match else (None, title)
+        self.area = area
+        self.due = parse_due(item.get("due"))
+        self.waiting, self.waiting_reason = parse_waiting(item.get("notes") or "")
+        self.position = position
+
+    def display_title(self):
+        """Title with its '[Proyecto]' prefix, as shown in the weekly views."""
+        return f"[{self.project}] {self.title}" if self.project else self.title
+
+    def suffix(self, today=None):
+        """The '(espera...)' and '(atrasada Nd)' markers for a task line."""
+        parts = []
+        if self.waiting:
+            parts.append(label("waiting_for", reason=self.waiting_reason)
+                         if self.waiting_reason else label("waiting"))
+        if today is not None and self.due < today:
+            parts.append(label("days_overdue", days=(today - self.due).days))
+        return "".join(f" {part}" for part in parts)
+
+    def sort_key(self):
+        # Actionable tasks first, blocked ones last, then list order
+        return (self.waiting, self.due, self.position, self.title)
+
+
+def parse_due(value):
+    """Return the date of a Google Tasks due value ('2026-02-10T00:00:00.000Z')."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def parse_waiting(notes):
+    """Return (waiting, reason) from '#esperando [reason]' in the notes."""
+    for line in notes.splitlines():
+        index = line.find(WAITING_TAG)
+        if index != -1:
+            reason = line[index + len(WAITING_TAG):].strip().lstrip(":-").strip()
+            return True, reason
+    return False, ""
+
+
+def response_items(response):
+    """Return the task items of a list_tasks response (a list or {items|tasks: [...]})."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        for key in ("items", "tasks"):
+            if isinstance(response.get(key), list):
+                return response[key]
+    raise ValueError("unrecognized list_tasks response (expected a list or an object with 'items')")
+
+
+def find_list(lists, key):
+    """Return the configured list whose id or name is key (None if unknown)."""
+    for entry in lists:
+        if key in (entry.get("id"), entry.get("name")):
+            return entry
+    return None
+
+
+def load_tasks(responses, lists):
+    """
+    Parse list_tasks responses into GoogleTask objects.
+
+    responses is a list of (list key, parsed JSON) pairs, where the key is
+    a list id or name from lists (config google_tasks.lists); unknown
+    lists use their key as area. Completed tasks and tasks without a due
+    date are left out.
+    """
+    tasks = []
+    for key, response in responses:
+        entry = find_list(lists, key) or {}
+        area = entry.get("area") or entry.get("name") or key
+        for item in response_items(response):
+            if item.get("status") == "completed" or item.get("deleted"):
+                continue
+            task = GoogleTask(item, area, len(tasks))
+            if task.due is not None:
+                tasks.append(task)
+    return tasks
+
+
+def area_order(lists, tasks):
+    """Areas in config order, then any others in order of appearance."""
+    order = []
+    for area in [entry.get("area") or entry.get("name") for entry in lists] + [t.area for t in tasks]:
+        if area and area not in order:
+            order.append(area)
+    return order
+
+
+def group_by_project(tasks):
+    """Return [(project, tasks)] with projects sorted by name and General last."""
+    groups = defaultdict(list)
+    for task in tasks:
+        groups[task.project].append(task)
+    projects = sorted((p for p in groups if p), key=str.lower)
+    if None in groups:
+        projects.append(None)
+    return [(project, sorted(groups[project], key=GoogleTask.sort_key)) for project in projects]
+
+
+def render_project_sections(tasks, heading, today=None):
+    """Render '### Proyecto' sections (General for tasks without project)."""
+    content = ""
+    for project, project_tasks in group_by_project(tasks):
+        content += f"{heading} {project or label('general')}\n"
+        for task in project_tasks:
+            content += f"- [ ] {task.title}{task.suffix(today)}\n"
+        content += "\n"
+    return content
+
+
+def render_calendar(lines, heading):
+    """Render a Calendario section from formatted event lines."""
+    return f"{heading} {label('calendar')}\n" + "".join(f"{line}\n" for line in lines) + "\n"
+
+
+def render_today(tasks, dates, areas, calendar=None):
+    """
+    Render today.md: today's events, today's tasks by area and project,
+    then the overdue ones by project.
+
+    Returns (content, summary) with 'due_today' and 'overdue' counts.
+    """
+    today = date.fromisoformat(dates['today'])
+    due_today = [t for t in tasks if t.due == today]
+    overdue = [t for t in tasks if t.due < today]
+
+    content = f"---\ndate: {today}\n---\n"
+    content += f"# {label('today')} - {format_date_header(today)}\n\n"
+    if calendar and calendar.get(today):
+        content += render_calendar(calendar[today], "##")
+    for area in areas:
+        area_tasks = [t for t in due_today if t.area == area]
+        if area_tasks:
+            content += f"## {area}\n"
+            content += render_project_sections(area_tasks, "###")
+
+    if overdue:
+        content += f"## {label('overdue')}\n"
+        content += render_project_sections(overdue, "###", today)
+
+    return content, {'due_today': len(due_today), 'overdue': len(overdue)}
+
+
+def render_day_lines(tasks, areas, today=None):
+    """Render '- [ ] [Proyecto] Tarea' lines, by area, blocked tasks last."""
+    area_index = {area: i for i, area in enumerate(areas)}
+    ordered = sorted(tasks, key=lambda t: (area_index.get(t.area, len(areas)),) + t.sort_key())
+    return "".join(f"- [ ] {t.display_title()}{t.suffix(today)}\n" for t in ordered)
+
+
+def render_week(tasks, areas, title_key, week_start, week_end, first_day, empty_key,
+                today=None, calendar=None):
+    """
+    Render a weekly view of the days from first_day to week_end (dates),
+    with an overdue section first if today is given. Days with events in
+    calendar get a Calendario section before their Tareas.
+
+    Returns (content, summary) with the number of 'tasks' and of 'days'
+    that have tasks.
+    """
+    content = render_week_header(title_key, str(week_start), str(week_end))
+
+    if today is not None:
+        overdue = [t for t in tasks if t.due < today]
+        if overdue:
+            content += f"## {label('overdue')}\n"
+            content += render_day_lines(overdue, areas, today) + "\n"
+
+    by_day = defaultdict(list)
+    for task in tasks:
+        if first_day <= task.due <= week_end:
+            by_day[task.due].append(task)
+
+    events = {day: lines for day, lines in (calendar or {}).items()
+              if first_day <= day <= week_end and lines}
+    for day in sorted(set(by_day) | set(events)):
+        content += f"## {format_date_header(day)}\n"
+        if day in events:
+            content += render_calendar(events[day], "###")
+            if day in by_day:
+                content += f"### {label('tasks')}\n"
+        if day in by_day:
+            content += render_day_lines(by_day[day], areas) + "\n"
+    if not by_day:
+        content += f"{label(empty_key)}\n"
+
+    total = sum(len(day_tasks) for day_tasks in by_day.values())
+    return content, {'tasks': total, 'days': len(by_day)}
+
+
+def render_this_week(tasks, dates, areas, calendar=None):
+    """Render this-week.md: overdue tasks, then tomorrow to Sunday."""
+    today = date.fromisoformat(dates['today'])
+    tomorrow = date.fromisoformat(dates['tomorrow'])
+    week_end = date.fromisoformat(dates['this_week_end'])
+    # On Sundays no days are left; the header keeps the current week
+    week_start = tomorrow if tomorrow <= week_end else date.fromisoformat(dates['this_week_start'])
+    return render_week(tasks, areas, 'this_week', week_start, week_end, tomorrow,
+                       'no_tasks_rest_of_week', today, calendar)
+
+
+def render_next_week(tasks, dates, areas, calendar=None):
+    """Render next-week.md: Monday to Sunday of next week, no overdue section."""
+    week_start = date.fromisoformat(dates['next_week_start'])
+    week_end = date.fromisoformat(dates['next_week_end'])
+    return render_week(tasks, areas, 'next_week', week_start, week_end, week_start,
+                       'no_tasks_next_week', calendar=calendar)
+
+
+def render_status(tasks, dates, recurring=(), limit=STATUS_LIMIT):
+    """
+    Render status.json with the same layout as views.render_status.
+    Google Tasks doesn't expose recurrence, so the recurring tasks are the
+    local task files with a recurrence: field (TaskIndex.recurring()).
+
+    Returns (content, summary) with the 'overdue', 'due_today',
+    'remaining_week', 'next_week' and 'recurring' counts.
+    """
+    today = date.fromisoformat(dates['today'])
+    tomorrow = date.fromisoformat(dates['tomorrow'])
+    week_end = date.fromisoformat(dates['this_week_end'])
+    next_start = date.fromisoformat(dates['next_week_start'])
+    next_end = date.fromisoformat(dates['next_week_end'])
+
+    due_today = sorted((t for t in tasks if t.due == today), key=GoogleTask.sort_key)
+    overdue = sorted((t for t in tasks if t.due < today), key=lambda t: (t.due, t.display_title()))
+    remaining_week = sum(1 for t in tasks if tomorrow <= t.due <= week_end)
+    next_week = sum(1 for t in tasks if next_start <= t.due <= next_end)
+
+    status = {
+        'date': dates['today'],
+        'date_header': format_date_header(today),
+        'today': {
+            'total': len(due_today),
+            'tasks': [t.display_title() for t in due_today[:limit]],
+        },
+        'overdue': {
+            'total': len(overdue),
+            'items': [{'name': t.display_title(), 'due': str(t.due)} for t in overdue[:limit]],
+        },
+        'this_week': {
+            'start': dates['this_week_start'],
+            'end': dates['this_week_end'],
+            'remaining': remaining_week,
+        },
+        'next_week': {
+            'start': dates['next_week_start'],
+            'end': dates['next_week_end'],
+            'total': next_week,
+        },
+        'recurring': {
+            'total': len(recurring),
+            'items': [
+                {'name': t.name, 'recurrence': t.recurrence, 'next_due': t.due}
+                for t in sorted(recurring, key=lambda t: (t.due or '', t.name))
+            ],
+        },
+    }
+    content = json.dumps(status, ensure_ascii=False, indent=2) + "\n"
+    summary = {
+        'overdue': len(overdue),
+        'due_today': len(due_today),
+        'remaining_week': remaining_week,
+        'next_week': next_week,
+        'recurring': len(recurring),
+    }
+    return content, summary
+
+
+def read_responses(sources, stdin):
+    """
+    Load list_tasks responses from 'LIST=FILE' sources or from stdin.
+
+    With no sources, stdin must hold a JSON object mapping list ids or
+    names to their responses. Returns a list of (list key, parsed JSON).
+    """
+    if not sources:
+        data = json.load(stdin)
+        if not isinstance(data, dict):
+            raise ValueError("stdin must be a JSON object mapping list ids or names to list_tasks responses")
+        return list(data.items())
+
+    responses = []
+    for source in sources:
+        key, sep, path = source.partition("=")
+        if not sep:
+            raise ValueError(f"invalid source '{source}' (expected LIST=FILE)")
+        if path == "-":
+            responses.append((key, json.load(stdin)))
+            continue
+        with open(path, encoding="utf-8") as f:
+            responses.append((key, json.load(f)))
+    return responses
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Localized date formatting and view labels for task-management plugin.
+
+Day and month names are looked up in tuples indexed by date.weekday() and
+date.month, so output never depends on the process locale (LANG) or on
+platform-specific strftime directives. The language comes from
+config.yaml (language: es | en).
+"""
+
+from functools import lru_cache
+
+from config import load_config
+
+DEFAULT_LANGUAGE = "es"
+
+# Indexed by date.weekday() (0=Monday)
+WEEKDAYS = {
+    "es": ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"),
+    "en": ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+}
+
+# Indexed by date.month - 1
+MONTHS = {
+    "es": ("enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+           "agosto", "septiembre", "octubre", "noviembre", "diciembre"),
+    "en": ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December"),
+}
+
+DATE_HEADER = {
+    "es": "{weekday}, {day} de {month}",
+    "en": "{weekday}, {month} {day}",
+}
+
+# (same month, different months)
+WEEK_RANGE = {
+    "es": ("del {start_day} al {end_day} de {end_month}",
+           "del {start_day} de {start_month} al {end_day} de {end_month}"),
+    "en": ("{end_month} {start_day}-{end_day}",
+           "{start_month} {start_day} - {end_month} {end_day}"),
+}
+
+LABELS = {
+    "es": {
+        "today": "Hoy",
+        "this_week": "Esta semana",
+        "next_week": "Próxima semana",
+        "week": "Semana {range}",
+        "overdue": "Atrasadas",
+        "tasks": "Tareas",
+        "ideas_in_progress": "Ideas en progreso",
+        "research": "Investigación",
+        "no_days_left": "No quedan tareas esta semana.",
+        "agenda": "Agenda",
+        "no_tasks_in_range": "No hay tareas en este periodo.",
+        "projected": "(recurrente)",
+        "general": "General",
+        "waiting": "(espera)",
+        "waiting_for": "(espera: {reason})",
+        "days_overdue": "(atrasada {days}d)",
+        "no_tasks_rest_of_week": "No hay tareas para el resto de la semana.",
+        "no_tasks_next_week": "No hay tareas para la próxima semana.",
+        "calendar": "Calendario",
+    },
+    "en": {
+        "today": "Today",
+        "this_week": "This week",
+        "next_week": "Next week",
+        "week": "Week of {range}",
+        "overdue": "Overdue",
+        "tasks": "Tasks",
+        "ideas_in_progress": "Ideas in progress",
+        "research": "Research",
+        "no_days_left": "No tasks left this week.",
+        "agenda": "Agenda",
+        "no_tasks_in_range": "No tasks in this period.",
+        "projected": "(recurring)",
+        "general": "General",
+        "waiting": "(waiting)",
+        "waiting_for": "(waiting: {reason})",
+        "days_overdue": "({days}d overdue)",
+        "no_tasks_rest_of_week": "No tasks for the rest of the week.",
+        "no_tasks_next_week": "No tasks next week.",
+        "calendar": "Calendar",
+    },
+}
+
+
+def get_language():
+    """Return the configured language, checking that it is supported."""
+    language = load_config().language
+    if language not in WEEKDAYS:
+        raise ValueError(
+            f"Unsupported language '{language}' in config.yaml "
+            f"(supported: {', '.join(WEEKDAYS)})"
+        )
+    return language
+
+
+def weekday_name(date, language=DEFAULT_LANGUAGE):
+    """Return the weekday name of a date."""
+    return WEEKDAYS[language][date.weekday()]
+
+
+def month_name(date, language=DEFAULT_LANGUAGE):
+    """Return the month name of a date."""
+    return MONTHS[language][date.month - 1]
+
+
+@lru_cache(maxsize=1024)
+def format_date_header(date, language=DEFAULT_LANGUAGE):
+    """Format a date as 'Lunes, 12 de enero' (or the language's equivalent)."""
+    return DATE_HEADER[language].format(
+        weekday=weekday_name(date, language),
+        day=date.day,
+        month=month_name(date, language),
+    )
+
+
+@lru_cache(maxsize=256)
+def format_week_range(start, end, language=DEFAULT_LANGUAGE):
+    """Format a date range as 'del 5 al 11 de enero' (or the language's equivalent)."""
+    same_month, other_month = WEEK_RANGE[language]
+    pattern = same_month if (start.year, start.month) == (end.year, end.month) else other_month
+    return pattern.format(
+        start_day=start.day,
+        start_month=month_name(start, language),
+        end_day=end.day,
+        end_month=month_name(end, language),
+    )
+
+
+def label(key, language=DEFAULT_LANGUAGE, **values):
+    """Return a view label, with any {placeholders} filled from values."""
+    text = LABELS[language][key]
+    return text.format(**values) if values else text
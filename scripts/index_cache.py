@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Persistent frontmatter cache for task-management plugin.
+
+Stores the parsed frontmatter of every indexed file in a SQLite database
+under tasks_root, keyed by path and validated by mtime, size and inode, so
+a run only re-parses the files that changed since the previous one.
+"""
+
+import json
+import sqlite3
+import sys
+
+CACHE_FILENAME = ".task-index.sqlite"
+
+# Bump when the table layout or the parsing rules change
+SCHEMA_VERSION = 1
+
+# Frontmatter columns, in table order
+COLUMNS = ("type", "due", "completed", "recurrence", "recurrence_day", "status")
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    {", ".join(f"{c} TEXT" for c in COLUMNS)},
+    tags TEXT NOT NULL,
+    non_iso_dates INTEGER NOT NULL
+)
+"""
+
+
+class IndexCache:
+    """SQLite-backed store of parsed frontmatter records."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @classmethod
+    def open(cls, tasks_root):
+        """
+        Open (or create) the cache under tasks_root.
+
+        Returns None if the database can't be used, e.g. on a read-only vault,
+        in which case callers fall back to parsing every file.
+        """
+        try:
+            conn = sqlite3.connect(str(tasks_root / CACHE_FILENAME))
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(SCHEMA)
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: task index cache unavailable ({e})", file=sys.stderr)
+            return None
+        return cls(conn)
+
+    def load(self, folders):
+        """
+        Return {path: (stat_key, record)} for every cached file in folders.
+
+        stat_key is (mtime_ns, size, inode); record is a dict with folder,
+        fields, tags and non_iso_dates.
+        """
+        placeholders = ", ".join("?" for _ in folders)
+        rows = self.conn.execute(
+            f"SELECT path, folder, mtime_ns, size, inode, {', '.join(COLUMNS)}, "
+            f"tags, non_iso_dates FROM files WHERE folder IN ({placeholders})",
+            tuple(folders),
+        )
+
+        cached = {}
+        for row in rows:
+            path, folder, mtime_ns, size, inode = row[:5]
+            values = row[5:5 + len(COLUMNS)]
+            tags, non_iso_dates = row[5 + len(COLUMNS):]
+            record = {
+                "folder": folder,
+                "fields": {c: v for c, v in zip(COLUMNS, values) if v is not None},
+                "tags": json.loads(tags),
+                "non_iso_dates": bool(non_iso_dates),
+            }
+            cached[path] = ((mtime_ns, size, inode), record)
+        return cached
+
+    def update(self, changed, deleted=()):
+        """
+        Store re-parsed tasks and drop deleted paths in one transaction.
+
+        changed is an iterable of (stat_key, task) pairs.
+        """
+        rows = []
+        for (mtime_ns, size, inode), task in changed:
+            rows.append(
+                (str(task.path), task.folder, mtime_ns, size, inode)
+                + tuple(getattr(task, c) for c in COLUMNS)
+                + (json.dumps(list(task.tags)), int(task.non_iso_dates))
+            )
+        deleted = [(str(path),) for path in deleted]
+        if not rows and not deleted:
+            return
+
+        columns = ("path", "folder", "mtime_ns", "size", "inode") + COLUMNS + ("tags", "non_iso_dates")
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO files ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    rows,
+                )
+                self.conn.executemany("DELETE FROM files WHERE path = ?", deleted)
+        except sqlite3.Error as e:
+            print(f"Warning: could not update task index cache ({e})", file=sys.stderr)
+
+    def close(self):
+        self.conn.close()
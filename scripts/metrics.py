@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and I/O counters for task-management plugin.
+
+Stages run through run_stage(), which times them and collects the
+counters that the I/O helpers bump with count() while the stage runs:
+
+    files_scanned  directory entries considered (.md files listed)
+    files_parsed   files whose frontmatter was parsed (index cache misses)
+    bytes_read     bytes read from task files
+    files_written  files created or rewritten
+    files_moved    files renamed into another folder
+    subprocesses   child processes spawned
+
+Counts made in worker processes (performance.scan_processes) are not
+collected; threads are. Entry points expose the records with --stats and
+--stats-json (which, without a FILE, keeps stdout for the JSON and sends
+everything else to stderr), and append them to a rolling log under tasks_root when
+metrics.log is enabled in config.yaml.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+from config import load_config
+
+COUNTERS = (
+    "files_scanned",
+    "files_parsed",
+    "bytes_read",
+    "files_written",
+    "files_moved",
+    "subprocesses",
+)
+
+METRICS_FILENAME = ".task-metrics.jsonl"
+DEFAULT_LOG_ENTRIES = 1000
+
+_lock = threading.Lock()
+# Counters of the stage currently running, if any
+_current = None
+# The real stdout while --stats-json sends the rest of the output to stderr
+_json_stdout = None
+
+
+def count(name, n=1):
+    """Add n to a counter of the running stage (no-op outside a stage)."""
+    counters = _current
+    if counters is not None:
+        with _lock:
+            counters[name] += n
+
+
+def run_stage(name, func, *args):
+    """
+    Run func(*args) and return a stage record.
+
+    The record is a dict with the stage 'name', its wall time in 'seconds',
+    the I/O 'counters' collected meanwhile and the function's return value
+    as 'result'.
+    """
+    global _current
+    counters = dict.fromkeys(COUNTERS, 0)
+    previous, _current = _current, counters
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    finally:
+        seconds = time.perf_counter() - start
+        _current = previous
+    return {'name': name, 'seconds': seconds, 'counters': counters, 'result': result}
+
+
+def stats_document(command, stages):
+    """Return the JSON-ready summary of a run (stage results left out)."""
+    totals = dict.fromkeys(COUNTERS, 0)
+    for stage in stages:
+        for name in COUNTERS:
+            totals[name] += stage['counters'][name]
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'command': command,
+        'stages': [
+            {'name': stage['name'], 'seconds': round(stage['seconds'], 6), **stage['counters']}
+            for stage in stages
+        ],
+        'total': {'seconds': round(sum(stage['seconds'] for stage in stages), 6), **totals},
+    }
+
+
+def print_stats(document):
+    """Print a stats_document() as a table."""
+    rows = document['stages'] + [dict(document['total'], name='total')]
+    headers = ("stage", "ms", "scanned", "parsed", "read", "written", "moved", "procs")
+    table = [
+        (row['name'], f"{row['seconds'] * 1000:.1f}", str(row['files_scanned']),
+         str(row['files_parsed']), format_bytes(row['bytes_read']), str(row['files_written']),
+         str(row['files_moved']), str(row['subprocesses']))
+        for row in rows
+    ]
+    widths = [max(len(cells[i]) for cells in table + [headers]) for i in range(len(headers))]
+    print("Stage stats:")
+    for cells in [headers] + table:
+        print("  " + "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(cells, widths))
+        ))
+
+
+def format_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def append_log(document):
+    """
+    Append a run to tasks_root/.task-metrics.jsonl if metrics.log is on.
+
+    Only the last metrics.max_entries runs are kept.
+    """
+    config = load_config()
+    settings = config.data.get("metrics") or {}
+    if not settings.get("log"):
+        return
+    max_entries = int(settings.get("max_entries", DEFAULT_LOG_ENTRIES))
+    path = config.tasks_root / METRICS_FILENAME
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        lines = []
+    lines.append(json.dumps(document) + "\n")
+
+    if len(lines) <= max_entries:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(lines[-1])
+        return
+    # Not fileio.atomic_open: fileio reports to this module
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines[-max_entries:])
+    os.replace(tmp_path, path)
+
+
+class StatsJsonAction(argparse.Action):
+    """
+    Store --stats-json. Without a FILE the JSON goes to stdout, so from
+    then on everything else the script prints goes to stderr.
+    """
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        global _json_stdout
+        setattr(namespace, self.dest, values)
+        if values == "-" and _json_stdout is None:
+            _json_stdout = sys.stdout
+            sys.stdout = sys.stderr
+
+
+def add_arguments(parser):
+    """Add the --stats and --stats-json options to an argparse parser."""
+    parser.add_argument("--stats", action="store_true",
+                        help="print time and I/O counters per stage")
+    parser.add_argument("--stats-json", metavar="FILE", nargs="?", const="-", action=StatsJsonAction,
+                        help="write the stage stats as JSON to FILE (stdout if omitted; "
+                             "the rest of the output then goes to stderr)")
+
+
+def report(command, stages, args):
+    """Print, write and log the stats of a run as requested by args."""
+    document = stats_document(command, stages)
+    if args.stats:
+        print()
+        print_stats(document)
+    if args.stats_json == "-":
+        stdout = _json_stdout or sys.stdout
+        json.dump(document, stdout, indent=2)
+        stdout.write("\n")
+    elif args.stats_json:
+        with open(args.stats_json, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+    append_log(document)
@@ -7,127 +7,35 @@ Handles multiple input formats:
 - YYYY-M-D (e.g., 2025-10-5)
 - YYYY-MM-DD (already correct)
 
-Converts all to YYYY-MM-DD format.
+Converts all to YYYY-MM-DD format. Use --dry-run to list the planned
+changes without writing, --stats or --stats-json for per-stage time and
+I/O counters, and --profile to save a cProfile profile.
 """
 
-import re
-import os
-from pathlib import Path
-from datetime import datetime
+import argparse
 
 # Import config from same directory
-from config import get_all_task_dirs
-
-def parse_date(date_str):
-    """
-    Parse various date formats and return standardized YYYY-MM-DD string.
-
-    Supports:
-    - M/D/YYYY or MM/DD/YYYY
-    - YYYY-M-D or YYYY-MM-DD
-    """
-    date_str = date_str.strip()
-
-    # Try M/D/YYYY or MM/DD/YYYY format
-    if '/' in date_str:
-        try:
-            dt = datetime.strptime(date_str, '%m/%d/%Y')
-            return dt.strftime('%Y-%m-%d')
-        except ValueError:
-            try:
-                dt = datetime.strptime(date_str, '%m/%d/%y')
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
-                pass
-
-    # Try YYYY-M-D or YYYY-MM-DD format
-    if '-' in date_str:
-        parts = date_str.split('-')
-        if len(parts) == 3:
-            year, month, day = parts
-            # Pad month and day with leading zeros if needed
-            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-
-    # Return original if we can't parse it
-    return date_str
-
-def normalize_file_dates(file_path):
-    """
-    Normalize all date fields in a file's frontmatter.
-    Returns True if file was modified, False otherwise.
-    """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Check if file has frontmatter
-    if not content.startswith('---'):
-        return False
-
-    # Split content into frontmatter and body
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return False
-
-    frontmatter = parts[1]
-    body = parts[2]
-
-    # Pattern to match date fields (due, completed, created, etc.)
-    date_pattern = r'^(due|completed|created|updated):\s*(.+)$'
-
-    modified = False
-    new_lines = []
-
-    for line in frontmatter.split('\n'):
-        match = re.match(date_pattern, line)
-        if match:
-            field_name = match.group(1)
-            date_value = match.group(2)
-
-            # Skip empty date values
-            if not date_value or date_value.strip() == '':
-                new_lines.append(line)
-                continue
-
-            normalized_date = parse_date(date_value)
-
-            if normalized_date != date_value:
-                new_lines.append(f"{field_name}: {normalized_date}")
-                modified = True
-            else:
-                new_lines.append(line)
-        else:
-            new_lines.append(line)
-
-    if modified:
-        new_frontmatter = '\n'.join(new_lines)
-        new_content = f"---{new_frontmatter}---{body}"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-
-        return True
-
-    return False
+import metrics
+import profiling
+from config import TASK_FOLDERS
+from normalize import normalize_dates, print_report
+from task_index import TaskIndex
 
 def main():
     """Normalize dates in all task files."""
-    modified_files = []
-
-    for task_dir in get_all_task_dirs():
-        if not task_dir.exists():
-            continue
+    parser = argparse.ArgumentParser(description="Normalize task frontmatter dates to YYYY-MM-DD.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report the planned changes without touching any file")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
 
-        for file_path in task_dir.glob('*.md'):
-            if normalize_file_dates(file_path):
-                modified_files.append(str(file_path))
+    # Only files whose cached header has a non-ISO date need to be opened
+    stages = [metrics.run_stage("index", TaskIndex.build, TASK_FOLDERS)]
+    stages.append(metrics.run_stage("normalize-dates", normalize_dates, stages[0]['result'],
+                                    args.dry_run))
+    print_report(stages[-1]['result'], dry_run=args.dry_run)
 
-    # Print results
-    if modified_files:
-        print(f"Normalized dates in {len(modified_files)} files:\n")
-        for file_path in modified_files:
-            print(f"  - {file_path}")
-    else:
-        print("No files needed date normalization.")
+    metrics.report("normalize-dates", stages, args)
 
 if __name__ == '__main__':
-    main()
+    profiling.run("normalize-dates", main)
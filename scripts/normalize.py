@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Date normalization stage for task-management plugin.
+
+Rewrites date fields in task frontmatter to YYYY-MM-DD. Handles:
+- M/D/YYYY or MM/DD/YYYY (e.g., 10/5/2025 or 9/5/2025)
+- YYYY-M-D (e.g., 2025-10-5)
+- YYYY-MM-DD (already correct)
+"""
+
+import re
+from datetime import datetime
+
+from fileio import write_batch
+from frontmatter import frontmatter_writer, read_frontmatter, write_frontmatter
+from task_index import DATE_FIELDS, parse_task_file
+
+# Pattern to match date fields (due, completed, created, etc.)
+DATE_LINE = re.compile(r'^(due|completed|created|updated):\s*(.+)$')
+DATE_FIELD_PREFIXES = tuple(f"{field}:" for field in DATE_FIELDS)
+
+
+def parse_date(date_str):
+    """
+    Parse various date formats and return standardized YYYY-MM-DD string.
+
+    Supports:
+    - M/D/YYYY or MM/DD/YYYY
+    - YYYY-M-D or YYYY-MM-DD
+    """
+    date_str = date_str.strip()
+
+    # Try M/D/YYYY or MM/DD/YYYY format
+    if '/' in date_str:
+        try:
+            dt = datetime.strptime(date_str, '%m/%d/%Y')
+            return dt.strftime('%Y-%m-%d')
+        except ValueError:
+            try:
+                dt = datetime.strptime(date_str, '%m/%d/%y')
+                return dt.strftime('%Y-%m-%d')
+            except ValueError:
+                pass
+
+    # Try YYYY-M-D or YYYY-MM-DD format
+    if '-' in date_str:
+        parts = date_str.split('-')
+        if len(parts) == 3:
+            year, month, day = parts
+            # Pad month and day with leading zeros if needed
+            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+    # Return original if we can't parse it
+    return date_str
+
+def plan_file_dates(file_path):
+    """
+    Work out the date rewrites for a file's frontmatter, without writing.
+
+    Returns a plan dict with the file 'path', its 'changes' as
+    (field, old, new) tuples, the new header 'lines' and the 'body_offset',
+    or None if the file has no frontmatter or nothing to normalize.
+    """
+    frontmatter, body_offset = read_frontmatter(file_path)
+
+    # Check if file has frontmatter
+    if frontmatter is None:
+        return None
+
+    changes = []
+    new_lines = []
+
+    for line in frontmatter:
+        # Fast path: only date field lines are matched against the pattern
+        match = DATE_LINE.match(line) if line.startswith(DATE_FIELD_PREFIXES) else None
+        if match:
+            field_name = match.group(1)
+            date_value = match.group(2)
+
+            # Skip empty date values
+            if not date_value or date_value.strip() == '':
+                new_lines.append(line)
+                continue
+
+            normalized_date = parse_date(date_value)
+
+            if normalized_date != date_value:
+                new_lines.append(f"{field_name}: {normalized_date}")
+                changes.append((field_name, date_value.strip(), normalized_date))
+            else:
+                new_lines.append(line)
+        else:
+            new_lines.append(line)
+
+    if not changes:
+        return None
+
+    return {
+        'path': file_path,
+        'changes': changes,
+        'lines': new_lines,
+        'body_offset': body_offset,
+    }
+
+def normalize_file_dates(file_path):
+    """
+    Normalize all date fields in a file's frontmatter.
+    Returns True if file was modified, False otherwise.
+
+    Only the header is read; the body is copied unchanged on rewrite.
+    """
+    plan = plan_file_dates(file_path)
+    if plan is None:
+        return False
+
+    write_frontmatter(file_path, plan['lines'], plan['body_offset'])
+    return True
+
+def normalize_dates(index, dry_run=False):
+    """
+    Normalize dates in every indexed file whose header has a non-ISO date.
+
+    Files the index reports as already normalized are never opened. All
+    rewrites are planned first and then applied as one batch of
+    write-to-temp-then-rename operations; with dry_run nothing is written.
+    Rewritten files are re-parsed into the index.
+
+    Returns a list of {'path', 'changes'} dicts, one per file to rewrite.
+    """
+    plans = []
+    for task in index:
+        if task.non_iso_dates:
+            plan = plan_file_dates(task.path)
+            if plan is not None:
+                plans.append(plan)
+
+    if not dry_run:
+        write_batch([
+            (plan['path'], frontmatter_writer(plan['path'], plan['lines'], plan['body_offset']))
+            for plan in plans
+        ])
+        for plan in plans:
+            index.add(parse_task_file(plan['path'], index.get(plan['path']).folder))
+
+    return [{'path': plan['path'], 'changes': plan['changes']} for plan in plans]
+
+def print_report(modified, dry_run=False):
+    """Print the result of normalize_dates()."""
+    if modified:
+        verb = "Would normalize" if dry_run else "Normalized"
+        print(f"{verb} dates in {len(modified)} files:\n")
+        for item in modified:
+            print(f"  - {item['path']}")
+            if dry_run:
+                for field_name, old, new in item['changes']:
+                    print(f"      {field_name}: {old} → {new}")
+    else:
+        print("No files needed date normalization.")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the task-management entry points.
+
+Scripts call profiling.run(name, main) instead of main(). A run is
+profiled with cProfile when the script gets a --profile flag or the
+TASK_MANAGEMENT_PROFILE environment variable is set (to anything but
+'0'). The raw profile is saved as a .pstats file, with a text summary of
+the top functions next to it, under tasks_root/.profiles/.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from config import load_config
+
+PROFILE_ENV = "TASK_MANAGEMENT_PROFILE"
+PROFILE_TOP_ENV = "TASK_MANAGEMENT_PROFILE_TOP"
+PROFILE_FLAG = "--profile"
+PROFILES_DIRNAME = ".profiles"
+DEFAULT_TOP = 40
+
+
+def requested():
+    """True if this run should be profiled (consumes a --profile flag)."""
+    flag = PROFILE_FLAG in sys.argv
+    if flag:
+        sys.argv.remove(PROFILE_FLAG)
+    return flag or os.environ.get(PROFILE_ENV, "0") not in ("", "0")
+
+
+def profiles_dir():
+    """Return tasks_root/.profiles, or ./.profiles if there is no config."""
+    try:
+        root = load_config().tasks_root
+    except FileNotFoundError:
+        root = Path.cwd()
+    directory = root / PROFILES_DIRNAME
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def save(name, profiler, top=None):
+    """
+    Write profiler's stats as <name>-<timestamp>-<pid>.pstats and .txt.
+
+    The text file lists the top functions by cumulative and by own time.
+    Returns the two paths.
+    """
+    top = top or int(os.environ.get(PROFILE_TOP_ENV) or DEFAULT_TOP)
+    base = profiles_dir() / f"{name}-{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+    pstats_path = base.with_suffix(".pstats")
+    text_path = base.with_suffix(".txt")
+
+    profiler.dump_stats(pstats_path)
+    with open(text_path, "w") as f:
+        stats = pstats.Stats(profiler, stream=f).strip_dirs()
+        f.write(f"{name} ({' '.join(sys.argv[1:])})\n\n")
+        for sort_key in ("cumulative", "tottime"):
+            f.write(f"=== Top {top} by {sort_key} ===\n")
+            stats.sort_stats(sort_key).print_stats(top)
+    return pstats_path, text_path
+
+
+def run(name, main):
+    """Run main(), under cProfile if profiling was requested."""
+    if not requested():
+        return main()
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(main)
+    finally:
+        pstats_path, text_path = save(name, profiler)
+        print(f"\nProfile saved to {pstats_path}\nSummary in {text_path}", file=sys.stderr)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Query task frontmatter from the index.
+
+Usage:
+    query-tasks.py [FILTER ...] [--count | --json] [--limit N]
+
+Examples:
+    query-tasks.py type=bug tag=cliente
+    query-tasks.py due<today --count
+    query-tasks.py status=in-progress folder=ideas
+    query-tasks.py recurrence=* --json
+
+Filters are combined with AND; see query.py for the syntax. Results come
+from the cached frontmatter index, so no task file is read unless it
+changed since the last run. Searches tasks/, ideas/, bugs/ and import/
+(archived tasks: archive-tasks.py --history).
+"""
+
+import argparse
+import json
+import sys
+
+from config import TASK_FOLDERS, get_tasks_root
+from query import parse_filter, run_query, task_to_dict
+from task_index import TaskIndex
+
+
+def format_task(task):
+    """One line per result: folder/name and the fields that are set."""
+    details = [f"{field}: {getattr(task, field)}"
+               for field in ("type", "due", "status", "recurrence", "completed")
+               if getattr(task, field)]
+    if task.tags:
+        details.append(f"tags: {', '.join(task.tags)}")
+    return f"{task.folder}/{task.name}" + (f"  ({'; '.join(details)})" if details else "")
+
+
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid count '{value}' (expected a whole number, 1 or more)")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query tasks by frontmatter fields.")
+    parser.add_argument("filters", nargs="*", metavar="FILTER",
+                        help="field<op>value, e.g. type=bug tag=cliente due<2026-11-01")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--count", action="store_true", help="print only the number of matches")
+    output.add_argument("--json", action="store_true", help="print the matches as JSON")
+    parser.add_argument("--limit", type=positive_int, help="show at most N matches")
+    args = parser.parse_args()
+
+    try:
+        filters = [parse_filter(text) for text in args.filters]
+    except ValueError as e:
+        parser.error(str(e))
+
+    index = TaskIndex.build(TASK_FOLDERS)
+    tasks = run_query(index, filters)
+
+    if args.count:
+        print(len(tasks))
+        return
+
+    shown = tasks[:args.limit] if args.limit is not None else tasks
+    if args.json:
+        tasks_root = get_tasks_root()
+        json.dump([task_to_dict(task, tasks_root) for task in shown], sys.stdout,
+                  ensure_ascii=False, indent=2)
+        print()
+        return
+
+    for task in shown:
+        print(format_task(task))
+    if len(shown) < len(tasks):
+        print(f"... {len(tasks) - len(shown)} more")
+    print(f"{len(tasks)} match(es)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Frontmatter queries for task-management plugin.
+
+Filters are written as 'field<op>value', for example:
+
+    type=bug  tag=cliente  due<2026-11-01  status=in-progress  recurrence=*
+
+Equality filters on type, tag, status and recurrence are answered from the
+TaskIndex inverted indexes and due ranges from its sorted due dates, so a
+query never reads task files beyond what the (cached) index already holds.
+Other filters only narrow down the tasks those lookups return.
+
+Fields: type, tag, status, recurrence, due, completed, folder.
+Operators: = and != everywhere, plus < <= > >= for due and completed.
+Values: 'today' is today's date for due and completed; '*' matches any
+value and 'none' a missing field. Status matches ignore case and the
+difference between 'in-progress' and 'in progress'.
+"""
+
+import re
+from datetime import date
+
+INDEXED_FIELDS = ("type", "tag", "status", "recurrence")
+DATE_FIELDS = ("due", "completed")
+FIELDS = INDEXED_FIELDS + DATE_FIELDS + ("folder",)
+ORDER_OPS = ("<", "<=", ">", ">=")
+
+FILTER = re.compile(r"^(\w+)\s*(!=|<=|>=|=|<|>)\s*(.*)$")
+
+
+def parse_filter(text):
+    """
+    Parse a 'field<op>value' filter into a (field, op, value) tuple.
+
+    Raises ValueError with a readable message if the filter is invalid.
+    """
+    match = FILTER.match(text.strip())
+    if not match:
+        raise ValueError(f"invalid filter '{text}' (expected field=value, e.g. tag=cliente)")
+    field, op, value = match.groups()
+    value = value.strip()
+    if field not in FIELDS:
+        raise ValueError(f"unknown field '{field}' (fields: {', '.join(FIELDS)})")
+    if op in ORDER_OPS and field not in DATE_FIELDS:
+        raise ValueError(f"'{op}' only works with {' and '.join(DATE_FIELDS)}")
+    if field in DATE_FIELDS and value == "today":
+        value = date.today().isoformat()
+    if op in ORDER_OPS and not re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+        raise ValueError(f"'{field}{op}' needs a YYYY-MM-DD date, got '{value}'")
+    return field, op, value
+
+
+def status_key(value):
+    return value.replace("-", " ").strip().lower()
+
+
+def field_values(task, field):
+    """Return the values of a field on a task, as a tuple."""
+    if field == "tag":
+        return tuple(task.tags)
+    if field == "folder":
+        return (task.folder,)
+    value = getattr(task, field)
+    return (value,) if value else ()
+
+
+def matches(task, field, op, value):
+    """Return True if a task satisfies one parsed filter."""
+    values = field_values(task, field)
+    if value == "*":
+        found = bool(values)
+    elif value == "none":
+        found = not values
+    elif op in ORDER_OPS:
+        # Only valid ISO dates take part in comparisons
+        return any(re.match(r"^\d{4}-\d{2}-\d{2}$", v) and compare(v, op, value) for v in values)
+    elif field == "status":
+        found = status_key(value) in {status_key(v) for v in values}
+    else:
+        found = value in values
+    return found if op == "=" else not found
+
+
+def compare(left, op, right):
+    if op == "<":
+        return left < right
+    if op == "<=":
+        return left <= right
+    if op == ">":
+        return left > right
+    return left >= right
+
+
+def lookup(index, field, op, value):
+    """
+    Return the paths matching a filter via the index, or None if the filter
+    can't be answered from an index lookup.
+    """
+    if value in ("*", "none") or op == "!=":
+        return None
+    if field == "type":
+        tasks = index.by_type(value)
+    elif field == "tag":
+        tasks = index.by_tag(value)
+    elif field == "recurrence":
+        tasks = index.by_recurrence(value)
+    elif field == "status":
+        # Same normalization as matches(): every stored spelling of the status
+        key = status_key(value)
+        tasks = [task for status in index.statuses() if status_key(status) == key
+                 for task in index.by_status(status)]
+    elif field == "due":
+        if op == "=":
+            tasks = index.by_due(value, folder=None)
+        elif op in ("<", "<="):
+            tasks = index.due_between(None, value, folder=None)
+        else:
+            tasks = index.due_between(value, None, folder=None)
+        if op in ("<", ">"):
+            tasks = [t for t in tasks if t.due != value]
+    else:
+        return None
+    return {task.path for task in tasks}
+
+
+def run_query(index, filters):
+    """
+    Return the tasks matching every parsed filter, sorted by path.
+
+    Index lookups are intersected first; the remaining filters are checked
+    on the tasks left.
+    """
+    paths = None
+    remaining = []
+    for field, op, value in filters:
+        found = lookup(index, field, op, value)
+        if found is None:
+            remaining.append((field, op, value))
+        else:
+            paths = found if paths is None else paths & found
+        if paths is not None and not paths:
+            return []
+
+    tasks = [index.get(path) for path in sorted(paths)] if paths is not None else list(index)
+    return [
+        task for task in tasks
+        if all(matches(task, field, op, value) for field, op, value in remaining)
+    ]
+
+
+def task_to_dict(task, tasks_root):
+    """Return the JSON form of a query result."""
+    return {
+        "name": task.name,
+        "folder": task.folder,
+        "path": str(task.path.relative_to(tasks_root)),
+        "type": task.type,
+        "due": task.due,
+        "completed": task.completed,
+        "status": task.status,
+        "recurrence": task.recurrence,
+        "tags": list(task.tags),
+    }
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Recurring task stage for task-management plugin.
+
+For each recurring task WITH a completed: field:
+1. Calculate next due date based on recurrence type
+2. Update due: field in frontmatter
+3. Remove completed: field from frontmatter
+4. Add completion entry to ## History section
+
+Recurring tasks WITHOUT completed: field are NOT touched,
+even if overdue - they should appear in "Atrasadas" until
+the user explicitly marks them as done.
+"""
+
+import re
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+
+from frontmatter import read_body, read_frontmatter, write_frontmatter
+from task_index import parse_task_file
+
+
+# Fixed-length recurrences, in days
+DAY_PERIODS = {
+    'daily': 1,
+    'weekly': 7,
+    'biweekly': 14,
+}
+
+# Calendar recurrences, in months
+MONTH_PERIODS = {
+    'monthly': 1,
+    'quarterly': 3,
+    'yearly': 12,
+}
+
+# Clamped days stop changing after this many month steps: by then every
+# reachable month length, including a non-leap February, has been seen
+MAX_CLAMP_STEPS = 48
+
+
+def _month_index(d):
+    return d.year * 12 + d.month - 1
+
+
+def _month_length(month_index):
+    year, month = divmod(month_index, 12)
+    return monthrange(year, month + 1)[1]
+
+
+def _month_date(month_index, day):
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, day)
+
+
+def add_months(d, months):
+    """Add months to a date, clamping the day to the target month's length."""
+    month_index = _month_index(d) + months
+    return _month_date(month_index, min(d.day, _month_length(month_index)))
+
+
+def _jump_months(start, step, today):
+    """
+    Return the first date after today reached by adding step months to start.
+
+    Adding months one period at a time clamps the day to each month's
+    length and the clamped day carries over (Jan 31 -> Feb 28 -> Mar 28).
+    The step count is computed directly and the carried day is the smallest
+    month length passed on the way, so the cost doesn't grow with the gap.
+    """
+    start_index = _month_index(start)
+    steps = max(1, -(-(_month_index(today) - start_index) // step))
+
+    def occurrence(k):
+        day = start.day
+        for j in range(1, min(k, MAX_CLAMP_STEPS) + 1):
+            day = min(day, _month_length(start_index + j * step))
+        return _month_date(start_index + k * step, day)
+
+    next_due = occurrence(steps)
+    if next_due <= today:
+        next_due = occurrence(steps + 1)
+    return next_due
+
+
+def calculate_next_due(current_due, recurrence, recurrence_day=None, today=None):
+    """
+    Calculate next due date based on recurrence type.
+
+    Returns the first occurrence after today as YYYY-MM-DD. Dormant tasks
+    are caught up arithmetically instead of one period at a time. Unknown
+    recurrences are treated as weekly. today defaults to the current date.
+    """
+    if today is None:
+        today = date.today()
+    due_date = datetime.strptime(current_due, '%Y-%m-%d').date()
+
+    if recurrence in MONTH_PERIODS:
+        step = MONTH_PERIODS[recurrence]
+        next_due = add_months(due_date, step)
+        if recurrence == 'monthly' and recurrence_day:
+            try:
+                next_due = next_due.replace(day=int(recurrence_day))
+            except ValueError:
+                pass
+        # If next_due is still in the past, jump to the first future occurrence
+        if next_due <= today:
+            next_due = _jump_months(next_due, step, today)
+    else:
+        step = DAY_PERIODS.get(recurrence, 7)
+        next_due = due_date + timedelta(days=step)
+        if next_due <= today:
+            periods = (today - next_due).days // step + 1
+            next_due += timedelta(days=periods * step)
+
+    return next_due.strftime('%Y-%m-%d')
+
+
+def occurrences(current_due, recurrence, recurrence_day, start, end):
+    """
+    Yield the future occurrences of a recurring task from start to end.
+
+    Occurrences come after current_due (YYYY-MM-DD) and fall within the
+    inclusive date range, assuming each one is completed on its due date.
+    """
+    # Jump straight to the first occurrence on or after start
+    next_due = calculate_next_due(current_due, recurrence, recurrence_day,
+                                  start - timedelta(days=1))
+    while next_due <= str(end):
+        yield datetime.strptime(next_due, '%Y-%m-%d').date()
+        next_due = calculate_next_due(next_due, recurrence, recurrence_day,
+                                      datetime.strptime(next_due, '%Y-%m-%d').date())
+
+
+def parse_frontmatter(file_path):
+    """
+    Read YAML frontmatter from a file without reading its body.
+
+    Returns (frontmatter, body_offset), or (None, 0) without frontmatter.
+    """
+    lines, body_offset = read_frontmatter(file_path)
+    if lines is None:
+        return None, 0
+
+    return '\n'.join(lines).strip(), body_offset
+
+
+def update_frontmatter(frontmatter, new_due):
+    """Update due: field and remove completed: field from frontmatter."""
+    lines = frontmatter.split('\n')
+    new_lines = []
+    for line in lines:
+        if line.startswith('due:'):
+            new_lines.append(f'due: {new_due}')
+        elif line.startswith('completed:'):
+            # Remove completed: field
+            continue
+        else:
+            new_lines.append(line)
+    return '\n'.join(new_lines)
+
+
+def add_history_entry(body, completed_date):
+    """Add completion entry to History section."""
+    history_pattern = r'(## History\n)(.*?)(?=\n## |\Z)'
+
+    if '## History' in body:
+        def replace_history(match):
+            header = match.group(1)
+            existing = match.group(2)
+            new_entry = f'- {completed_date}: Completado\n'
+            return header + new_entry + existing
+
+        body = re.sub(history_pattern, replace_history, body, flags=re.DOTALL)
+    else:
+        body = body.rstrip() + f'\n\n## History\n- {completed_date}: Completado\n'
+
+    return body
+
+
+def process_recurring_tasks(index, today=None):
+    """
+    Process recurring tasks that have been marked as completed.
+
+    Only indexed tasks with both recurrence: and completed: are opened.
+    Updated files are re-parsed into the index. Next due dates are computed
+    relative to today (defaults to the current date, read once).
+    """
+    if today is None:
+        today = date.today()
+    updated = []
+
+    for task in index.in_folder("tasks"):
+        if task.recurrence is None or task.completed is None:
+            continue
+
+        task_file = task.path
+
+        frontmatter, body_offset = parse_frontmatter(task_file)
+        if not frontmatter:
+            continue
+
+        # Must be a recurring task
+        if 'recurrence:' not in frontmatter:
+            continue
+
+        # Must have completed: field (user marked it as done)
+        if 'completed:' not in frontmatter:
+            continue
+
+        # Extract completed date
+        completed_match = re.search(r'^completed:\s*(\d{4}-\d{2}-\d{2})', frontmatter, re.MULTILINE)
+        if not completed_match:
+            continue
+
+        completed_date = completed_match.group(1)
+
+        # Extract due date
+        due_match = re.search(r'^due:\s*(\d{4}-\d{2}-\d{2})', frontmatter, re.MULTILINE)
+        if not due_match:
+            continue
+
+        due_str = due_match.group(1)
+
+        # Extract recurrence type
+        recurrence_match = re.search(r'^recurrence:\s*(\w+)', frontmatter, re.MULTILINE)
+        if not recurrence_match:
+            continue
+
+        recurrence = recurrence_match.group(1).lower()
+
+        # Extract recurrence_day if present
+        recurrence_day = None
+        day_match = re.search(r'^recurrence_day:\s*(\d+)', frontmatter, re.MULTILINE)
+        if day_match:
+            recurrence_day = day_match.group(1)
+
+        # Calculate next due date
+        next_due = calculate_next_due(due_str, recurrence, recurrence_day, today)
+
+        # Update frontmatter (new due, remove completed)
+        new_frontmatter = update_frontmatter(frontmatter, next_due)
+
+        # Add history entry
+        body = read_body(task_file, body_offset)
+        new_body = add_history_entry(body, completed_date)
+
+        # Write updated content
+        write_frontmatter(task_file, new_frontmatter.split('\n'), body_offset, body=new_body)
+        index.add(parse_task_file(task_file, task.folder))
+
+        updated.append({
+            'file': task_file.name,
+            'completed': completed_date,
+            'new_due': next_due,
+            'recurrence': recurrence
+        })
+
+    return updated
+
+
+def print_report(updated):
+    """Print the result of process_recurring_tasks()."""
+    if updated:
+        print(f"Updated {len(updated)} recurring task(s):\n")
+        for task in updated:
+            print(f"  - {task['file']}")
+            print(f"    Completada: {task['completed']} → Próxima: {task['new_due']} ({task['recurrence']})")
+    else:
+        print("No completed recurring tasks to update.")
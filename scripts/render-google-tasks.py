@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Render today.md, this-week.md, next-week.md and status.json from Google Tasks.
+
+Usage:
+    render-google-tasks.py [LIST=FILE ...] [--today YYYY-MM-DD] [--output-dir DIR]
+
+Each LIST=FILE is the raw JSON returned by list_tasks for one task list;
+LIST is the list's id or name in google_tasks.lists (config.yaml), which
+maps it to an area; a list missing from the config uses LIST itself as
+area, so passing names keeps the headings readable. FILE may be '-' for
+stdin. With no sources, stdin
+must be a JSON object mapping list ids or names to their responses:
+
+    {"Trabajo": {"items": [...]}, "Personal": {"items": [...]}}
+
+If calendar.enabled is set, the events in the local calendar cache (see
+calendar-cache.py) are merged into the views; days the cache is missing
+or holds expired are reported, and --no-calendar leaves events out.
+
+status.json also lists the recurring tasks, which are still local task
+files (tasks/ with a recurrence: field).
+
+--today renders for a fixed day, so saved responses always give the same
+output. Views are only rewritten when their content changed.
+"""
+
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from calendar_cache import events_by_day, load_cache, stale_ranges
+from config import get_tasks_root, load_config
+from dates import get_week_dates
+from fileio import write_if_changed
+from gtasks import (
+    area_order,
+    load_tasks,
+    read_responses,
+    render_next_week,
+    render_status,
+    render_this_week,
+    render_today,
+)
+from task_index import TaskIndex
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+
+
+def load_calendar(dates, config):
+    """Return {date: event lines} from the calendar cache, warning about stale days."""
+    cache = load_cache()
+    start = date.fromisoformat(dates['today'])
+    end = date.fromisoformat(dates['next_week_end'])
+    ttl = timedelta(minutes=config.calendar_cache_ttl)
+    for first, last in stale_ranges(cache, start, end, ttl):
+        print(f"Warning: calendar cache missing or expired for {first} to {last} "
+              "(see calendar-cache.py stale)", file=sys.stderr)
+    return events_by_day(cache, start, end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the daily views from Google Tasks list_tasks JSON.")
+    parser.add_argument("sources", nargs="*", metavar="LIST=FILE",
+                        help="list id or name and its list_tasks JSON ('-' for stdin)")
+    parser.add_argument("--today", type=parse_date, help="render for this day (default: today)")
+    parser.add_argument("--output-dir", type=Path, help="where to write the views (default: tasks_root)")
+    parser.add_argument("--no-calendar", action="store_true", help="leave calendar events out")
+    args = parser.parse_args()
+
+    try:
+        responses = read_responses(args.sources, sys.stdin)
+        config = load_config()
+        lists = config.google_task_lists
+        tasks = load_tasks(responses, lists)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    dates = get_week_dates(args.today)
+    areas = area_order(lists, tasks)
+    calendar = load_calendar(dates, config) if config.calendar_enabled and not args.no_calendar else None
+    output_dir = args.output_dir or get_tasks_root()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"Loaded {len(tasks)} pending task(s) with a due date from {len(responses)} list(s)")
+    if calendar is not None:
+        print(f"Calendar: events on {len(calendar)} day(s) from the cache")
+    print(f"Today: {dates['today_weekday']}, {dates['today_formatted']} ({dates['today']})\n")
+
+    views = (("today.md", render_today), ("this-week.md", render_this_week),
+             ("next-week.md", render_next_week))
+    outputs = [(filename, render(tasks, dates, areas, calendar)) for filename, render in views]
+    # Recurring tasks still live in local task files
+    recurring = TaskIndex.build(("tasks",)).recurring()
+    outputs.append(("status.json", render_status(tasks, dates, recurring)))
+    for filename, (content, summary) in outputs:
+        details = ", ".join(f"{value} {key.replace('_', ' ')}" for key, value in summary.items())
+        updated = write_if_changed(output_dir / filename, content)
+        print(f"{filename}: {details}{'' if updated else ' (unchanged, not rewritten)'}")
+
+
+if __name__ == "__main__":
+    main()
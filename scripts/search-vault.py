@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Search the contents of the vault.
+
+Usage:
+    search-vault.py QUERY... [--folder NAME ...] [--limit N] [--json]
+    search-vault.py --rebuild
+
+Examples:
+    search-vault.py rfid presupuesto
+    search-vault.py "decision cliente" --folder transcripciones
+    search-vault.py factur* --limit 5 --json
+
+Every word must appear in a file (accents and case are ignored; 'word*'
+matches prefixes). The index (see search_index.py) is brought up to date
+first, re-reading only the files that changed since the last search.
+Prints the best matches, most relevant first, with a snippet of each.
+"""
+
+import argparse
+import json
+import sys
+
+import metrics
+import profiling
+from config import load_config
+from search_index import INDEX_FILENAME, SearchIndex, search_folders
+
+
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"invalid count '{value}' (expected a whole number, 1 or more)")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over the vault.")
+    parser.add_argument("query", nargs="*", help="words to search for")
+    parser.add_argument("--folder", action="append", metavar="NAME",
+                        help="only search this folder (tasks, ideas, memories, transcripciones...); repeatable")
+    parser.add_argument("--limit", type=positive_int, default=10, help="show at most N results (default: 10)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the index from scratch")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.query and not args.rebuild:
+        parser.error("nothing to search for")
+
+    config = load_config()
+    folders = search_folders(config)
+    unknown = set(args.folder or ()) - set(folders)
+    if unknown:
+        parser.error(f"unknown folder(s): {', '.join(sorted(unknown))} "
+                     f"(available: {', '.join(folders)})")
+
+    if args.rebuild:
+        (config.tasks_root / INDEX_FILENAME).unlink(missing_ok=True)
+
+    index = SearchIndex.open(config.tasks_root)
+    try:
+        stages = [metrics.run_stage("index", index.update, folders)]
+        if args.query:
+            stages.append(metrics.run_stage("search", index.search, " ".join(args.query),
+                                            args.folder, args.limit))
+    finally:
+        index.close()
+
+    update = stages[0]['result']
+    changes = update['added'] + update['updated'] + update['removed']
+    if args.rebuild or changes:
+        print(f"Index: {update['scanned']} file(s), {update['added']} added, "
+              f"{update['updated']} updated, {update['removed']} removed", file=sys.stderr)
+
+    if args.query:
+        results = stages[1]['result']
+        if args.json:
+            json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+        elif not results:
+            print("No matches.")
+        else:
+            for result in results:
+                print(f"{result['path']}  ({result['title']})")
+                print(f"    {result['snippet']}")
+            print(f"{len(results)} result(s)")
+
+    metrics.report("search-vault", stages, args)
+
+
+if __name__ == "__main__":
+    profiling.run("search-vault", main)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Full-text search index for task-management plugin.
+
+Every .md file in the folders of config.yaml (tasks, ideas, memories,
+completed...) and in transcripciones/ is indexed in an SQLite FTS5 table
+in .search-index.sqlite under tasks_root. The unicode61 tokenizer with
+remove_diacritics folds accents and case, so 'decision' finds 'Decisión'.
+Only the text after the frontmatter is indexed as the body, so field
+names and values (status, due dates...) don't match every search; the
+frontmatter tags get a column of their own.
+
+The index is incremental: each run compares the mtime and size of every
+file with the stored ones and only re-reads new and changed files, and
+drops the ones that are gone. Results are ranked with bm25, title matches
+weighing more than body matches, and come with a snippet around the hit.
+"""
+
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+from frontmatter import read_body, read_frontmatter
+from metrics import count
+from task_index import parse_frontmatter_fields
+
+INDEX_FILENAME = ".search-index.sqlite"
+
+# Bump when the schema or the tokenizer change
+SCHEMA_VERSION = 2
+
+# Indexed besides the folders listed in config.yaml; transcribir writes
+# its transcripts to transcripciones/ by default
+EXTRA_FOLDERS = ("transcripciones",)
+
+# bm25 weights for (path, folder, title, tags, body); path and folder are not indexed
+TITLE_WEIGHT = 10.0
+TAGS_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+
+SNIPPET_TOKENS = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    folder TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    path UNINDEXED, folder UNINDEXED, title, tags, body,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+HEADING = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+
+def search_folders(config):
+    """Return {folder name: directory} of the folders to index."""
+    names = list(config.data.get("folders") or ())
+    names += [name for name in EXTRA_FOLDERS if name not in names]
+    return {name: config.folder(name) for name in names}
+
+
+def scan_folder(directory):
+    """
+    Yield (path, mtime_ns, size) for the .md files under directory,
+    recursively, skipping hidden files and folders.
+    """
+    try:
+        entries = list(os.scandir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from scan_folder(entry.path)
+        elif entry.name.endswith('.md') and entry.is_file():
+            count("files_scanned")
+            st = entry.stat()
+            yield entry.path, st.st_mtime_ns, st.st_size
+
+
+def extract_title(path, text):
+    """The first '# ' heading of a file, or its name."""
+    match = HEADING.search(text)
+    return match.group(1).strip() if match else Path(path).stem
+
+
+def read_document(path):
+    """
+    Return (tags, body) of a file: its frontmatter tags and the text after
+    the frontmatter (the whole text if it has none).
+    """
+    lines, body_offset = read_frontmatter(path)
+    tags = parse_frontmatter_fields(lines)[1] if lines is not None else []
+    # Undecodable bytes become U+FFFD; SQLite only takes valid UTF-8
+    body = read_body(path, body_offset).encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
+    return tags, body
+
+
+def build_match_query(text):
+    """
+    Turn free text into an FTS5 query: every word must appear, in any
+    order. Words ending in '*' match as prefixes; FTS5 operators and
+    punctuation are treated as plain text.
+    """
+    terms = []
+    for word in re.findall(r"[\w*]+", text):
+        prefix = word.endswith('*')
+        word = word.strip('*')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """SQLite FTS5 index over the vault's markdown files."""
+
+    def __init__(self, conn, tasks_root):
+        self.conn = conn
+        self.tasks_root = Path(tasks_root)
+
+    @classmethod
+    def open(cls, tasks_root, path=None):
+        """Open (or create) the index under tasks_root."""
+        conn = sqlite3.connect(str(path or Path(tasks_root) / INDEX_FILENAME))
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS docs;")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        conn.commit()
+        return cls(conn, tasks_root)
+
+    def _relative(self, path):
+        return os.path.relpath(path, self.tasks_root)
+
+    def update(self, folders):
+        """
+        Bring the index up to date with folders ({name: directory}).
+
+        Returns a dict with the number of files 'scanned', 'added',
+        'updated' and 'removed'.
+        """
+        stored = {path: (file_id, mtime_ns, size) for file_id, path, mtime_ns, size
+                  in self.conn.execute("SELECT id, path, mtime_ns, size FROM files")}
+        stats = {'scanned': 0, 'added': 0, 'updated': 0, 'removed': 0}
+        seen = set()
+
+        with self.conn:
+            for folder, directory in folders.items():
+                for full_path, mtime_ns, size in scan_folder(directory):
+                    path = self._relative(full_path)
+                    seen.add(path)
+                    stats['scanned'] += 1
+                    previous = stored.get(path)
+                    if previous and previous[1:] == (mtime_ns, size):
+                        continue
+                    try:
+                        tags, body = read_document(full_path)
+                    except OSError as e:
+                        print(f"Warning: could not index {path} ({e})", file=sys.stderr)
+                        continue
+                    count("files_parsed")
+                    if previous:
+                        self._delete(previous[0])
+                        stats['updated'] += 1
+                    else:
+                        stats['added'] += 1
+                    file_id = self.conn.execute(
+                        "INSERT INTO files (path, folder, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                        (path, folder, mtime_ns, size)).lastrowid
+                    self.conn.execute(
+                        "INSERT INTO docs (rowid, path, folder, title, tags, body) VALUES (?, ?, ?, ?, ?, ?)",
+                        (file_id, path, folder, extract_title(full_path, body), " ".join(tags), body))
+
+            for path in stored.keys() - seen:
+                self._delete(stored[path][0])
+                stats['removed'] += 1
+        return stats
+
+    def _delete(self, file_id):
+        self.conn.execute("DELETE FROM docs WHERE rowid = ?", (file_id,))
+        self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def search(self, text, folders=None, limit=10):
+        """
+        Return the best matches for text as dicts with path (relative to
+        tasks_root), folder, title, score (lower is better) and snippet.
+        folders optionally restricts the results to some folder names.
+        """
+        query = build_match_query(text)
+        if not query:
+            return []
+        sql = (f"SELECT path, folder, title, "
+               f"bm25(docs, 0, 0, {TITLE_WEIGHT}, {TAGS_WEIGHT}, {BODY_WEIGHT}) AS score, "
+               f"snippet(docs, 4, '**', '**', '…', {SNIPPET_TOKENS}) "
+               f"FROM docs WHERE docs MATCH ?")
+        params = [query]
+        if folders:
+            sql += f" AND folder IN ({', '.join('?' for _ in folders)})"
+            params += list(folders)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        return [
+            {'path': path, 'folder': folder, 'title': title, 'score': round(score, 4),
+             'snippet': " ".join(snippet.split())}
+            for path, folder, title, score, snippet in self.conn.execute(sql, params)
+        ]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+In-memory index of task frontmatter for task-management plugin.
+
+Every task file is parsed exactly once per run; the daily views are then
+rendered from lookups on the index instead of grepping the vault.
+"""
+
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from config import get_folder, load_config
+from frontmatter import read_frontmatter
+from index_cache import IndexCache
+from metrics import count
+
+# Tags that mark a task as part of the research system
+RESEARCH_TAGS = ("research-review", "research-summary-needed")
+
+# Frontmatter fields kept in the index
+FIELDS = ("type", "due", "completed", "recurrence", "recurrence_day", "status")
+
+# Date fields rewritten by normalize-dates.py
+DATE_FIELDS = ("due", "completed", "created", "updated")
+
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}\Z')
+
+
+class Task:
+    """Frontmatter fields of a single task file."""
+
+    __slots__ = ("path", "name", "folder", "tags", "non_iso_dates") + FIELDS
+
+    def __init__(self, path, folder, fields=None, tags=(), non_iso_dates=False):
+        fields = fields or {}
+        self.path = path
+        self.name = path.stem
+        self.folder = folder
+        self.tags = tuple(tags)
+        # True if any date field in the header is not already YYYY-MM-DD
+        self.non_iso_dates = non_iso_dates
+        for field in FIELDS:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_record(cls, path, record):
+        """Rebuild a Task from a cache record (see index_cache.py)."""
+        return cls(path, record["folder"], record["fields"], record["tags"],
+                   record["non_iso_dates"])
+
+    @property
+    def is_research(self):
+        """Return True if the task carries one of the research tags."""
+        return any(tag in RESEARCH_TAGS for tag in self.tags)
+
+    @property
+    def due_date(self):
+        """Return the due date as a date, or None if missing or not ISO."""
+        if not self.due:
+            return None
+        try:
+            return datetime.strptime(self.due, '%Y-%m-%d').date()
+        except ValueError:
+            return None
+
+
+def parse_tags(value):
+    """Parse an inline tags value: '[a, b]', 'a, b' or 'a'."""
+    value = value.strip().strip('[]')
+    return [t.strip().strip('"\'') for t in value.split(',') if t.strip()]
+
+
+def parse_frontmatter_fields(lines):
+    """
+    Parse frontmatter lines into (fields, tags, non_iso_dates).
+
+    Only top-level 'key: value' lines are read. Tags may be written inline
+    (tags: [a, b]) or as a YAML block list (  - a).
+    """
+    fields = {}
+    tags = []
+    in_tags = False
+    non_iso_dates = False
+
+    for line in lines:
+        if in_tags:
+            stripped = line.strip()
+            if stripped.startswith('- '):
+                tags.append(stripped[2:].strip().strip('"\''))
+                continue
+            if line.startswith((' ', '\t')) or not stripped:
+                continue
+            in_tags = False
+
+        if ':' not in line or line.startswith((' ', '\t')):
+            continue
+
+        key, raw_value = line.split(':', 1)
+        key = key.strip()
+        value = raw_value.strip()
+
+        if key in DATE_FIELDS and value and not ISO_DATE.match(raw_value.lstrip()):
+            non_iso_dates = True
+
+        if key == 'tags':
+            if value:
+                tags.extend(parse_tags(value))
+            else:
+                in_tags = True
+        elif key in FIELDS:
+            fields[key] = value
+
+    return fields, tags, non_iso_dates
+
+
+def parse_task_file(file_path, folder):
+    """Parse a task file into a Task (files without frontmatter get no fields)."""
+    lines, _ = read_frontmatter(file_path)
+    if lines is None:
+        return Task(file_path, folder)
+    fields, tags, non_iso_dates = parse_frontmatter_fields(lines)
+    return Task(file_path, folder, fields, tags, non_iso_dates)
+
+
+def entry_stat_key(entry):
+    """Return the (mtime_ns, size, inode) cache key of a DirEntry."""
+    st = entry.stat()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def map_files(func, args, workers=1, processes=False):
+    """
+    Return [func(*a) for a in args], optionally computed on a worker pool.
+
+    Threads are used for I/O-bound work; processes=True runs func in worker
+    processes (func and its arguments must be picklable). Results keep the
+    order of args either way, so output built from them is deterministic.
+    """
+    if workers <= 1 or len(args) < 2:
+        return [func(*a) for a in args]
+
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    chunksize = max(1, len(args) // (workers * 4))
+    with executor_class(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*args), chunksize=chunksize))
+
+
+def scan_folder(folder):
+    """Yield a DirEntry for each .md file in a config folder."""
+    folder_dir = get_folder(folder)
+    if not folder_dir.exists():
+        return
+    with os.scandir(folder_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.md') and entry.is_file():
+                count("files_scanned")
+                yield entry
+
+
+class TaskIndex:
+    """Lookups by due date, type, tag, status and recurrence over parsed task files."""
+
+    def __init__(self, tasks=()):
+        self._tasks = {}
+        self._by_due = defaultdict(set)
+        self._by_type = defaultdict(set)
+        self._by_tag = defaultdict(set)
+        self._by_status = defaultdict(set)
+        self._by_recurrence = defaultdict(set)
+        # Sorted valid YYYY-MM-DD due keys, rebuilt lazily after changes
+        self._due_keys = None
+        for task in tasks:
+            self.add(task)
+
+    @classmethod
+    def build(cls, folders=("tasks", "ideas"), use_cache=True):
+        """
+        Index every .md file in the given config folders.
+
+        With use_cache, entries are loaded from the on-disk cache and only
+        files whose mtime, size or inode changed are parsed again. Large
+        vaults are scanned on the worker pool configured in config.yaml.
+        """
+        config = load_config()
+        entries = [(entry, folder) for folder in folders for entry in scan_folder(folder)]
+
+        processes = config.scan_processes
+
+        def workers(count):
+            # Small batches run serially, where pool overhead would dominate
+            return config.scan_workers if count >= config.parallel_threshold else 1
+
+        cache = IndexCache.open(config.tasks_root) if use_cache else None
+        if cache is None:
+            to_parse = [(Path(entry.path), folder) for entry, folder in entries]
+            count("files_parsed", len(to_parse))
+            return cls(map_files(parse_task_file, to_parse, workers(len(to_parse)), processes))
+
+        try:
+            cached = cache.load(folders)
+            stat_keys = map_files(entry_stat_key, [(entry,) for entry, _ in entries],
+                                  workers(len(entries)))
+
+            tasks = []
+            to_parse = []
+            parsed_keys = []
+            for (entry, folder), stat_key in zip(entries, stat_keys):
+                hit = cached.pop(entry.path, None)
+                if hit is not None and hit[0] == stat_key:
+                    tasks.append(Task.from_record(Path(entry.path), hit[1]))
+                    continue
+                to_parse.append((Path(entry.path), folder))
+                parsed_keys.append(stat_key)
+
+            count("files_parsed", len(to_parse))
+            parsed = map_files(parse_task_file, to_parse, workers(len(to_parse)), processes)
+            tasks.extend(parsed)
+            # Whatever is left in the cache was deleted or moved away
+            cache.update(zip(parsed_keys, parsed), deleted=cached.keys())
+        finally:
+            cache.close()
+        return cls(tasks)
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __iter__(self):
+        return iter(self._sorted(self._tasks.values()))
+
+    def add(self, task):
+        """Add a task to the index, replacing any entry for the same path."""
+        self.remove(task.path)
+        self._tasks[task.path] = task
+        if task.due:
+            self._by_due[task.due].add(task.path)
+            self._due_keys = None
+        if task.type:
+            self._by_type[task.type].add(task.path)
+        for tag in task.tags:
+            self._by_tag[tag].add(task.path)
+        if task.status:
+            self._by_status[task.status].add(task.path)
+        if task.recurrence:
+            self._by_recurrence[task.recurrence].add(task.path)
+
+    def remove(self, path):
+        """Drop the entry for a path, if any."""
+        task = self._tasks.pop(path, None)
+        if task is None:
+            return
+        if task.due:
+            self._by_due[task.due].discard(path)
+            self._due_keys = None
+        if task.type:
+            self._by_type[task.type].discard(path)
+        for tag in task.tags:
+            self._by_tag[tag].discard(path)
+        if task.status:
+            self._by_status[task.status].discard(path)
+        if task.recurrence:
+            self._by_recurrence[task.recurrence].discard(path)
+
+    def get(self, path):
+        """Return the task for a path, or None."""
+        return self._tasks.get(path)
+
+    def _select(self, paths, folder):
+        tasks = (self._tasks[p] for p in paths)
+        if folder:
+            tasks = (t for t in tasks if t.folder == folder)
+        return self._sorted(tasks)
+
+    @staticmethod
+    def _sorted(tasks):
+        return sorted(tasks, key=lambda t: t.path)
+
+    def in_folder(self, folder):
+        """Return all tasks from a folder, sorted by filename."""
+        return self._select(self._tasks, folder)
+
+    def by_due(self, date, folder="tasks"):
+        """Return tasks due on a date (YYYY-MM-DD), sorted by filename."""
+        return self._select(self._by_due.get(date, ()), folder)
+
+    def _sorted_due_keys(self):
+        """Return the valid YYYY-MM-DD due dates in use, sorted."""
+        if self._due_keys is None:
+            keys = []
+            for due, due_paths in self._by_due.items():
+                if due_paths and ISO_DATE.match(due):
+                    try:
+                        datetime.strptime(due, '%Y-%m-%d')
+                    except ValueError:
+                        # Invalid date format, skip
+                        continue
+                    keys.append(due)
+            self._due_keys = sorted(keys)
+        return self._due_keys
+
+    def _due_key_range(self, start=None, end=None):
+        # ISO dates sort as strings, so the range is found by bisection
+        keys = self._sorted_due_keys()
+        lo = bisect_left(keys, start) if start else 0
+        hi = bisect_right(keys, end) if end else len(keys)
+        return keys[lo:hi]
+
+    def due_between(self, start, end, folder="tasks"):
+        """
+        Return tasks due from start to end (YYYY-MM-DD, inclusive).
+
+        Sorted by due date, then filename.
+        """
+        tasks = []
+        for due in self._due_key_range(start, end):
+            tasks.extend(self._select(self._by_due[due], folder))
+        return tasks
+
+    def overdue(self, today, folder="tasks"):
+        """Return tasks with a valid due date before today, sorted by filename."""
+        keys = self._sorted_due_keys()
+        paths = []
+        for due in keys[:bisect_left(keys, today)]:
+            paths.extend(self._by_due[due])
+        return self._select(paths, folder)
+
+    def by_type(self, type_, folder=None):
+        """Return tasks with a given type: value, sorted by filename."""
+        return self._select(self._by_type.get(type_, ()), folder)
+
+    def by_tag(self, tag, folder=None):
+        """Return tasks carrying a tag, sorted by filename."""
+        return self._select(self._by_tag.get(tag, ()), folder)
+
+    def by_status(self, status, folder=None):
+        """Return tasks with a given status, sorted by filename."""
+        return self._select(self._by_status.get(status, ()), folder)
+
+    def statuses(self):
+        """Return the distinct status: values in the index."""
+        return [status for status, paths in self._by_status.items() if paths]
+
+    def by_recurrence(self, recurrence, folder=None):
+        """Return tasks with a given recurrence: value, sorted by filename."""
+        return self._select(self._by_recurrence.get(recurrence, ()), folder)
+
+    def recurring(self, folder="tasks"):
+        """Return tasks with a recurrence: field, sorted by filename."""
+        paths = set()
+        for recurrence_paths in self._by_recurrence.values():
+            paths.update(recurrence_paths)
+        return self._select(paths, folder)
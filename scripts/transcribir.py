@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Transcribe a meeting recording to markdown (see transcription.py).
+
+Usage:
+    transcribir.py <video> <output_dir> <tema> [--backend NAME] [--no-cache] [--keep-work]
+
+The audio is transcribed in overlapping chunks, several at a time, and
+every finished chunk is checkpointed: re-running the same command after a
+crash or Ctrl-C only transcribes the chunks that are missing. A recording
+that was already transcribed (same content, any name or folder) comes
+from the transcription cache and is only rendered again; --no-cache
+transcribes it anew.
+
+Prints TRANSCRIPCION_ARCHIVO / _DURACION / _FECHA / _HORA lines at the end
+for /task-management:transcribir.
+"""
+
+import argparse
+import re
+import sys
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+
+from fileio import atomic_open
+from transcription import BACKENDS, TranscriptionError, get_backend, render_transcript, transcribe_recording
+
+
+def slugify(text):
+    """'Revisión diseño' -> 'revisión-diseño' (letters, digits and dashes)."""
+    text = unicodedata.normalize("NFC", text.strip().lower()).replace(" ", "-")
+    return re.sub(r"[^\w-]", "", text).replace("_", "")
+
+
+def render_markdown(tema, now, duration_minutes, video, transcript):
+    return (f"# Reunión: {tema}\n"
+            f"- **Fecha**: {now:%Y-%m-%d %H:%M}\n"
+            f"- **Duración**: {duration_minutes} min\n"
+            f"- **Archivo origen**: {video.name}\n"
+            f"\n---\n\n## Transcripción\n\n{transcript}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe a meeting recording to markdown.")
+    parser.add_argument("video", type=Path)
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("tema")
+    parser.add_argument("--backend", choices=sorted(BACKENDS),
+                        help="transcription backend (default: transcription.backend or gladia)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="transcribe again even if the recording is in the cache")
+    parser.add_argument("--keep-work", action="store_true",
+                        help="keep the chunk checkpoints after a successful run")
+    args = parser.parse_args()
+
+    if not args.video.is_file():
+        print(f"ERROR: No existe el archivo: {args.video}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        # The default backend is only created when chunks are left to
+        # transcribe, so cached or fully resumed recordings need no API key
+        backend = get_backend(args.backend) if args.backend else None
+        result = transcribe_recording(args.video, backend, keep_work=args.keep_work,
+                                      use_cache=not args.no_cache)
+    except TranscriptionError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        print("Los fragmentos ya transcritos se conservan; vuelve a ejecutar para reanudar.",
+              file=sys.stderr)
+        sys.exit(1)
+
+    if not result['utterances']:
+        print("ERROR: No se obtuvo transcripción", file=sys.stderr)
+        sys.exit(1)
+
+    now = datetime.now()
+    duration_minutes = int(result['duration']) // 60
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = args.output_dir / f"{now:%Y-%m-%d}-{slugify(args.tema)}.md"
+    with atomic_open(output_file, "w", encoding="utf-8") as f:
+        f.write(render_markdown(args.tema, now, duration_minutes, args.video,
+                                render_transcript(result['utterances'])))
+
+    print(f"Duración: {duration_minutes} minutos, {result['chunks']} fragmento(s)")
+    print("---")
+    print(f"TRANSCRIPCION_ARCHIVO={output_file}")
+    print(f"TRANSCRIPCION_DURACION={duration_minutes}")
+    print(f"TRANSCRIPCION_FECHA={now:%Y-%m-%d}")
+    print(f"TRANSCRIPCION_HORA={now:%H:%M}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Meeting transcription pipeline for task-management plugin.
+
+A recording is transcribed in overlapping chunks instead of one long
+upload:
+
+1. The audio track is extracted once with ffmpeg.
+2. It is split into chunks of transcription.chunk_minutes, each padded
+   with transcription.overlap_seconds of audio on both sides, so a turn
+   cut by a chunk boundary is still heard whole by one of them.
+3. Chunks are transcribed concurrently, at most transcription.workers at
+   a time. Every finished chunk is saved to the work directory
+   (transcription-work/ next to config.yaml) before the next one is
+   counted, so a crashed or interrupted run resumes with the chunks that
+   are still missing.
+4. Utterances are stitched back in order: each chunk keeps the ones that
+   start inside its own span, speakers are matched across chunks by how
+   much they overlap in the padding, and a turn split by a boundary is
+   joined again. Word timestamps tell which of its words the previous
+   chunk already heard; those are dropped.
+
+Backends turn one audio file into a raw result. GladiaBackend talks to
+the Gladia v2 API with urllib; its base URL can point at a local stub
+server.
+
+The extracted audio and the raw results are kept in the content-addressed
+transcription cache (see transcription_cache.py): transcribing the same
+recording again only re-stitches the cached results.
+"""
+
+import json
+import mimetypes
+import os
+import shutil
+import subprocess
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import metrics
+from config import CONFIG_DIR, load_config
+from fileio import atomic_open
+from transcription_cache import TranscriptionCache, fingerprint
+
+WORK_DIR = CONFIG_DIR / "transcription-work"
+ENV_FILE = CONFIG_DIR / "gladia.env"
+
+# Defaults for the transcription: section of config.yaml
+DEFAULT_CHUNK_MINUTES = 10
+DEFAULT_OVERLAP_SECONDS = 15
+DEFAULT_WORKERS = 3
+DEFAULT_BACKEND = "gladia"
+
+GLADIA_BASE_URL = "https://api.gladia.io"
+
+# Bump when the chunk files or the plan change meaning
+PLAN_VERSION = 2
+
+
+class TranscriptionError(Exception):
+    """A recording could not be transcribed."""
+
+
+def read_env_file(path=ENV_FILE):
+    """Return the KEY=VALUE pairs of an env file (empty if missing)."""
+    values = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                key = key.strip()
+                if key.startswith("export "):
+                    key = key[len("export "):].strip()
+                values[key] = value.strip().strip("'\"")
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def run(command):
+    """Run a command without a shell, raising TranscriptionError on failure."""
+    metrics.count("subprocesses")
+    try:
+        return subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    except FileNotFoundError:
+        raise TranscriptionError(f"{command[0]} not found (install ffmpeg)") from None
+    except subprocess.CalledProcessError as e:
+        raise TranscriptionError(f"{command[0]} failed: {e.stderr.strip()}") from None
+
+
+def probe_duration(path):
+    """Return the duration of a media file in seconds."""
+    output = run(["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                  "-of", "default=noprint_wrappers=1:nokey=1", str(path)])
+    try:
+        return float(output.strip())
+    except ValueError:
+        raise TranscriptionError(f"could not read the duration of {path}") from None
+
+
+def extract_audio(video, dest):
+    """Extract the audio track of video to dest as mp3."""
+    tmp = dest.with_name(dest.name + ".part.mp3")
+    run(["ffmpeg", "-i", str(video), "-vn", "-acodec", "libmp3lame", "-q:a", "4",
+         str(tmp), "-y", "-loglevel", "error"])
+    os.replace(tmp, dest)
+
+
+def cut_audio(audio, dest, start, end):
+    """Copy the [start, end) seconds of an mp3 to dest, without re-encoding."""
+    tmp = dest.with_name(dest.name + ".part.mp3")
+    run(["ffmpeg", "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", str(audio),
+         "-c", "copy", str(tmp), "-y", "-loglevel", "error"])
+    os.replace(tmp, dest)
+
+
+def plan_chunks(duration, chunk_seconds, overlap_seconds):
+    """
+    Split duration into chunks.
+
+    Returns a list of dicts with the chunk 'index', the span it owns
+    ('own_start', 'own_end') and the padded span that is transcribed
+    ('start', 'end'), all in seconds.
+    """
+    chunks = []
+    own_start = 0.0
+    while own_start < duration or not chunks:
+        own_end = min(duration, own_start + chunk_seconds)
+        # A short tail is folded into the last chunk
+        if duration - own_end < overlap_seconds:
+            own_end = duration
+        chunks.append({
+            'index': len(chunks),
+            'own_start': own_start,
+            'own_end': own_end,
+            'start': max(0.0, own_start - overlap_seconds),
+            'end': min(duration, own_end + overlap_seconds),
+        })
+        own_start = own_end
+    return chunks
+
+
+def words_from_utterance(item):
+    """Return [{'start', 'end', 'word'}] from the words of a Gladia utterance."""
+    words = []
+    for word in item.get("words") or ():
+        text = (word.get("word") or "").strip()
+        if text:
+            words.append({'start': float(word.get("start") or 0), 'end': float(word.get("end") or 0),
+                          'word': text})
+    return words
+
+
+def utterances_from_result(result):
+    """
+    Return [{'speaker', 'start', 'end', 'text', 'words'}] from a Gladia
+    result; 'words' is empty if the result has no word timestamps.
+
+    Without diarization the full transcript is returned as a single
+    utterance with speaker None.
+    """
+    transcription = (result.get("result") or {}).get("transcription") or {}
+    utterances = []
+    for item in transcription.get("utterances") or ():
+        text = (item.get("text") or "").strip()
+        if text:
+            utterances.append({'speaker': item.get("speaker"), 'start': float(item.get("start") or 0),
+                               'end': float(item.get("end") or 0), 'text': text,
+                               'words': words_from_utterance(item)})
+    if not utterances and (transcription.get("full_transcript") or "").strip():
+        utterances.append({'speaker': None, 'start': 0.0, 'end': 0.0,
+                           'text': transcription["full_transcript"].strip(), 'words': []})
+    return utterances
+
+
+class GladiaBackend:
+    """Transcribes audio files with the Gladia v2 API (upload, transcribe, poll)."""
+
+    name = "gladia"
+
+    def __init__(self, api_key, base_url=GLADIA_BASE_URL, poll_interval=5, timeout=3600, retries=3):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.retries = retries
+
+    @classmethod
+    def from_config(cls):
+        """Create the backend from gladia.env, the environment and config.yaml."""
+        env = read_env_file()
+        api_key = os.environ.get("GLADIA_API_KEY") or env.get("GLADIA_API_KEY")
+        if not api_key:
+            raise TranscriptionError(f"GLADIA_API_KEY is not set (create {ENV_FILE})")
+        config = load_config()
+        base_url = (os.environ.get("GLADIA_BASE_URL") or env.get("GLADIA_BASE_URL")
+                    or config.transcription("base_url", GLADIA_BASE_URL))
+        return cls(api_key, base_url, poll_interval=float(config.transcription("poll_seconds", 5)))
+
+    def _request(self, url, data=None, headers=None):
+        """Send a request and return the decoded JSON, retrying server errors."""
+        headers = dict(headers or {}, **{"x-gladia-key": self.api_key, "Accept": "application/json"})
+        for attempt in range(self.retries):
+            request = urllib.request.Request(url, data=data, headers=headers,
+                                             method="POST" if data is not None else "GET")
+            try:
+                with urllib.request.urlopen(request, timeout=300) as response:
+                    return json.load(response)
+            except urllib.error.HTTPError as e:
+                if e.code < 500 or attempt == self.retries - 1:
+                    body = e.read().decode("utf-8", "replace")[:500]
+                    raise TranscriptionError(f"Gladia returned HTTP {e.code}: {body}") from None
+            except (urllib.error.URLError, TimeoutError) as e:
+                if attempt == self.retries - 1:
+                    raise TranscriptionError(f"Gladia request failed: {e}") from None
+            time.sleep(2 ** attempt)
+
+    def upload(self, audio_path):
+        """Upload an audio file and return its audio_url."""
+        boundary = uuid.uuid4().hex
+        content_type = mimetypes.guess_type(audio_path.name)[0] or "application/octet-stream"
+        body = (f"--{boundary}\r\nContent-Disposition: form-data; name=\"audio\"; "
+                f"filename=\"{audio_path.name}\"\r\nContent-Type: {content_type}\r\n\r\n").encode()
+        body += audio_path.read_bytes() + f"\r\n--{boundary}--\r\n".encode()
+        response = self._request(f"{self.base_url}/v2/upload", body,
+                                 {"Content-Type": f"multipart/form-data; boundary={boundary}"})
+        if not response.get("audio_url"):
+            raise TranscriptionError(f"upload failed: {response}")
+        return response["audio_url"]
+
+    def transcribe(self, audio_path):
+        """Return the raw Gladia result for an audio file."""
+        audio_url = self.upload(audio_path)
+        job = self._request(f"{self.base_url}/v2/transcription",
+                            json.dumps({"audio_url": audio_url, "diarization": True}).encode(),
+                            {"Content-Type": "application/json"})
+        if not job.get("result_url"):
+            raise TranscriptionError(f"could not start the transcription: {job}")
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            result = self._request(job["result_url"])
+            status = result.get("status")
+            if status == "done":
+                return result
+            if status == "error":
+                raise TranscriptionError(f"transcription failed: {result.get('error_code') or result}")
+            if time.monotonic() > deadline:
+                raise TranscriptionError("timed out waiting for the transcription")
+            time.sleep(self.poll_interval)
+
+
+# Backends by name; each needs from_config() and transcribe(path) -> result
+BACKENDS = {
+    GladiaBackend.name: GladiaBackend,
+}
+
+
+def get_backend(name=None):
+    """Return a backend instance by name (default: transcription.backend)."""
+    name = name or load_config().transcription("backend", DEFAULT_BACKEND)
+    if name not in BACKENDS:
+        raise TranscriptionError(f"unknown transcription backend '{name}' "
+                                 f"(available: {', '.join(sorted(BACKENDS))})")
+    return BACKENDS[name].from_config()
+
+
+def write_json(path, data):
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def load_plan(work_dir, settings):
+    """Return the saved plan if it was made with the same settings."""
+    try:
+        with open(work_dir / "plan.json", encoding="utf-8") as f:
+            plan = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if plan.get('version') != PLAN_VERSION or plan.get('settings') != settings:
+        return None
+    return plan
+
+
+def transcribe_chunk(backend, audio, work_dir, chunk):
+    """Cut, transcribe and checkpoint one chunk. Returns its raw result."""
+    index = chunk['index']
+    chunk_audio = work_dir / f"chunk-{index:03d}.mp3"
+    if not chunk_audio.exists():
+        cut_audio(audio, chunk_audio, chunk['start'], chunk['end'])
+    result = backend.transcribe(chunk_audio)
+    write_json(work_dir / f"chunk-{index:03d}.json", {'chunk': chunk, 'result': result})
+    chunk_audio.unlink(missing_ok=True)
+    return result
+
+
+def load_checkpoint(work_dir, chunk):
+    """Return the saved result of a chunk, or None if it isn't done."""
+    try:
+        with open(work_dir / f"chunk-{chunk['index']:03d}.json", encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return saved.get('result') if saved.get('chunk') == chunk else None
+
+
+def _overlap(a, b):
+    return max(0.0, min(a['end'], b['end']) - max(a['start'], b['start']))
+
+
+def match_speakers(previous, current, next_id):
+    """
+    Map the speakers of a chunk to global speaker ids.
+
+    previous holds the already mapped utterances of the chunk before,
+    current the chunk's own utterances (absolute times). Each speaker takes
+    the global id it overlaps most with in the shared padding; the others
+    get new ids from next_id. Returns (mapping, next_id).
+    """
+    shared = defaultdict(float)
+    for utterance in current:
+        for earlier in previous:
+            seconds = _overlap(utterance, earlier)
+            if seconds and utterance['speaker'] is not None:
+                shared[(utterance['speaker'], earlier['speaker'])] += seconds
+
+    mapping, taken = {}, set()
+    for (speaker, global_id), _ in sorted(shared.items(), key=lambda item: -item[1]):
+        if speaker not in mapping and global_id not in taken:
+            mapping[speaker] = global_id
+            taken.add(global_id)
+    for speaker in sorted({u['speaker'] for u in current if u['speaker'] is not None}):
+        if speaker not in mapping:
+            mapping[speaker] = next_id
+            next_id += 1
+    return mapping, next_id
+
+
+def shift(utterance, offset):
+    """Return a copy of an utterance with its times moved by offset seconds."""
+    words = [dict(w, start=w['start'] + offset, end=w['end'] + offset) for w in utterance['words']]
+    return dict(utterance, start=utterance['start'] + offset, end=utterance['end'] + offset, words=words)
+
+
+def unheard_text(utterance, heard_until):
+    """
+    The text of an utterance without its leading words that start before
+    heard_until (already transcribed by the previous chunk). Without word
+    timestamps the whole text is kept.
+    """
+    words = utterance['words']
+    if not words:
+        return utterance['text']
+    skip = 0
+    while skip < len(words) and words[skip]['start'] < heard_until:
+        skip += 1
+    return " ".join(w['word'] for w in words[skip:])
+
+
+def stitch(chunks, results):
+    """
+    Merge the utterances of every chunk into one ordered transcript of
+    {'speaker', 'start', 'end', 'text'} dicts.
+
+    results[i] holds the raw backend result of chunks[i], whose times are
+    relative to the chunk's padded start.
+    """
+    stitched = []
+    previous = []
+    next_id = 0
+    for chunk, result in zip(chunks, results):
+        current = sorted((shift(u, chunk['start']) for u in utterances_from_result(result)),
+                         key=lambda u: u['start'])
+        mapping, next_id = match_speakers(previous, current, next_id)
+        for utterance in current:
+            utterance['speaker'] = mapping.get(utterance['speaker'])
+        previous = current
+
+        last_chunk = chunk is chunks[-1]
+        for utterance in current:
+            if not (chunk['own_start'] <= utterance['start'] < chunk['own_end'] or
+                    (last_chunk and utterance['start'] >= chunk['own_end'])):
+                continue
+            crosses = stitched and stitched[-1]['chunk'] != chunk['index']
+            if crosses and utterance['end'] <= stitched[-1]['end']:
+                # Already heard whole by the previous chunk
+                continue
+            if crosses and stitched[-1]['speaker'] == utterance['speaker']:
+                # A turn split by the chunk boundary; its first words may
+                # be in both chunks
+                text = unheard_text(utterance, stitched[-1]['end'])
+                if text:
+                    stitched[-1]['text'] += " " + text
+                stitched[-1]['end'] = utterance['end']
+                stitched[-1]['chunk'] = chunk['index']
+                continue
+            stitched.append(dict(utterance, chunk=chunk['index']))
+
+    for utterance in stitched:
+        del utterance['chunk'], utterance['words']
+    return stitched
+
+
+def transcribe_recording(video, backend=None, progress=print, keep_work=False, use_cache=True):
+    """
+    Transcribe a recording in parallel chunks, resuming from checkpoints.
+
+    A recording already in the transcription cache is not transcribed
+    again unless use_cache is False. Returns a dict with 'duration'
+    (seconds), 'chunks', 'resumed' (chunks loaded from checkpoints),
+    'cached' (whether the whole transcript came from the cache) and
+    'utterances' (see stitch).
+    """
+    config = load_config()
+    settings = {
+        'chunk_seconds': float(config.transcription("chunk_minutes", DEFAULT_CHUNK_MINUTES)) * 60,
+        'overlap_seconds': float(config.transcription("overlap_seconds", DEFAULT_OVERLAP_SECONDS)),
+    }
+    workers = max(1, int(config.transcription("workers", DEFAULT_WORKERS)))
+
+    key = fingerprint(video)
+    cache = TranscriptionCache.open()
+    if cache is not None and use_cache:
+        transcript = cache.load_transcript(key)
+        if transcript is not None:
+            progress("Transcripción en caché: no se vuelve a transcribir")
+            return {'duration': transcript['duration'], 'chunks': len(transcript['chunks']),
+                    'resumed': 0, 'cached': True,
+                    'utterances': stitch(transcript['chunks'], transcript['results'])}
+
+    work_dir = WORK_DIR / key
+    work_dir.mkdir(parents=True, exist_ok=True)
+    audio = cache.audio_path(key) if cache is not None else work_dir / "audio.mp3"
+
+    plan = load_plan(work_dir, settings)
+    if plan is None:
+        progress("Analizando video...")
+        duration = probe_duration(video)
+        chunks = plan_chunks(duration, settings['chunk_seconds'], settings['overlap_seconds'])
+        plan = {'version': PLAN_VERSION, 'settings': settings, 'duration': duration, 'chunks': chunks}
+        write_json(work_dir / "plan.json", plan)
+    chunks = plan['chunks']
+
+    results = [load_checkpoint(work_dir, chunk) for chunk in chunks]
+    pending = [chunk for chunk, result in zip(chunks, results) if result is None]
+    resumed = len(chunks) - len(pending)
+    if resumed:
+        progress(f"Reanudando: {resumed} de {len(chunks)} fragmento(s) ya transcritos")
+
+    if pending:
+        if audio.exists():
+            progress("Audio en caché: no se vuelve a extraer")
+        else:
+            progress("Extrayendo audio...")
+            extract_audio(video, audio)
+        # Only now: a run resumed from checkpoints needs no backend (nor API key)
+        backend = backend or get_backend()
+        progress(f"Transcribiendo {len(pending)} fragmento(s), {min(workers, len(pending))} a la vez...")
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {pool.submit(transcribe_chunk, backend, audio, work_dir, chunk): chunk
+                       for chunk in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                chunk = futures[future]
+                results[chunk['index']] = future.result()
+                progress(f"  Fragmento {chunk['index'] + 1}/{len(chunks)} listo ({done}/{len(pending)})")
+
+    if cache is not None:
+        cache.store_transcript(key, {'duration': plan['duration'], 'chunks': chunks, 'results': results})
+        cache.evict(keep=key)
+    if not keep_work:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {'duration': plan['duration'], 'chunks': len(chunks), 'resumed': resumed, 'cached': False,
+            'utterances': stitch(chunks, results)}
+
+
+def render_transcript(utterances):
+    """Render utterances as '**Speaker N:** text' paragraphs."""
+    return "\n\n".join(
+        f"**Speaker {u['speaker']}:** {u['text']}" if u['speaker'] is not None else u['text']
+        for u in utterances
+    )
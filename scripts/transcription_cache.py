@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for the transcription pipeline.
+
+Entries live in transcription-cache/ next to config.yaml, one directory per
+recording, named after a fingerprint of its content: the file size plus a
+blake2b hash of evenly spaced sample blocks. Renaming, moving or touching
+a recording keeps its entry; re-encoding it does not. Each entry holds the
+extracted audio (audio.mp3) and the raw backend results (transcript.json),
+so a repeat run only has to render the markdown.
+
+The directory mtime records the last use; once the cache grows past
+transcription.cache_max_mb, the least recently used entries are removed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+from config import CONFIG_DIR, load_config
+from fileio import atomic_open
+
+CACHE_DIR = CONFIG_DIR / "transcription-cache"
+
+DEFAULT_MAX_MB = 2048
+
+# Bump when the transcript.json layout changes
+TRANSCRIPT_VERSION = 1
+
+SAMPLE_BLOCKS = 16
+BLOCK_SIZE = 64 * 1024
+
+
+def fingerprint(path, blocks=SAMPLE_BLOCKS, block_size=BLOCK_SIZE):
+    """
+    Return a hex key for a file's content: its size plus a blake2b hash of
+    `blocks` sample blocks spread from the start to the end of the file
+    (the whole file when it is smaller than the samples).
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, 'rb') as f:
+        if size <= blocks * block_size:
+            digest.update(f.read())
+        else:
+            step = (size - block_size) // (blocks - 1)
+            for n in range(blocks):
+                f.seek(n * step)
+                digest.update(f.read(block_size))
+    return f"{digest.hexdigest()}-{size}"
+
+
+def _dir_size(path):
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+class TranscriptionCache:
+    """Extracted audio and raw transcripts, keyed by fingerprint()."""
+
+    def __init__(self, root=CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def open(cls):
+        """Return the cache configured in config.yaml, or None if it is disabled (cache_max_mb: 0)."""
+        max_mb = float(load_config().transcription("cache_max_mb", DEFAULT_MAX_MB))
+        if max_mb <= 0:
+            return None
+        return cls(CACHE_DIR, int(max_mb * 1024 * 1024))
+
+    def entry(self, key):
+        """Return the entry directory for key, created and marked as used."""
+        path = self.root / key
+        path.mkdir(parents=True, exist_ok=True)
+        os.utime(path)
+        return path
+
+    def audio_path(self, key):
+        """Where the extracted audio of key is (or will be) stored."""
+        return self.entry(key) / "audio.mp3"
+
+    def load_transcript(self, key):
+        """Return the cached transcript of key, or None."""
+        path = self.root / key / "transcript.json"
+        try:
+            with open(path, encoding="utf-8") as f:
+                transcript = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: ignoring unreadable cached transcript ({e})", file=sys.stderr)
+            return None
+        if transcript.get('version') != TRANSCRIPT_VERSION:
+            return None
+        os.utime(path.parent)
+        return transcript
+
+    def store_transcript(self, key, transcript):
+        """Save a transcript for key."""
+        with atomic_open(self.entry(key) / "transcript.json", "w", encoding="utf-8") as f:
+            json.dump(dict(transcript, version=TRANSCRIPT_VERSION), f, ensure_ascii=False)
+
+    def evict(self, keep=None):
+        """
+        Remove least recently used entries until the cache fits in
+        max_bytes. The entry for keep is never removed. Returns the number
+        of entries removed.
+        """
+        try:
+            entries = [(entry.stat().st_mtime, entry.name, _dir_size(entry.path))
+                       for entry in os.scandir(self.root) if entry.is_dir()]
+        except FileNotFoundError:
+            return 0
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, name, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(self.root / name, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Import triage for task-management plugin.
+
+Files dropped in import/ are filed into tasks/, ideas/, templates/,
+memories/ or bugs/ by their type: field. Only the frontmatter of each
+file is read (optionally on the scan worker pool), destination folders
+are resolved and created once, and each destination gets one batch of
+os.rename moves with collision-safe names (see archive.move_batch).
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+
+import metrics
+from archive import move_batch, plan_batch
+from config import format_link, load_config
+from frontmatter import read_frontmatter
+from task_index import map_files
+
+# Map type values to folder names
+TYPE_TO_FOLDER = {
+    "task": "tasks",
+    "idea": "ideas",
+    "template": "templates",
+    "memory": "memories",
+    "bug": "bugs",
+}
+
+# Order of the destination folders in reports
+REPORT_ORDER = ("tasks", "ideas", "bugs", "memories", "templates")
+
+
+def read_type(file_path):
+    """Return the type: value of a file's frontmatter, or None."""
+    frontmatter, _ = read_frontmatter(file_path)
+    for line in frontmatter or ():
+        if line.startswith('type:'):
+            return line.split(':', 1)[1].strip() or None
+    return None
+
+
+def list_imports(import_dir):
+    """Return the names of the .md files in import/, sorted."""
+    with os.scandir(import_dir) as entries:
+        names = sorted(entry.name for entry in entries
+                       if entry.name.endswith('.md') and entry.is_file())
+    metrics.count("files_scanned", len(names))
+    return names
+
+
+def plan_imports(import_dir, names):
+    """
+    Classify the files in import/ by their type: field.
+
+    Returns (moves, skipped): moves maps destination folder names to lists
+    of filenames; skipped lists {'file', 'type'} dicts for files with no
+    type or an unknown one.
+    """
+    config = load_config()
+    workers = config.scan_workers if len(names) >= config.parallel_threshold else 1
+    types = map_files(read_type, [(import_dir / name,) for name in names],
+                      workers, config.scan_processes)
+
+    moves = defaultdict(list)
+    skipped = []
+    for name, file_type in zip(names, types):
+        folder = TYPE_TO_FOLDER.get(file_type)
+        if folder is None:
+            skipped.append({'file': name, 'type': file_type})
+        else:
+            moves[folder].append(name)
+    return moves, skipped
+
+
+def triage_imports(dry_run=False):
+    """
+    Move the files in import/ to the folder for their type.
+
+    With dry_run, nothing is moved and the planned moves are returned,
+    with the names collisions would give them.
+    Returns None if import/ doesn't exist, otherwise a dict with:
+        moved:   {folder: [{'file', 'dest'}]}; dest differs from file when
+                 the name was already taken in the destination
+        skipped: [{'file', 'type'}] for files without a known type
+        dry_run: whether this was only a plan
+    """
+    config = load_config()
+    import_dir = config.folder("import")
+    if not import_dir.exists():
+        return None
+
+    moves, skipped = plan_imports(import_dir, list_imports(import_dir))
+
+    moved = {}
+    for folder in REPORT_ORDER:
+        names = moves.get(folder)
+        if not names:
+            continue
+        dest_dir = config.folder(folder)
+        if dry_run:
+            moved[folder] = [
+                {'file': name, 'dest': dest_name}
+                for name, dest_name in plan_batch(names, dest_dir)
+            ]
+            continue
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        moved[folder] = [
+            {'file': name, 'dest': dest_name}
+            for name, dest_name in move_batch(import_dir, names, dest_dir)
+        ]
+
+    return {'moved': moved, 'skipped': skipped, 'dry_run': dry_run}
+
+
+def print_report(result):
+    """Print the result of triage_imports()."""
+    if result is None:
+        print("Import folder does not exist.")
+        return
+
+    moved = result['moved']
+    skipped = result['skipped']
+    total_moved = sum(len(items) for items in moved.values())
+
+    if not total_moved and not skipped:
+        print("No files in import/ folder.")
+        return
+
+    if total_moved > 0:
+        verb = "Would move" if result['dry_run'] else "Moved"
+        print(f"{verb} {total_moved} file(s) from import/:\n")
+
+        for folder_name, items in moved.items():
+            print(f"{folder_name}/ ({len(items)} file{'s' if len(items) != 1 else ''}):")
+            for item in items:
+                link = format_link(Path(item['dest']).stem, folder_name)
+                if item['dest'] != item['file']:
+                    link += f" (renamed from {item['file']}, name already taken)"
+                print(f"  - {link}")
+            print()
+
+    if skipped:
+        print(f"Skipped {len(skipped)} file(s) (no type field or unknown type):")
+        for item in skipped:
+            note = f" (unknown type: {item['type']})" if item['type'] else ""
+            print(f"  - {item['file']}{note}")
+        print()
+
+    if result['dry_run']:
+        print("Dry run: no files were moved.")
+    elif total_moved > 0:
+        print("Import cleanup complete!")
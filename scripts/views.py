@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Daily views for task-management plugin.
+
+today.md, this-week.md and next-week.md are presets over the agenda
+engine in agenda.py; status.json is a compact machine-readable summary of
+the same data. Renderers return the file content and a summary of counts;
+writing the files is left to the caller.
+"""
+
+import json
+from datetime import datetime
+
+from agenda import (
+    collect_days,
+    format_date_header,
+    format_date_range,
+    get_overdue_tasks,
+    label,
+    render_days,
+    render_overdue,
+)
+from config import format_link
+from task_index import RESEARCH_TAGS
+
+# Items listed per section in status.json (counts are always complete)
+STATUS_LIMIT = 10
+
+
+def parse_day(date_str):
+    """Parse a YYYY-MM-DD string into a date."""
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+def get_tasks_for_date(index, date):
+    """Get all tasks with a specific due date, excluding research tasks."""
+    return [t.name for t in index.by_due(date) if not t.is_research]
+
+
+def get_research_tasks(index):
+    """Get all research tasks (research-review or research-summary-needed tags)."""
+    names = set()
+    for tag in RESEARCH_TAGS:
+        names.update(t.name for t in index.by_tag(tag, folder="tasks"))
+    return sorted(names)
+
+
+def get_in_progress_ideas(index):
+    """Get all ideas with status: in progress."""
+    return [t.name for t in index.by_status("in progress", folder="ideas")]
+
+
+def render_week_header(title_key, week_start, week_end):
+    """Render the frontmatter and title shared by the weekly views."""
+    week_range = format_date_range(parse_day(week_start), parse_day(week_end))
+    content = f"---\nweek_start: {week_start}\nweek_end: {week_end}\n---\n"
+    content += f"# {label(title_key)} - {label('week', range=week_range)}\n\n"
+    return content
+
+
+def render_today(index, dates):
+    """
+    Render today.md.
+
+    Returns (content, summary) with counts of 'overdue', 'due_today',
+    'research' tasks and in-progress 'ideas'.
+    """
+    today = dates['today']
+
+    overdue = get_overdue_tasks(index, today)
+    due_today = get_tasks_for_date(index, today)
+    research = get_research_tasks(index)
+    ideas = get_in_progress_ideas(index)
+
+    content = f"---\ndate: {today}\n---\n"
+    content += f"# {label('today')} - {format_date_header(parse_day(today))}\n\n"
+    content += render_overdue(overdue)
+
+    content += f"## {label('tasks')}\n"
+    for filename in due_today:
+        content += f"- [ ] {format_link(filename, 'tasks')}\n"
+    content += "\n"
+
+    if ideas:
+        content += f"## {label('ideas_in_progress')}\n"
+        for filename in ideas:
+            content += f"- {format_link(filename, 'ideas')}\n"
+        content += "\n"
+
+    if research:
+        content += f"## {label('research')}\n"
+        for filename in research:
+            content += f"- [ ] {format_link(filename, 'tasks')}\n"
+
+    summary = {
+        'overdue': len(overdue),
+        'due_today': len(due_today),
+        'research': len(research),
+        'ideas': len(ideas),
+    }
+    return content, summary
+
+
+def render_week(index, title_key, week_start, week_end, first_day, today):
+    """
+    Render a weekly view: overdue tasks, then one section per day with tasks
+    from first_day to week_end.
+
+    Returns (content, summary) with the number of 'tasks' and of 'days'
+    covered (0 if first_day is past week_end).
+    """
+    content = render_week_header(title_key, week_start, week_end)
+    content += render_overdue(get_overdue_tasks(index, today))
+
+    start = parse_day(first_day)
+    end = parse_day(week_end)
+    if start > end:
+        content += f"{label('no_days_left')}\n"
+        return content, {'tasks': 0, 'days': 0}
+
+    days_content, total = render_days(collect_days(index, start, end))
+    content += days_content
+    return content, {'tasks': total, 'days': (end - start).days + 1}
+
+
+def render_this_week(index, dates):
+    """Render this-week.md: from tomorrow to the end of the current week."""
+    return render_week(index, 'this_week', dates['this_week_start'], dates['this_week_end'],
+                       dates['tomorrow'], dates['today'])
+
+
+def render_next_week(index, dates):
+    """Render next-week.md: Monday to Sunday of next week."""
+    return render_week(index, 'next_week', dates['next_week_start'], dates['next_week_end'],
+                       dates['next_week_start'], dates['today'])
+
+
+def count_days(index, first_day, last_day):
+    """Return the number of task lines a week view shows from first_day to last_day."""
+    start, end = parse_day(first_day), parse_day(last_day)
+    if start > end:
+        return 0
+    return sum(len(entries) for _, entries in collect_days(index, start, end))
+
+
+def render_status(index, dates, limit=STATUS_LIMIT):
+    """
+    Render status.json: section counts, the first items of each list and
+    the active recurring tasks with their next due date.
+
+    Returns (content, summary) with the 'overdue', 'due_today',
+    'remaining_week', 'next_week' and 'recurring' counts.
+    """
+    today = dates['today']
+    overdue = get_overdue_tasks(index, today)
+    due_today = get_tasks_for_date(index, today)
+    remaining_week = count_days(index, dates['tomorrow'], dates['this_week_end'])
+    next_week = count_days(index, dates['next_week_start'], dates['next_week_end'])
+    recurring = index.recurring()
+    oldest_overdue = sorted(overdue, key=lambda item: (item[1], item[0]))
+
+    status = {
+        'date': today,
+        'date_header': format_date_header(parse_day(today)),
+        'today': {
+            'total': len(due_today),
+            'tasks': due_today[:limit],
+            'research': len(get_research_tasks(index)),
+            'ideas_in_progress': len(get_in_progress_ideas(index)),
+        },
+        'overdue': {
+            'total': len(overdue),
+            'items': [{'name': name, 'due': due} for name, due in oldest_overdue[:limit]],
+        },
+        'this_week': {
+            'start': dates['this_week_start'],
+            'end': dates['this_week_end'],
+            'remaining': remaining_week,
+        },
+        'next_week': {
+            'start': dates['next_week_start'],
+            'end': dates['next_week_end'],
+            'total': next_week,
+        },
+        'recurring': {
+            'total': len(recurring),
+            'items': [
+                {'name': t.name, 'recurrence': t.recurrence, 'next_due': t.due}
+                for t in sorted(recurring, key=lambda t: (t.due or '', t.name))
+            ],
+        },
+    }
+    content = json.dumps(status, ensure_ascii=False, indent=2) + "\n"
+    summary = {
+        'overdue': len(overdue),
+        'due_today': len(due_today),
+        'remaining_week': remaining_week,
+        'next_week': next_week,
+        'recurring': len(recurring),
+    }
+    return content, summary
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Keep today.md, this-week.md and next-week.md up to date while tasks change.
+
+Usage:
+    watch-views.py [--interval 1] [--debounce 2]
+
+Runs until interrupted (Ctrl+C), logging each regeneration.
+"""
+
+import argparse
+from datetime import datetime
+
+from watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, watch
+
+
+def log(message):
+    print(f"[{datetime.now():%H:%M:%S}] {message}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the daily views when task files change.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                        help=f"seconds between polls (default: {DEFAULT_INTERVAL:g})")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE,
+                        help="seconds without changes before views are updated "
+                             f"(default: {DEFAULT_DEBOUNCE:g})")
+    args = parser.parse_args()
+
+    try:
+        watch(args.interval, args.debounce, log)
+    except KeyboardInterrupt:
+        log("Stopped")
+
+
+if __name__ == "__main__":
+    main()
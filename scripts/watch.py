@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+View watcher for task-management plugin.
+
+Polls the task folders for changes and keeps today.md, this-week.md,
+next-week.md and status.json up to date. Each poll compares a snapshot of (mtime, size,
+inode) per file against the previous one, so only files that actually
+changed are parsed again. Bursts of changes (bulk imports, git pulls) are
+debounced into a single update, only the views a change can touch are
+re-rendered, and a view is only rewritten if its content changed.
+
+The watcher only refreshes views: it does not normalize dates, advance
+recurring tasks or archive anything, which is still the job of the daily
+pipeline (generate-daily-files.py).
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+
+from config import TASK_FOLDERS, load_config
+from dates import get_week_dates
+from fileio import write_if_changed
+from index_cache import IndexCache
+from task_index import RESEARCH_TAGS, TaskIndex, entry_stat_key, parse_task_file, scan_folder
+from views import render_next_week, render_status, render_this_week, render_today
+
+VIEWS = {
+    "today.md": render_today,
+    "this-week.md": render_this_week,
+    "next-week.md": render_next_week,
+    "status.json": render_status,
+}
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_DEBOUNCE = 2.0
+# Longest a continuous burst can delay an update
+MAX_DEBOUNCE_WAIT = 30.0
+
+
+def snapshot(folders=TASK_FOLDERS):
+    """Return {path: (folder, stat_key)} for every .md file in folders."""
+    files = {}
+    for folder in folders:
+        for entry in scan_folder(folder):
+            try:
+                files[entry.path] = (folder, entry_stat_key(entry))
+            except FileNotFoundError:
+                # Removed between the listing and the stat
+                continue
+    return files
+
+
+def diff_snapshots(old, new):
+    """
+    Compare two snapshots.
+
+    Returns (changed, deleted): changed is a list of (path, folder,
+    stat_key) for new or modified files, deleted a list of removed paths.
+    """
+    changed = [
+        (path, folder, stat_key)
+        for path, (folder, stat_key) in new.items()
+        if old.get(path) != (folder, stat_key)
+    ]
+    deleted = [path for path in old if path not in new]
+    return changed, deleted
+
+
+def affected_views(task, dates):
+    """Return the names of the views whose content depends on a task."""
+    if task is None:
+        return set()
+    if task.folder == "ideas":
+        return {"today.md", "status.json"} if task.status == "in progress" else set()
+    if task.folder != "tasks":
+        return set()
+
+    views = set()
+    if task.recurrence:
+        views.add("status.json")
+    if any(tag in RESEARCH_TAGS for tag in task.tags):
+        views.add("today.md")
+    due = task.due
+    if due:
+        # Overdue and due-today tasks are listed in every view
+        if due <= dates['today']:
+            views.update(VIEWS)
+        elif dates['tomorrow'] <= due <= dates['this_week_end']:
+            views.add("this-week.md")
+        elif dates['next_week_start'] <= due <= dates['next_week_end']:
+            views.add("next-week.md")
+    if views:
+        # status.json summarizes every view
+        views.add("status.json")
+    return views
+
+
+def apply_changes(index, changed, deleted, dates):
+    """
+    Update the index for changed and deleted files.
+
+    The on-disk index cache is updated too, so the next full run does not
+    parse these files again. Returns the set of views to re-render: those
+    affected by either the old or the new version of each file.
+    """
+    views = set()
+    cache_updates = []
+    for path, folder, stat_key in changed:
+        path = Path(path)
+        views |= affected_views(index.get(path), dates)
+        try:
+            task = parse_task_file(path, folder)
+        except FileNotFoundError:
+            # Removed again before we got to it; the next poll drops it
+            continue
+        index.add(task)
+        views |= affected_views(task, dates)
+        cache_updates.append((stat_key, task))
+
+    for path in deleted:
+        path = Path(path)
+        views |= affected_views(index.get(path), dates)
+        index.remove(path)
+
+    cache = IndexCache.open(load_config().tasks_root)
+    if cache is not None:
+        try:
+            cache.update(cache_updates, deleted=deleted)
+        finally:
+            cache.close()
+    return views
+
+
+def render_views(index, dates, names):
+    """
+    Render the named views into the tasks root.
+
+    Views whose content didn't change are left untouched. Returns the
+    names of the views actually written.
+    """
+    tasks_root = load_config().tasks_root
+    written = []
+    for name in VIEWS:
+        if name not in names:
+            continue
+        content, _ = VIEWS[name](index, dates)
+        if write_if_changed(tasks_root / name, content):
+            written.append(name)
+    return written
+
+
+def wait_for_quiet(files, interval, debounce):
+    """
+    Keep polling until no file has changed for debounce seconds.
+
+    Gives up waiting after MAX_DEBOUNCE_WAIT so a never-ending stream of
+    changes still produces updates. Returns the last snapshot.
+    """
+    started = last_change = time.monotonic()
+    while True:
+        now = time.monotonic()
+        if now - last_change >= debounce or now - started >= MAX_DEBOUNCE_WAIT:
+            return files
+        time.sleep(interval)
+        current = snapshot()
+        if current != files:
+            files = current
+            last_change = time.monotonic()
+
+
+def watch(interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE, log=print):
+    """
+    Watch the task folders and refresh the views until interrupted.
+
+    All views are rendered once at startup and again whenever the date
+    changes. log is called with a message for every update.
+    """
+    index = TaskIndex.build(TASK_FOLDERS)
+    files = snapshot()
+    today = datetime.now().date()
+    dates = get_week_dates(today)
+    updated = ", ".join(render_views(index, dates, VIEWS)) or "views up to date"
+    log(f"Watching {len(files)} file(s); {updated}")
+
+    while True:
+        time.sleep(interval)
+
+        now = datetime.now().date()
+        if now != today:
+            today = now
+            dates = get_week_dates(today)
+            updated = ", ".join(render_views(index, dates, VIEWS)) or "no views changed"
+            log(f"New day ({today}): {updated}")
+
+        current = snapshot()
+        if current == files:
+            continue
+        current = wait_for_quiet(current, interval, debounce)
+
+        changed, deleted = diff_snapshots(files, current)
+        files = current
+        views = apply_changes(index, changed, deleted, dates)
+        updated = ", ".join(render_views(index, dates, views)) or "no views changed"
+        log(f"{len(changed)} changed, {len(deleted)} deleted file(s): {updated}")
@@ -0,0 +1,22 @@
+"""
+Shared setup for the tests.
+
+The scripts are plain modules in scripts/, so that directory goes on
+sys.path. TASK_MANAGEMENT_CONFIG_DIR points at a throwaway config before
+config.py is first imported, so no test ever reads or writes the real
+~/.claude/task-management-config or vault.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+_config_dir = Path(tempfile.mkdtemp(prefix="task-management-tests-"))
+(_config_dir / "vault").mkdir()
+(_config_dir / "config.yaml").write_text(
+    f'paths:\n  tasks_root: "{_config_dir / "vault"}"\nlanguage: "es"\n', encoding="utf-8")
+os.environ["TASK_MANAGEMENT_CONFIG_DIR"] = str(_config_dir)
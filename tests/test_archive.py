@@ -0,0 +1,87 @@
+"""
+archive_completed_tasks(): the manifest must list every file that reached
+completed/, even when a move fails halfway through a batch.
+"""
+
+import os
+import shutil
+from datetime import date
+
+import pytest
+
+import archive
+from config import load_config
+from task_index import TaskIndex
+
+
+@pytest.fixture
+def vault():
+    config = load_config()
+    tasks_dir = config.folder("tasks")
+    completed_dir = config.folder("completed")
+    tasks_dir.mkdir(parents=True, exist_ok=True)
+    yield tasks_dir, completed_dir
+    shutil.rmtree(tasks_dir)
+    shutil.rmtree(completed_dir, ignore_errors=True)
+
+
+def write_task(tasks_dir, name, completed):
+    (tasks_dir / name).write_text(
+        f"---\ntype: task\nstatus: done\ncompleted: {completed}\n---\n\n# {name}\n",
+        encoding="utf-8")
+
+
+def test_archive_writes_manifest(vault):
+    tasks_dir, completed_dir = vault
+    write_task(tasks_dir, "a.md", "2026-09-01")
+    write_task(tasks_dir, "b.md", "2026-10-02")
+
+    result = archive.archive_completed_tasks(TaskIndex.build(("tasks",), use_cache=False),
+                                             today=date(2026, 10, 18))
+
+    assert sorted(item['dest'] for item in result['archived']) == ["2026/09/a.md", "2026/10/b.md"]
+    manifest = list(archive.read_manifest(completed_dir))
+    assert sorted(entry['path'] for entry in manifest) == ["2026/09/a.md", "2026/10/b.md"]
+
+
+def test_failed_move_keeps_manifest_in_sync(vault, monkeypatch):
+    tasks_dir, completed_dir = vault
+    for name in ("a.md", "b.md", "c.md"):
+        write_task(tasks_dir, name, "2026-09-15")
+    write_task(tasks_dir, "d.md", "2026-08-15")
+
+    real_rename = os.rename
+    calls = []
+
+    def flaky_rename(src, dst, **kwargs):
+        calls.append(src)
+        if len(calls) == 3:
+            raise PermissionError(13, "Permission denied", src)
+        return real_rename(src, dst, **kwargs)
+
+    monkeypatch.setattr(os, "rename", flaky_rename)
+    with pytest.raises(PermissionError):
+        archive.archive_completed_tasks(TaskIndex.build(("tasks",), use_cache=False),
+                                        today=date(2026, 10, 18))
+
+    # The 2026/08 batch went through; the 2026/09 one stopped after one file
+    archived = sorted(path.relative_to(completed_dir).as_posix()
+                      for path in completed_dir.rglob("*.md"))
+    manifest = sorted(entry['path'] for entry in archive.read_manifest(completed_dir))
+    assert len(archived) == 2
+    assert manifest == archived
+
+
+def test_migration_plan_matches_the_real_run(vault):
+    _, completed_dir = vault
+    (completed_dir / "2026" / "09").mkdir(parents=True)
+    (completed_dir / "2026" / "09" / "informe.md").write_text("ya archivado\n", encoding="utf-8")
+    for name in ("informe.md", "otro.md"):
+        (completed_dir / name).write_text("---\ncompleted: 2026-09-10\n---\n", encoding="utf-8")
+
+    plan = archive.migrate_flat_archive(dry_run=True)
+    assert plan == [
+        {'file': "informe.md", 'dest': "2026/09/informe-1.md"},
+        {'file': "otro.md", 'dest': "2026/09/otro.md"},
+    ]
+    assert archive.migrate_flat_archive() == plan
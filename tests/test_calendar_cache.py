@@ -0,0 +1,113 @@
+"""
+Calendar cache: saved get_events responses through store, sync and stale,
+and the cached events merged into the Google Tasks views.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from calendar_cache import empty_cache, events_by_day, merge_changes, stale_ranges, store_events
+from dates import get_week_dates
+from gtasks import load_tasks, render_this_week, render_today
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "calendar"
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "calendar-cache.py"
+
+TODAY = date(2026, 10, 19)
+WEEK_END = date(2026, 10, 25)
+FETCHED = datetime(2026, 10, 19, 8, 0)
+TTL = timedelta(minutes=60)
+
+
+def fixture(name):
+    with open(FIXTURES / name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def cache():
+    cache = empty_cache()
+    store_events(cache, fixture("events.json"), TODAY, WEEK_END, now=FETCHED)
+    return cache
+
+
+def test_store_fills_every_day(cache):
+    assert sorted(cache['days']) == [str(TODAY + timedelta(days=n)) for n in range(7)]
+    assert cache['sync_token'] == "CPDAlvWDx4ADEPDAlvWDx4ADGAU="
+    days = events_by_day(cache, TODAY, WEEK_END)
+    assert days == {
+        date(2026, 10, 19): ["- 09:00-10:00 - Weekly team sync"],
+        date(2026, 10, 21): ["- 14:00-15:00 - Client meeting"],
+        # All-day end dates are exclusive; the cancelled event is left out
+        date(2026, 10, 22): ["- 📌 Viaje Valencia"],
+        date(2026, 10, 23): ["- 📌 Viaje Valencia"],
+    }
+
+
+def test_stale_after_ttl(cache):
+    assert stale_ranges(cache, TODAY, WEEK_END, TTL, now=FETCHED + timedelta(minutes=59)) == []
+    assert stale_ranges(cache, TODAY, WEEK_END + timedelta(days=2), TTL,
+                        now=FETCHED + timedelta(minutes=30)) == [(date(2026, 10, 26), date(2026, 10, 27))]
+    assert stale_ranges(cache, TODAY, WEEK_END, TTL, now=FETCHED + TTL) == [(TODAY, WEEK_END)]
+
+
+def test_stale_splits_around_fresh_days(cache):
+    store_events(cache, [], date(2026, 10, 21), date(2026, 10, 22), now=FETCHED + timedelta(hours=2))
+    assert stale_ranges(cache, TODAY, WEEK_END, TTL, now=FETCHED + timedelta(hours=2, minutes=5)) == [
+        (TODAY, date(2026, 10, 20)), (date(2026, 10, 23), WEEK_END)]
+
+
+def test_sync_merges_changes(cache):
+    synced = FETCHED + timedelta(hours=3)
+    assert merge_changes(cache, fixture("changes.json"), now=synced) == (2, 1)
+    assert cache['sync_token'] == "CKjKyvWDx4ADEKjKyvWDx4ADGAU="
+    assert stale_ranges(cache, TODAY, WEEK_END, TTL, now=synced + timedelta(minutes=1)) == []
+
+    days = events_by_day(cache, TODAY, WEEK_END)
+    assert days[date(2026, 10, 19)] == ["- 09:30-10:30 - Weekly team sync"]
+    assert days[date(2026, 10, 20)] == ["- 16:00-17:00 - Sprint review"]
+    # The cancelled meeting is gone from its day
+    assert date(2026, 10, 21) not in days
+
+
+GOOGLE_TASKS = [("Personal", [
+    {"title": "[Babe] Revisar presupuesto", "due": "2026-10-19T00:00:00.000Z", "status": "needsAction"},
+    {"title": "[Babe] Cerrar requisitos", "due": "2026-10-22T00:00:00.000Z", "status": "needsAction"},
+])]
+
+
+def test_events_merged_into_today(cache):
+    tasks = load_tasks(GOOGLE_TASKS, [])
+    content, _ = render_today(tasks, get_week_dates(TODAY), ["Personal"],
+                              events_by_day(cache, TODAY, WEEK_END))
+    assert ("# Hoy - Lunes, 19 de octubre\n\n"
+            "## Calendario\n- 09:00-10:00 - Weekly team sync\n\n"
+            "## Personal\n### Babe\n- [ ] Revisar presupuesto\n") in content
+
+
+def test_events_merged_into_week(cache):
+    tasks = load_tasks(GOOGLE_TASKS, [])
+    content, summary = render_this_week(tasks, get_week_dates(TODAY), ["Personal"],
+                                        events_by_day(cache, TODAY, WEEK_END))
+    # A day with events only gets no Tareas heading
+    assert "## Miércoles, 21 de octubre\n### Calendario\n- 14:00-15:00 - Client meeting\n\n## Jueves" in content
+    assert ("## Jueves, 22 de octubre\n### Calendario\n- 📌 Viaje Valencia\n\n"
+            "### Tareas\n- [ ] [Babe] Cerrar requisitos\n") in content
+    assert "## Viernes, 23 de octubre\n### Calendario\n- 📌 Viaje Valencia\n" in content
+    assert summary == {'tasks': 1, 'days': 1}
+
+
+def test_stale_json_uses_local_offset():
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--today", "2026-10-19", "stale", "--json"],
+        capture_output=True, text=True, check=True, env={**os.environ, "TZ": "Europe/Madrid"})
+    ranges = json.loads(result.stdout)['ranges']
+    assert ranges[0]['time_min'] == "2026-10-19T00:00:00+02:00"
+    assert all(re.match(r"^\d{4}-\d{2}-\d{2}T00:00:00[+-]\d{2}:\d{2}$", r['time_max']) for r in ranges)
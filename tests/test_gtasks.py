@@ -0,0 +1,91 @@
+"""
+Google Tasks views rendered from saved list_tasks responses.
+"""
+
+import json
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+import yaml
+
+from config import Config, load_config
+from dates import get_week_dates
+from gtasks import area_order, load_tasks, render_status, render_today
+from task_index import TaskIndex
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "config" / "config.template.yaml"
+
+LISTS = [
+    {"id": "work-id", "name": "Profesional", "area": "Trabajo"},
+    {"id": "home-id", "name": "Personal", "area": "Personal"},
+]
+
+RESPONSES = [
+    ("work-id", {"items": [
+        {"title": "[Babe] Revisar presupuesto", "due": "2026-10-16T00:00:00.000Z", "status": "needsAction"},
+        {"title": "Enviar factura", "due": "2026-10-14T00:00:00.000Z", "status": "needsAction",
+         "notes": "#esperando: datos de Marta"},
+        {"title": "Ya hecha", "due": "2026-10-16T00:00:00.000Z", "status": "completed"},
+        {"title": "Sin fecha", "status": "needsAction"},
+    ]}),
+    ("home-id", [
+        {"title": "Comprar billete", "due": "2026-10-17T00:00:00.000Z", "status": "needsAction"},
+        {"title": "Renovar seguro", "due": "2026-10-20T00:00:00.000Z", "status": "needsAction"},
+    ]),
+]
+
+
+@pytest.fixture
+def recurring():
+    tasks_dir = load_config().folder("tasks")
+    tasks_dir.mkdir(parents=True, exist_ok=True)
+    (tasks_dir / "kpi-ventas.md").write_text(
+        "---\ntype: task\ndue: 2026-10-23\nrecurrence: weekly\n---\n\n# KPI ventas\n", encoding="utf-8")
+    (tasks_dir / "trimestre-autonomos.md").write_text(
+        "---\ntype: task\ndue: 2026-10-20\nrecurrence: quarterly\n---\n", encoding="utf-8")
+    (tasks_dir / "una-vez.md").write_text("---\ntype: task\ndue: 2026-10-18\n---\n", encoding="utf-8")
+    yield TaskIndex.build(("tasks",), use_cache=False).recurring()
+    shutil.rmtree(tasks_dir)
+
+
+def test_status_json(recurring):
+    tasks = load_tasks(RESPONSES, LISTS)
+    content, summary = render_status(tasks, get_week_dates(date(2026, 10, 16)), recurring)
+    status = json.loads(content)
+
+    assert status["date"] == "2026-10-16"
+    assert status["today"] == {"total": 1, "tasks": ["[Babe] Revisar presupuesto"]}
+    assert status["overdue"] == {"total": 1, "items": [{"name": "Enviar factura", "due": "2026-10-14"}]}
+    assert status["this_week"]["remaining"] == 1
+    assert status["next_week"]["total"] == 1
+    assert status["recurring"] == {"total": 2, "items": [
+        {"name": "trimestre-autonomos", "recurrence": "quarterly", "next_due": "2026-10-20"},
+        {"name": "kpi-ventas", "recurrence": "weekly", "next_due": "2026-10-23"},
+    ]}
+    assert summary == {"overdue": 1, "due_today": 1, "remaining_week": 1, "next_week": 1, "recurring": 2}
+
+
+def test_today_uses_configured_areas():
+    tasks = load_tasks(RESPONSES, LISTS)
+    content, _ = render_today(tasks, get_week_dates(date(2026, 10, 16)), area_order(LISTS, tasks))
+
+    assert "## Trabajo\n### Babe\n- [ ] Revisar presupuesto\n" in content
+    assert "## Atrasadas\n### General\n- [ ] Enviar factura (espera: datos de Marta) (atrasada 2d)\n" in content
+
+
+def test_template_lists_map_to_areas():
+    with open(TEMPLATE, encoding="utf-8") as f:
+        lists = Config(yaml.safe_load(f)).google_task_lists
+    responses = [(key, [{"title": key, "due": "2026-10-16T00:00:00.000Z"}])
+                 for key in ("Wk1leGlhdy1kdm1kSVRuaA", "Profesional", "Personal", "UUMwNExCdFd3N0o0bE9kWA")]
+
+    tasks = load_tasks(responses, lists)
+    assert [task.area for task in tasks] == ["Trabajo", "Trabajo", "Personal", "Inbox"]
+    assert area_order(lists, tasks) == ["Trabajo", "Personal", "Inbox"]
+
+
+def test_unknown_lists_use_their_key():
+    tasks = load_tasks([("Cloud District", [{"title": "x", "due": "2026-10-16T00:00:00.000Z"}])], [])
+    assert tasks[0].area == "Cloud District"
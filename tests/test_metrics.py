@@ -0,0 +1,26 @@
+"""
+--stats-json without a FILE: stdout must hold nothing but the JSON.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+@pytest.mark.parametrize("command", [
+    ["generate-daily-files.py"],
+    ["search-vault.py", "presupuesto"],
+])
+def test_stats_json_to_stdout_is_parseable(command):
+    result = subprocess.run([sys.executable, str(SCRIPTS / command[0]), *command[1:], "--stats-json"],
+                            capture_output=True, text=True, check=True)
+    document = json.loads(result.stdout)
+    assert document["command"] == command[0][:-3]
+    assert document["stages"]
+    # The progress output is still shown, on stderr
+    assert result.stderr.strip()
@@ -0,0 +1,48 @@
+"""
+run_query(): filters answered from the index must agree with the same
+filters checked task by task with matches().
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from query import matches, parse_filter, run_query
+from task_index import Task, TaskIndex
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "query-tasks.py"
+
+STATUSES = ("in progress", "In Progress", "in-progress", "IN-PROGRESS", "noodling", None)
+
+
+@pytest.fixture
+def index():
+    return TaskIndex(
+        Task(Path(f"/vault/ideas/{i}.md"), "ideas", {"type": "idea", "status": status})
+        for i, status in enumerate(STATUSES)
+    )
+
+
+@pytest.mark.parametrize("text", [
+    "status=in progress", "status=in-progress", "status=In-Progress",
+    "status!=in progress", "status=Noodling", "status=none", "status=*",
+])
+def test_status_lookup_matches_scan(index, text):
+    field, op, value = parse_filter(text)
+    expected = [task.path for task in index if matches(task, field, op, value)]
+    assert [task.path for task in run_query(index, [(field, op, value)])] == sorted(expected)
+
+
+def test_status_ignores_case_and_dashes(index):
+    found = run_query(index, [parse_filter("status=in-progress")])
+    assert [task.status for task in found] == list(STATUSES[:4])
+
+
+@pytest.mark.parametrize("limit", ["0", "-2", "dos"])
+def test_limit_must_be_positive(limit):
+    result = subprocess.run([sys.executable, str(SCRIPT), "type=task", "--limit", limit],
+                            capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--limit" in result.stderr
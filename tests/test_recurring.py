@@ -0,0 +1,125 @@
+"""
+calculate_next_due() against the catch-up loop it replaced.
+
+reference_next_due() is the original implementation: advance one period
+at a time with relativedelta until the date passes today. The closed form
+must agree with it for every rule, including the month-end clamp that
+carries over to later months (Jan 31 -> Feb 28 -> Mar 28) and gaps longer
+than MAX_CLAMP_STEPS periods.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from hypothesis import given, settings, strategies as st
+
+from recurring import MAX_CLAMP_STEPS, calculate_next_due
+
+RECURRENCES = ("daily", "weekly", "biweekly", "monthly", "quarterly", "yearly", "unknown")
+
+
+def reference_next_due(current_due, recurrence, recurrence_day, today):
+    """The original loop, with today injected instead of datetime.now()."""
+    due_date = datetime.strptime(current_due, '%Y-%m-%d').date()
+
+    if recurrence == 'daily':
+        next_due = due_date + timedelta(days=1)
+    elif recurrence == 'weekly':
+        next_due = due_date + timedelta(weeks=1)
+    elif recurrence == 'biweekly':
+        next_due = due_date + timedelta(weeks=2)
+    elif recurrence == 'monthly':
+        next_due = due_date + relativedelta(months=1)
+        if recurrence_day:
+            try:
+                next_due = next_due.replace(day=int(recurrence_day))
+            except ValueError:
+                pass
+    elif recurrence == 'quarterly':
+        next_due = due_date + relativedelta(months=3)
+    elif recurrence == 'yearly':
+        next_due = due_date + relativedelta(years=1)
+    else:
+        next_due = due_date + timedelta(weeks=1)
+
+    while next_due <= today:
+        if recurrence == 'daily':
+            next_due += timedelta(days=1)
+        elif recurrence == 'weekly':
+            next_due += timedelta(weeks=1)
+        elif recurrence == 'biweekly':
+            next_due += timedelta(weeks=2)
+        elif recurrence == 'monthly':
+            next_due += relativedelta(months=1)
+        elif recurrence == 'quarterly':
+            next_due += relativedelta(months=3)
+        elif recurrence == 'yearly':
+            next_due += relativedelta(years=1)
+        else:
+            next_due += timedelta(weeks=1)
+
+    return next_due.strftime('%Y-%m-%d')
+
+
+def check(due, recurrence, recurrence_day, today):
+    expected = reference_next_due(str(due), recurrence, recurrence_day, today)
+    assert calculate_next_due(str(due), recurrence, recurrence_day, today) == expected
+
+
+@settings(max_examples=2000, deadline=None)
+@given(
+    due=st.dates(min_value=date(1990, 1, 1), max_value=date(2040, 12, 31)),
+    recurrence=st.sampled_from(RECURRENCES),
+    recurrence_day=st.one_of(st.none(), st.integers(1, 31), st.integers(1, 31).map(str)),
+    offset=st.integers(-400, 30 * 366),
+)
+def test_matches_reference_loop(due, recurrence, recurrence_day, offset):
+    check(due, recurrence, recurrence_day, due + timedelta(days=offset))
+
+
+def test_matches_reference_loop_seeded():
+    rng = random.Random(20261018)
+    for _ in range(5000):
+        due = date(2000, 1, 1) + timedelta(days=rng.randrange(365 * 30))
+        recurrence = rng.choice(RECURRENCES)
+        recurrence_day = rng.choice([None, rng.randint(1, 31)])
+        today = due + timedelta(days=rng.randrange(-60, 365 * 12))
+        check(due, recurrence, recurrence_day, today)
+
+
+@pytest.mark.parametrize("due, recurrence, recurrence_day, today", [
+    # Month-end clamp, and the clamped day carrying over
+    ("2026-01-31", "monthly", None, date(2026, 1, 31)),
+    ("2026-01-31", "monthly", None, date(2026, 3, 1)),
+    ("2026-01-31", "monthly", None, date(2026, 12, 15)),
+    ("2026-03-31", "quarterly", None, date(2026, 7, 1)),
+    ("2024-02-29", "yearly", None, date(2024, 3, 1)),
+    ("2024-02-29", "yearly", None, date(2031, 1, 1)),
+    # recurrence_day only applies to the first step
+    ("2026-01-15", "monthly", 31, date(2026, 1, 15)),
+    ("2026-01-15", "monthly", "31", date(2026, 6, 1)),
+    ("2026-01-15", "monthly", 30, date(2026, 5, 1)),
+])
+def test_month_end_cases(due, recurrence, recurrence_day, today):
+    check(due, recurrence, recurrence_day, today)
+
+
+@pytest.mark.parametrize("recurrence", ["monthly", "quarterly", "yearly"])
+@pytest.mark.parametrize("day", [28, 29, 30, 31])
+def test_clamp_beyond_max_clamp_steps(recurrence, day):
+    # Gaps of more periods than MAX_CLAMP_STEPS, starting from every month
+    for month in range(1, 13):
+        try:
+            due = date(2001, month, day)
+        except ValueError:
+            continue
+        months = {"monthly": 1, "quarterly": 3, "yearly": 12}[recurrence]
+        for extra in (-1, 0, 1, 2, 13):
+            today = due + relativedelta(months=months * (MAX_CLAMP_STEPS + extra))
+            check(due, recurrence, None, today)
+
+
+def test_dormant_daily_task_is_caught_up():
+    assert calculate_next_due("2016-03-01", "daily", today=date(2026, 10, 18)) == "2026-10-19"
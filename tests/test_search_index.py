@@ -0,0 +1,61 @@
+"""
+Search index: only titles, tags and the text after the frontmatter are
+searchable.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from search_index import SearchIndex
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "search-vault.py"
+
+
+@pytest.fixture
+def index(tmp_path):
+    tasks = tmp_path / "tasks"
+    tasks.mkdir()
+    (tasks / "presupuesto-rfid.md").write_text(
+        "---\ntype: task\nstatus: in progress\ndue: 2026-10-20\ntags: [cliente, babe]\n---\n\n"
+        "# Presupuesto RFID\n\nDecisión: pedir tres ofertas de etiquetas.\n", encoding="utf-8")
+    (tasks / "notas.md").write_text("Sin frontmatter: el cliente prefiere etiquetas UHF.\n",
+                                    encoding="utf-8")
+    index = SearchIndex.open(tmp_path)
+    index.update({"tasks": tasks})
+    yield index
+    index.close()
+
+
+def paths(results):
+    return sorted(result['path'] for result in results)
+
+
+def test_frontmatter_fields_are_not_indexed(index):
+    assert index.search("progress") == []
+    assert index.search("2026") == []
+    assert index.search("status") == []
+
+
+def test_body_and_tags_are_indexed(index):
+    assert paths(index.search("decision ofertas")) == ["tasks/presupuesto-rfid.md"]
+    assert paths(index.search("cliente")) == ["tasks/notas.md", "tasks/presupuesto-rfid.md"]
+    assert paths(index.search("babe")) == ["tasks/presupuesto-rfid.md"]
+    assert paths(index.search("frontmatter")) == ["tasks/notas.md"]
+
+
+def test_snippet_and_title_come_from_the_body(index):
+    [result] = index.search("ofertas")
+    assert result['title'] == "Presupuesto RFID"
+    assert "**ofertas**" in result['snippet']
+    assert "status" not in result['snippet']
+
+
+@pytest.mark.parametrize("limit", ["0", "-3", "diez"])
+def test_limit_must_be_positive(limit):
+    result = subprocess.run([sys.executable, str(SCRIPT), "rfid", "--limit", limit],
+                            capture_output=True, text=True)
+    assert result.returncode == 2
+    assert "--limit" in result.stderr
@@ -0,0 +1,201 @@
+"""
+Chunked transcription with a stub backend: a turn cut by a chunk boundary
+must come out once, without the words both chunks heard.
+
+ffmpeg is replaced by functions that write placeholder files, so the tests
+only exercise planning, checkpoints, stitching and, against a local stub
+server, the Gladia HTTP client.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import transcription
+
+DURATION = 1200.0  # two 10-minute chunks, padded by 15 s (see the defaults)
+
+
+def words(*timed):
+    return [{'word': f" {word}", 'start': start, 'end': start + 1.5, 'confidence': 0.9}
+            for word, start in timed]
+
+
+def utterance(speaker, timed):
+    items = words(*timed)
+    return {'speaker': speaker, 'start': items[0]['start'], 'end': items[-1]['end'],
+            'text': "".join(w['word'] for w in items).strip(), 'words': items}
+
+
+def result(*utterances):
+    return {'status': "done", 'result': {'transcription': {'utterances': list(utterances)}}}
+
+
+# Times are relative to each chunk's padded start: chunk 0 covers 0-615 s,
+# chunk 1 covers 585-1200 s and owns the turns starting from 600 s.
+# Speaker 0 talks from 595 s to 620 s; chunk 0 hears it until its end at
+# 615 s, chunk 1 hears it whole but splits it in two turns.
+CHUNK_RESULTS = {
+    "chunk-000.mp3": result(
+        utterance(1, [("Vale,", 580), ("empieza", 582), ("tú.", 584)]),
+        utterance(0, [("El", 595), ("presupuesto", 597), ("de", 599),
+                      ("RFID", 603), ("sube", 607), ("un", 610)]),
+    ),
+    "chunk-001.mp3": result(
+        utterance(3, [("tú.", 0)]),
+        utterance(2, [("El", 10), ("presupuesto", 12), ("de", 14)]),
+        utterance(2, [("RFID", 18), ("sube", 22), ("un", 25),
+                      ("diez", 28), ("por", 31), ("ciento.", 33)]),
+        utterance(3, [("¿Y", 40), ("el", 41), ("plazo?", 42)]),
+    ),
+}
+
+
+class StubBackend:
+    name = "stub"
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio_path):
+        self.calls.append(audio_path.name)
+        return CHUNK_RESULTS[audio_path.name]
+
+
+@pytest.fixture
+def no_ffmpeg(monkeypatch):
+    def write_placeholder(*args):
+        args[1].write_bytes(b"mp3")
+
+    monkeypatch.setattr(transcription, "probe_duration", lambda path: DURATION)
+    monkeypatch.setattr(transcription, "extract_audio", write_placeholder)
+    monkeypatch.setattr(transcription, "cut_audio", write_placeholder)
+
+
+def test_split_turn_is_joined_without_repeated_words(tmp_path, no_ffmpeg):
+    video = tmp_path / "reunion.mp4"
+    video.write_bytes(b"not really a video")
+    backend = StubBackend()
+
+    transcript = transcription.transcribe_recording(video, backend, progress=lambda message: None,
+                                                    use_cache=False)
+
+    assert transcript['chunks'] == 2
+    assert sorted(backend.calls) == ["chunk-000.mp3", "chunk-001.mp3"]
+    assert [(u['speaker'], u['text']) for u in transcript['utterances']] == [
+        (1, "Vale, empieza tú."),
+        (0, "El presupuesto de RFID sube un diez por ciento."),
+        (1, "¿Y el plazo?"),
+    ]
+
+
+def test_without_word_timestamps_text_is_kept():
+    chunks = transcription.plan_chunks(DURATION, 600, 15)
+    plain = [
+        result({'speaker': 0, 'start': 595, 'end': 612, 'text': "El presupuesto"}),
+        result({'speaker': 0, 'start': 16, 'end': 30, 'text': "sube un diez por ciento."}),
+    ]
+    assert transcription.stitch(chunks, plain) == [
+        {'speaker': 0, 'start': 595.0, 'end': 615.0, 'text': "El presupuesto sube un diez por ciento."},
+    ]
+
+
+class GladiaStub(BaseHTTPRequestHandler):
+    """
+    Local stand-in for the Gladia v2 API: upload, start a transcription,
+    then report 'processing' once before the result of CHUNK_RESULTS for
+    the uploaded file. The first upload fails with HTTP 503.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, data, code=200):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers["x-gladia-key"] != "test-key":
+            return self._send({"message": "invalid key"}, 401)
+        if self.path == "/v2/upload":
+            server.uploads += 1
+            if server.uploads == 1:
+                return self._send({"message": "try again"}, 503)
+            name = re.search(rb'filename="([^"]+)"', body).group(1).decode()
+            return self._send({"audio_url": f"https://stub/{name}"})
+        if self.path == "/v2/transcription":
+            job = json.loads(body)
+            assert job["diarization"] is True
+            name = job["audio_url"].rsplit("/", 1)[1]
+            server.polls[name] = 0
+            return self._send({"id": name, "result_url": f"{server.url}/v2/transcription/{name}"})
+        self._send({"message": "not found"}, 404)
+
+    def do_GET(self):
+        name = self.path.rsplit("/", 1)[1]
+        self.server.polls[name] += 1
+        if self.server.polls[name] < 2:
+            return self._send({"status": "processing"})
+        self._send(CHUNK_RESULTS[name])
+
+
+@pytest.fixture
+def gladia_stub(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GladiaStub)
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    server.uploads = 0
+    server.polls = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # No real waiting between retries and polls
+    monkeypatch.setattr(transcription.time, "sleep", lambda seconds: None)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_gladia_backend_against_stub_server(tmp_path, no_ffmpeg, gladia_stub, monkeypatch):
+    monkeypatch.setenv("GLADIA_API_KEY", "test-key")
+    monkeypatch.setenv("GLADIA_BASE_URL", gladia_stub.url)
+    video = tmp_path / "reunion.mp4"
+    video.write_bytes(b"recording for the stub server")
+
+    transcript = transcription.transcribe_recording(video, progress=lambda message: None,
+                                                    use_cache=False)
+
+    # One failed upload was retried; every chunk was polled until done
+    assert gladia_stub.uploads == 3
+    assert gladia_stub.polls == {"chunk-000.mp3": 2, "chunk-001.mp3": 2}
+    assert [u['text'] for u in transcript['utterances']] == [
+        "Vale, empieza tú.", "El presupuesto de RFID sube un diez por ciento.", "¿Y el plazo?"]
+
+
+def test_gladia_backend_reports_client_errors(tmp_path, gladia_stub):
+    backend = transcription.GladiaBackend("wrong-key", base_url=gladia_stub.url, poll_interval=0)
+    audio = tmp_path / "chunk-000.mp3"
+    audio.write_bytes(b"mp3")
+    with pytest.raises(transcription.TranscriptionError, match="HTTP 401"):
+        backend.transcribe(audio)
+
+
+def test_resumed_run_needs_no_backend(tmp_path, no_ffmpeg, monkeypatch):
+    video = tmp_path / "reunion.mp4"
+    video.write_bytes(b"recording resumed from checkpoints")
+    first = transcription.transcribe_recording(video, StubBackend(), progress=lambda message: None,
+                                               keep_work=True, use_cache=False)
+
+    # Every chunk is checkpointed: no API key, no backend
+    monkeypatch.delenv("GLADIA_API_KEY", raising=False)
+    resumed = transcription.transcribe_recording(video, progress=lambda message: None,
+                                                 use_cache=False)
+    assert resumed['resumed'] == 2
+    assert resumed['utterances'] == first['utterances']
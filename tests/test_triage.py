@@ -0,0 +1,45 @@
+"""
+Import triage: the dry-run plan must name every file as the real run will.
+"""
+
+import shutil
+
+import pytest
+
+from config import load_config
+from triage import triage_imports
+
+
+@pytest.fixture
+def vault():
+    config = load_config()
+    import_dir, tasks_dir, ideas_dir = (config.folder(name) for name in ("import", "tasks", "ideas"))
+    for directory in (import_dir, tasks_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+    yield import_dir, tasks_dir
+    for directory in (import_dir, tasks_dir, ideas_dir):
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_plan_matches_the_real_run(vault):
+    import_dir, tasks_dir = vault
+    for name in ("nota.md", "nota-1.md", "otra.md"):
+        (import_dir / name).write_text("---\ntype: task\n---\n", encoding="utf-8")
+    (import_dir / "idea.md").write_text("---\ntype: idea\n---\n", encoding="utf-8")
+    (import_dir / "suelta.md").write_text("sin frontmatter\n", encoding="utf-8")
+    (tasks_dir / "nota.md").write_text("ya existe\n", encoding="utf-8")
+
+    plan = triage_imports(dry_run=True)
+    # Nothing moved yet
+    assert len(list(import_dir.iterdir())) == 5
+    assert [path.name for path in tasks_dir.iterdir()] == ["nota.md"]
+    assert plan['moved']['tasks'] == [
+        {'file': "nota-1.md", 'dest': "nota-1.md"},
+        {'file': "nota.md", 'dest': "nota-2.md"},
+        {'file': "otra.md", 'dest': "otra.md"},
+    ]
+
+    result = triage_imports()
+    assert result['moved'] == plan['moved']
+    assert result['skipped'] == plan['skipped'] == [{'file': "suelta.md", 'type': None}]
+    assert sorted(path.name for path in tasks_dir.iterdir()) == ["nota-1.md", "nota-2.md", "nota.md", "otra.md"]